@@ -0,0 +1,94 @@
+"""Benchmark staged vs. fused claim extraction.
+
+Runs the same text through ClaimExtractionPipeline in "staged" mode (one LLM
+call per stage) and "fused" mode (one LLM call per sentence) and compares
+wall-clock latency, token usage and the resulting claims.
+
+Usage:
+    python examples/benchmark_modes.py [--model MODEL] [--runs N] [--text-file FILE]
+"""
+
+import argparse
+import os
+import time
+from pathlib import Path
+
+from dotenv import load_dotenv
+from langchain_core.callbacks import get_usage_metadata_callback
+
+from claimification.claim_extraction import ClaimExtractionPipeline
+
+
+SAMPLE_TEXT = """Several emerging markets are grappling with severe economic instability. For instance, Argentina's rampant inflation, with monthly rates reaching as high as 25.5%, has made many goods unobtainable and plunged the value of the currency, causing severe economic hardship. Some experts estimate that the annual inflation rate could potentially double to 300%, while others predict even higher rates.
+
+Nigeria, for example, is striving to become self-sufficient in wheat production but is hindered by climate change and violence, exacerbated by high grain prices due to the suspension of the Black Sea Grain Initiative.
+
+Climate change has played a pivotal role in creating food insecurity and economic instability in farming-dependent economies, such as Zambia and Mozambique."""
+
+
+def run_mode(mode: str, model: str, text: str, runs: int) -> dict:
+    """Run the pipeline in one mode and collect latency and token usage."""
+    pipeline = ClaimExtractionPipeline(model=model, mode=mode, verbose=False)
+
+    latencies = []
+    input_tokens = 0
+    output_tokens = 0
+    claims = 0
+
+    for _ in range(runs):
+        with get_usage_metadata_callback() as usage:
+            start = time.perf_counter()
+            result = pipeline.extract_claims(text)
+            latencies.append(time.perf_counter() - start)
+
+        for model_usage in usage.usage_metadata.values():
+            input_tokens += model_usage.get("input_tokens", 0)
+            output_tokens += model_usage.get("output_tokens", 0)
+        claims += len(result.get_all_claims())
+
+    return {
+        "mode": mode,
+        "mean_latency": sum(latencies) / runs,
+        "min_latency": min(latencies),
+        "input_tokens": input_tokens / runs,
+        "output_tokens": output_tokens / runs,
+        "claims": claims / runs,
+    }
+
+
+def main():
+    """Run the benchmark and print a comparison table."""
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Benchmark staged vs. fused mode")
+    parser.add_argument(
+        "--model",
+        default=os.getenv("CLAIMIFICATION_MODEL", "gpt-5-nano-2025-08-07")
+    )
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--text-file", type=Path)
+    args = parser.parse_args()
+
+    text = args.text_file.read_text(encoding="utf-8") if args.text_file else SAMPLE_TEXT
+
+    rows = [run_mode(mode, args.model, text, args.runs) for mode in ("staged", "fused")]
+
+    print(f"\nModel: {args.model}, runs per mode: {args.runs}\n")
+    print(f"{'mode':<8} {'mean s':>8} {'min s':>8} {'in tok':>9} {'out tok':>9} {'claims':>7}")
+    for row in rows:
+        print(
+            f"{row['mode']:<8} {row['mean_latency']:>8.2f} {row['min_latency']:>8.2f} "
+            f"{row['input_tokens']:>9.0f} {row['output_tokens']:>9.0f} {row['claims']:>7.1f}"
+        )
+
+    staged, fused = rows
+    if fused["mean_latency"] > 0:
+        print(f"\nSpeed-up: {staged['mean_latency'] / fused['mean_latency']:.2f}x")
+    total_staged = staged["input_tokens"] + staged["output_tokens"]
+    total_fused = fused["input_tokens"] + fused["output_tokens"]
+    if total_staged > 0:
+        print(f"Token reduction: {100 * (1 - total_fused / total_staged):.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 """Claim extraction pipeline - extract verifiable factual claims from text."""
 
 from claimification.claim_extraction.pipeline import ClaimExtractionPipeline
+from claimification.claim_extraction.checkpoint import CheckpointJournal
+from claimification.claim_extraction.streaming import ClaimStream
 from claimification.claim_extraction.models import (
     Claim,
     ClaimExtractionResult,
@@ -10,6 +12,8 @@ from claimification.claim_extraction.models import (
 
 __all__ = [
     "ClaimExtractionPipeline",
+    "CheckpointJournal",
+    "ClaimStream",
     "Claim",
     "ClaimExtractionResult",
     "PipelineResult",
@@ -0,0 +1,164 @@
+"""Append-only journal of finished sentence results.
+
+A long extraction keeps its results in memory until the end, so a crash,
+Ctrl-C or provider outage loses all finished work. A CheckpointJournal
+appends each ClaimExtractionResult to a JSONL file as soon as it is done.
+A later run on the same input resumes from the journal and only processes
+the sentences that are missing from it.
+
+The first line of the journal identifies the input (a hash of text and
+question) and the settings that shape the results, so a journal is never
+applied to a different document or pipeline configuration.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from .models import Claim, ClaimExtractionResult, SentenceStatus
+
+
+JOURNAL_VERSION = 1
+
+
+def input_hash(text: str, question: Optional[str] = None) -> str:
+    """Hash identifying the input of a run."""
+    payload = json.dumps({"text": text, "question": question}, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def result_to_dict(result: ClaimExtractionResult) -> Dict[str, Any]:
+    """Convert a sentence result to a JSON-serializable dict."""
+    return {
+        "source_sentence": result.source_sentence,
+        "sentence_id": result.sentence_id,
+        "status": result.status.value,
+        "claims": [
+            {"text": claim.text, "confidence": claim.confidence}
+            for claim in result.claims
+        ],
+        "metadata": result.metadata,
+    }
+
+
+def result_from_dict(data: Dict[str, Any]) -> ClaimExtractionResult:
+    """Rebuild a sentence result written by ``result_to_dict``."""
+    return ClaimExtractionResult(
+        source_sentence=data["source_sentence"],
+        sentence_id=data["sentence_id"],
+        status=SentenceStatus(data["status"]),
+        claims=[
+            Claim(
+                text=claim["text"],
+                source_sentence_id=data["sentence_id"],
+                confidence=claim.get("confidence")
+            )
+            for claim in data["claims"]
+        ],
+        metadata=data.get("metadata", {})
+    )
+
+
+class CheckpointJournal:
+    """JSONL journal that records sentence results as they finish.
+
+    Each record is appended and flushed in its own write, so everything
+    recorded before a crash survives it. A partially written last line is
+    ignored on resume.
+    """
+
+    def __init__(self, path: Union[str, Path], resume: bool = False):
+        """Initialize the journal.
+
+        Args:
+            path: JSONL file to write
+            resume: Continue from an existing journal at path instead of
+                starting a new one
+        """
+        self.path = Path(path)
+        self.resume = resume
+        self.resumed = 0
+        self.recorded = 0
+
+    def start(
+        self,
+        text: str,
+        question: Optional[str],
+        settings: Dict[str, Any]
+    ) -> Dict[str, ClaimExtractionResult]:
+        """Open the journal for a run.
+
+        Args:
+            text: The run's input text
+            question: The run's question
+            settings: Pipeline settings that shape the results
+
+        Returns:
+            Results already in the journal by sentence_id (empty unless
+            resuming); failed sentences are left out so they are retried
+
+        Raises:
+            ValueError: If the existing journal belongs to a different input
+                or settings
+        """
+        header = {
+            "type": "header",
+            "version": JOURNAL_VERSION,
+            "input_hash": input_hash(text, question),
+            "settings": settings,
+        }
+        if self.resume and self.path.exists():
+            completed = self._load(header)
+            self.resumed = len(completed)
+            return completed
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("w", encoding="utf-8") as f:
+            f.write(json.dumps(header, ensure_ascii=False) + "\n")
+        return {}
+
+    def record(self, result: ClaimExtractionResult) -> None:
+        """Append a finished sentence result."""
+        line = json.dumps(
+            {"type": "result", "result": result_to_dict(result)},
+            ensure_ascii=False,
+            default=str
+        )
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(line + "\n")
+        self.recorded += 1
+
+    def _load(self, header: Dict[str, Any]) -> Dict[str, ClaimExtractionResult]:
+        """Read the results of an existing journal after checking its header."""
+        content = self.path.read_text(encoding="utf-8")
+        lines = content.splitlines()
+        try:
+            existing = json.loads(lines[0]) if lines else None
+        except json.JSONDecodeError:
+            existing = None
+        if existing is None or existing.get("type") != "header":
+            raise ValueError(f"{self.path} is not a checkpoint journal")
+        if existing.get("input_hash") != header["input_hash"]:
+            raise ValueError(f"checkpoint {self.path} was written for a different input")
+        if existing.get("settings") != header["settings"]:
+            raise ValueError(
+                f"checkpoint {self.path} was written with different settings: "
+                f"{existing.get('settings')}"
+            )
+
+        completed: Dict[str, ClaimExtractionResult] = {}
+        for line in lines[1:]:
+            try:
+                result = result_from_dict(json.loads(line)["result"])
+            except (ValueError, KeyError, TypeError):
+                # Line cut short by a crash
+                continue
+            if result.status != SentenceStatus.PROCESSING_ERROR:
+                completed[result.sentence_id] = result
+
+        # Start new records on a fresh line after a partial last line
+        if content and not content.endswith("\n"):
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write("\n")
+        return completed
@@ -0,0 +1,304 @@
+"""Claim extraction over a corpus of documents in one process.
+
+Documents come from a directory, a glob pattern or a JSONL file (optionally
+gzip-compressed) and are processed by one pipeline, so interpreter start-up,
+LLM clients and rate limits are shared by all of them. Results are written
+as JSONL while the run progresses, one record per document or one per
+sentence. Documents that already have results in the output file are
+skipped, so an interrupted run continues where it stopped.
+"""
+
+import asyncio
+import glob
+import gzip
+import json
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Set, TextIO
+
+from ..utils.rate_limiter import rate_limiter_stats
+from ..utils.usage import sum_usage, usage_totals
+from .models import PipelineResult, SentenceStatus
+
+if TYPE_CHECKING:
+    from .pipeline import ClaimExtractionPipeline
+
+
+# File suffixes read as JSONL documents
+JSONL_SUFFIXES = (".jsonl", ".jsonl.gz", ".ndjson", ".ndjson.gz")
+
+# Documents processed at the same time
+DEFAULT_DOCUMENT_CONCURRENCY = 4
+
+# Document ID at the start of an output record
+_RECORD_ID = re.compile(r'\{"id": ("(?:[^"\\]|\\.)*")')
+
+# Called with (record, completed) after each document is written or skipped
+DocumentCallback = Callable[[Dict[str, Any], int], None]
+
+
+@dataclass
+class Document:
+    """One document of a corpus.
+
+    Attributes:
+        id: Identifier written with the document's results
+        text: The document text
+        question: Optional question for context
+        error: Why the document could not be read (it then gets an error
+            record instead of being processed)
+    """
+    id: str
+    text: str
+    question: Optional[str] = None
+    error: Optional[str] = None
+
+
+def _is_jsonl(source: str) -> bool:
+    return source.lower().endswith(JSONL_SUFFIXES)
+
+
+def _source_files(source: str) -> List[Path]:
+    """The files of a directory (recursively) or matched by a glob pattern."""
+    path = Path(source)
+    if path.is_dir():
+        files = [p for p in path.rglob("*") if p.is_file()]
+    elif path.is_file():
+        files = [path]
+    else:
+        files = [Path(p) for p in glob.glob(source, recursive=True) if Path(p).is_file()]
+    return sorted(files)
+
+
+def count_documents(source: str) -> Optional[int]:
+    """Number of documents in a directory or glob (None for JSONL sources)."""
+    if _is_jsonl(source):
+        return None
+    return len(_source_files(source))
+
+
+def iter_documents(
+    source: str,
+    text_field: str = "text",
+    id_field: str = "id"
+) -> Iterator[Document]:
+    """Read the documents of a corpus lazily.
+
+    Args:
+        source: Directory (every file below it is a document), glob pattern,
+            or JSONL/gzip-JSONL file with one JSON object per document
+        text_field: JSONL field holding the document text
+        id_field: JSONL field holding the document ID (default ID: the line
+            number); files are identified by their path
+
+    Yields:
+        Documents in a stable order. A file that cannot be decoded or a
+        malformed JSONL line is yielded as a Document with ``error`` set
+        (identified by its path or line number), so that one bad document
+        does not stop the run.
+    """
+    if not _is_jsonl(source):
+        base = Path(source) if Path(source).is_dir() else None
+        for path in _source_files(source):
+            doc_id = str(path.relative_to(base)) if base is not None else str(path)
+            try:
+                text = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError) as e:
+                yield Document(id=doc_id, text="", error=f"{path}: {e}")
+                continue
+            yield Document(id=doc_id, text=text)
+        return
+
+    opener = gzip.open if source.lower().endswith(".gz") else open
+    # Lines are decoded one at a time, so a bad line only affects itself
+    with opener(source, "rb") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line.decode("utf-8"))
+                if not isinstance(record, dict) or not isinstance(record.get(text_field), str):
+                    raise ValueError(f"expected an object with a '{text_field}' string")
+            except ValueError as e:
+                yield Document(id=str(line_number), text="",
+                               error=f"{source}:{line_number}: {e}")
+                continue
+            yield Document(
+                id=str(record.get(id_field, line_number)),
+                text=record[text_field],
+                question=record.get("question")
+            )
+
+
+def completed_ids(path: Path) -> Set[str]:
+    """IDs of the documents already written to an output file.
+
+    Documents whose latest record is an error are not included, so they
+    are retried. If the file ends in a partial line, the last document is
+    also left out because its records may be incomplete.
+    """
+    if not path.exists():
+        return set()
+    content = path.read_text(encoding="utf-8")
+    succeeded: Dict[str, bool] = {}
+    last_id = None
+    for line in content.splitlines():
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            # A cut-off record still names its document at the start
+            match = _RECORD_ID.match(line)
+            if match:
+                last_id = json.loads(match.group(1))
+            continue
+        last_id = record.get("id")
+        succeeded[last_id] = "error" not in record
+    if content and not content.endswith("\n"):
+        succeeded.pop(last_id, None)
+    return {doc_id for doc_id, ok in succeeded.items() if ok}
+
+
+def document_records(
+    document: Document,
+    result: PipelineResult,
+    per_sentence: bool = False
+) -> List[Dict[str, Any]]:
+    """Output records of one processed document.
+
+    Args:
+        document: The document
+        result: Its pipeline result
+        per_sentence: One record per sentence instead of one per document
+
+    Returns:
+        JSON-serializable records. A document without sentences gets its
+        document record even with ``per_sentence``, so that a resumed run
+        sees it as finished.
+    """
+    if per_sentence and result.sentence_results:
+        return [
+            {
+                "id": document.id,
+                "sentence_id": r.sentence_id,
+                "sentence": r.source_sentence,
+                "status": r.status.value,
+                "claims": [claim.text for claim in r.claims],
+                "usage": usage_totals(r.metadata.get("usage", {})),
+            }
+            for r in result.sentence_results
+        ]
+    return [{
+        "id": document.id,
+        "claims": [claim.text for claim in result.get_all_claims()],
+        "statistics": result.get_statistics_summary(),
+        "usage": usage_totals(result.statistics.get("usage", {})),
+    }]
+
+
+async def run_corpus(
+    pipeline: "ClaimExtractionPipeline",
+    documents: Iterator[Document],
+    output: TextIO,
+    per_sentence: bool = False,
+    concurrency: int = DEFAULT_DOCUMENT_CONCURRENCY,
+    skip: Optional[Set[str]] = None,
+    on_document: Optional[DocumentCallback] = None
+) -> Dict[str, Any]:
+    """Extract claims from every document and write the results as JSONL.
+
+    Documents are pulled from the iterator as workers become free, so the
+    corpus is never held in memory. A document's records are written in
+    one write, in completion order; a failed document, or one that could
+    not be read, gets an ``{"id": ..., "error": ...}`` record.
+
+    Args:
+        pipeline: Pipeline shared by all documents
+        documents: Documents to process
+        output: Text stream the JSONL records are written to
+        per_sentence: One record per sentence instead of one per document
+        concurrency: Documents processed at the same time
+        skip: IDs of documents to skip (e.g. ``completed_ids(output_path)``)
+        on_document: Called as ``(record, completed)`` after each document;
+            the record is the document's first one, its error record or
+            ``{"id": ..., "skipped": True}``
+
+    Returns:
+        Summary with document, sentence and claim counts, failures, LLM
+        requests and estimated tokens, token usage reported by the
+        provider (and its estimated cost), and throughput
+    """
+    skip = skip or set()
+    start_time = time.time()
+    requests_before, tokens_before = _request_totals()
+    summary = {
+        "documents": 0,
+        "succeeded": 0,
+        "failed": 0,
+        "skipped": 0,
+        "sentences": 0,
+        "claims": 0,
+        "sentence_errors": 0,
+    }
+    pending = iter(documents)
+    usages: List[Dict[str, Any]] = []
+
+    async def worker() -> None:
+        for document in pending:
+            if document.id in skip:
+                summary["skipped"] += 1
+                if on_document is not None:
+                    on_document({"id": document.id, "skipped": True},
+                                summary["documents"] + summary["skipped"])
+                continue
+            try:
+                if document.error is not None:
+                    raise ValueError(document.error)
+                result = await pipeline.aextract_claims(document.text, document.question)
+                records = document_records(document, result, per_sentence)
+                summary["succeeded"] += 1
+                summary["sentences"] += len(result.sentence_results)
+                summary["claims"] += len(result.get_all_claims())
+                summary["sentence_errors"] += sum(
+                    1 for r in result.sentence_results
+                    if r.status == SentenceStatus.PROCESSING_ERROR)
+                usages.append(usage_totals(result.statistics.get("usage", {})))
+            except Exception as e:
+                records = [{"id": document.id, "error": str(e)}]
+                summary["failed"] += 1
+            summary["documents"] += 1
+
+            output.write("".join(
+                json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+            output.flush()
+            if on_document is not None:
+                on_document(records[0] if records else {"id": document.id},
+                            summary["documents"] + summary["skipped"])
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+
+    elapsed = time.time() - start_time
+    requests_after, tokens_after = _request_totals()
+    usage = sum_usage(usages)
+    summary.update({
+        "llm_requests": requests_after - requests_before,
+        "estimated_tokens": tokens_after - tokens_before,
+        "input_tokens": usage["input_tokens"],
+        "output_tokens": usage["output_tokens"],
+        "reasoning_tokens": usage["reasoning_tokens"],
+        "elapsed_seconds": round(elapsed, 2),
+        "documents_per_second": round(summary["documents"] / elapsed, 3) if elapsed else 0.0,
+    })
+    if "estimated_cost_usd" in usage:
+        summary["estimated_cost_usd"] = usage["estimated_cost_usd"]
+    return summary
+
+
+def _request_totals() -> tuple:
+    """LLM requests and estimated tokens counted by all rate limiters."""
+    stats = rate_limiter_stats().values()
+    return (
+        sum(s["requests"] for s in stats),
+        sum(s["estimated_tokens"] for s in stats)
+    )
@@ -2,7 +2,15 @@
 
 from .sentence import SentenceWithContext, SentenceMetadata
 from .claim import Claim, ClaimExtractionResult, PipelineResult, SentenceStatus
-from .result import SelectionResult, DisambiguationResult, DecompositionResult, StageResult
+from .result import (
+    SelectionResult,
+    PackedSelectionItem,
+    PackedSelectionResult,
+    DisambiguationResult,
+    DecompositionResult,
+    FusedExtractionResult,
+    StageResult
+)
 
 __all__ = [
     # Sentence models
@@ -15,7 +23,10 @@ __all__ = [
     "SentenceStatus",
     # Stage result models
     "SelectionResult",
+    "PackedSelectionItem",
+    "PackedSelectionResult",
     "DisambiguationResult",
     "DecompositionResult",
+    "FusedExtractionResult",
     "StageResult",
 ]
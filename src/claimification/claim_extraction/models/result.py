@@ -1,7 +1,7 @@
 """Stage-specific result models."""
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
 from pydantic import BaseModel, Field
 
 
@@ -22,6 +22,20 @@ class SelectionResult(BaseModel):
     )
 
 
+class PackedSelectionItem(SelectionResult):
+    """Selection result for one sentence of a packed Selection call."""
+    sentence_id: str = Field(
+        description="ID of the sentence this result belongs to"
+    )
+
+
+class PackedSelectionResult(BaseModel):
+    """Result from a packed Selection call covering several sentences."""
+    results: list[PackedSelectionItem] = Field(
+        description="One selection result per input sentence"
+    )
+
+
 class DisambiguationResult(BaseModel):
     """Result from the Disambiguation stage (Stage 3).
 
@@ -55,10 +69,39 @@ class DecompositionResult(BaseModel):
     )
 
 
+class FusedExtractionResult(BaseModel):
+    """Result from the fused extraction mode.
+
+    Runs Selection, Disambiguation and Decomposition in a single call.
+    Later stages are omitted when an earlier stage stops the sentence.
+    """
+    selection: SelectionResult = Field(
+        description="Selection result (verifiable content detection)"
+    )
+    disambiguation: Optional[DisambiguationResult] = Field(
+        default=None,
+        description="Disambiguation result (null if no verifiable content)"
+    )
+    decomposition: Optional[DecompositionResult] = Field(
+        default=None,
+        description="Decomposition result (null if stopped at an earlier step)"
+    )
+
+
 # For backward compatibility and convenience
 @dataclass
 class StageResult:
-    """Generic stage result wrapper."""
+    """Generic stage result wrapper.
+
+    ``metadata`` carries call statistics such as retries and backoff time.
+    ``timing`` describes the LLM call for the timing statistics: attempts,
+    rate-limit wait and cache hit set by the agent, stage and wall time
+    added by the pipeline (see ``claimification.utils.timing``). ``usage``
+    holds the call's token usage (see ``claimification.utils.usage``).
+    """
     success: bool
     data: Optional[BaseModel] = None
     error: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    timing: Dict[str, Any] = field(default_factory=dict)
+    usage: Dict[str, int] = field(default_factory=dict)
@@ -1,7 +1,12 @@
 """Claim Extraction Pipeline - Orchestrates all stages."""
 
+import asyncio
+import contextlib
 import time
-from typing import Optional
+from collections import OrderedDict
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple, Union
+)
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
@@ -13,12 +18,77 @@ from .models import (
     SentenceStatus,
     SelectionResult,
     DisambiguationResult,
-    DecompositionResult
+    DecompositionResult,
+    FusedExtractionResult,
+    StageResult
 )
-from .stages.sentence_splitter import SentenceSplitter
+from .stages.sentence_splitter import READ_CHARS, SentenceSplitter
 from .stages.selection_agent import SelectionAgent
 from .stages.disambiguation_agent import DisambiguationAgent
 from .stages.decomposition_agent import DecompositionAgent
+from .stages.fused_agent import FusedExtractionAgent
+from .stages.prefilter import SentencePrefilter
+from .scheduler import WavefrontScheduler
+from .checkpoint import CheckpointJournal
+from .streaming import ClaimStream
+from ..utils.cache import get_response_cache
+from ..utils.hooks import NULL_SPAN, start_span
+from ..utils.timing import call_timing, stage_statistics, summarize_durations
+from ..utils.usage import (
+    add_usage,
+    empty_usage,
+    format_usage,
+    usage_statistics,
+    usage_totals
+)
+
+
+SCHEDULERS = ("depth_first", "wavefront")
+MODES = ("staged", "fused")
+
+# Work items remembered for deduplication when reading streamed input
+STREAM_DEDUP_ITEMS = 1024
+
+# progress_callback(result, completed, total), called per finished sentence;
+# total is None while streamed input is still being read
+ProgressCallback = Callable[[ClaimExtractionResult, int, Optional[int]], None]
+
+# Metadata describing a sentence's own LLM calls, position or origin, which
+# copies of its result for identical sentences must not inherit
+_PER_SENTENCE_METADATA = (
+    "char_start", "char_end", "retries", "backoff_seconds", "timing", "usage",
+    "deduplicated", "reused")
+
+
+class _RecentWork(OrderedDict):
+    """Shared work items that forget the least recently used finished ones.
+
+    Used as the ``shared`` map of streamed runs, so deduplication does not
+    hold a key and result for every sentence of the input.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get(self, key, default=None):
+        if key in self:
+            self.move_to_end(key)
+        return super().get(key, default)
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        # Items still in flight are kept; duplicates may be waiting on them
+        excess = len(self) - self.maxsize
+        finished = []
+        for old_key, future in self.items():
+            if len(finished) >= excess:
+                break
+            if future.done():
+                finished.append(old_key)
+        for old_key in finished:
+            del self[old_key]
 
 
 class ClaimExtractionPipeline:
@@ -29,7 +99,16 @@ class ClaimExtractionPipeline:
         model: str = "gpt-5-nano-2025-08-07",
         temperature: float = 0.0,
         context_sentences: int = 2,
-        verbose: bool = True
+        verbose: bool = True,
+        max_concurrency: int = 8,
+        scheduler: str = "depth_first",
+        stage_concurrency: Optional[Dict[str, int]] = None,
+        stage_batch_size: int = 1,
+        selection_pack_size: int = 1,
+        mode: str = "staged",
+        prefilter: Optional[SentencePrefilter] = None,
+        selection_cache: Optional[str] = None,
+        selection_audit_rate: float = 0.0
     ):
         """Initialize the claim extraction pipeline.
 
@@ -38,9 +117,54 @@ class ClaimExtractionPipeline:
             temperature: Temperature for LLM (0.0 = deterministic)
             context_sentences: Number of surrounding sentences for context
             verbose: Whether to print progress messages
+            max_concurrency: Maximum number of sentences processed at once
+                by ``aextract_claims``
+            scheduler: "depth_first" sends each sentence through all stages
+                before it counts as done; "wavefront" runs each stage as its
+                own concurrent wave fed by a queue (see WavefrontScheduler)
+            stage_concurrency: Per-stage worker counts for the wavefront
+                scheduler (default: max_concurrency for every stage)
+            stage_batch_size: Maximum items per batched stage call for the
+                wavefront scheduler
+            selection_pack_size: Number of consecutive sentences classified
+                in one Selection call (1 = one call per sentence)
+            mode: "staged" runs Selection, Disambiguation and Decomposition as
+                separate LLM calls; "fused" runs all three in one call per
+                sentence (faster and cheaper, for lower-stakes traffic)
+            prefilter: Optional local filter that marks obviously
+                unverifiable sentences without an LLM call
+            selection_cache: Normalized-key cache tier for Selection:
+                "sentence" or "sentence_and_context" (see SelectionAgent);
+                requires the response cache
+            selection_audit_rate: Fraction of normalized-tier hits that are
+                re-checked to measure agreement with fresh results
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if scheduler not in SCHEDULERS:
+            raise ValueError(
+                f"Unknown scheduler: {scheduler} (expected one of {SCHEDULERS})")
+        if selection_pack_size < 1:
+            raise ValueError("selection_pack_size must be at least 1")
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode: {mode} (expected one of {MODES})")
+        if mode == "fused" and (scheduler != "depth_first" or selection_pack_size > 1):
+            raise ValueError(
+                "Fused mode makes one call per sentence and cannot be combined "
+                "with the wavefront scheduler or Selection packing")
+
+        self.model = model
+        self.temperature = temperature
+        self.mode = mode
+        self.prefilter = prefilter
         self.verbose = verbose
         self.console = Console() if verbose else None
+        self.max_concurrency = max_concurrency
+        self.scheduler = scheduler
+        self.stage_concurrency = stage_concurrency
+        self.stage_batch_size = stage_batch_size
+        self.selection_pack_size = selection_pack_size
+        self.selection_cache = selection_cache
 
         # Initialize stages
         self.sentence_splitter = SentenceSplitter(
@@ -48,24 +172,524 @@ class ClaimExtractionPipeline:
             context_sentences_after=context_sentences
         )
         self.selection_agent = SelectionAgent(
-            model=model, temperature=temperature)
+            model=model,
+            temperature=temperature,
+            normalized_cache=selection_cache,
+            audit_rate=selection_audit_rate
+        )
         self.disambiguation_agent = DisambiguationAgent(
             model=model, temperature=temperature)
         self.decomposition_agent = DecompositionAgent(
             model=model, temperature=temperature)
+        self.fused_agent = FusedExtractionAgent(
+            model=model, temperature=temperature) if mode == "fused" else None
 
-    def extract_claims(self, text: str, question: Optional[str] = None) -> PipelineResult:
+    def extract_claims(
+        self,
+        text: str,
+        question: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        previous: Optional[PipelineResult] = None,
+        checkpoint: Optional[CheckpointJournal] = None
+    ) -> PipelineResult:
         """Extract claims from text.
 
         Args:
             text: The text to extract claims from
             question: Optional question for context (for backward compatibility)
+            progress_callback: Called as ``(result, completed, total)`` each
+                time a sentence is finished
+            previous: Result of an earlier run on a previous version of the
+                text. Sentences whose text and context window are unchanged
+                reuse their earlier result; only the others are processed.
+            checkpoint: Journal that records each finished sentence; when
+                it resumes, sentences already in it are not processed again
 
         Returns:
             PipelineResult containing all extracted claims and metadata
         """
+        if self.scheduler == "wavefront":
+            # The wavefront scheduler is inherently concurrent
+            return asyncio.run(self.aextract_claims(
+                text, question, progress_callback, previous=previous, checkpoint=checkpoint))
+
+        with self._run_span(text_chars=len(text)) as span:
+            start_time = time.time()
+            sentences = self._split_sentences(text, question)
+            reused = self._reusable_results(sentences, previous)
+            progress_callback = self._start_checkpoint(
+                checkpoint, text, question, reused, progress_callback)
+
+            # Classify packed windows up front if Selection packing is enabled
+            selection_results: List[Optional[StageResult]] = [None] * len(sentences)
+            if self.selection_pack_size > 1:
+                for start, end in self._pack_windows(sentences):
+                    if not self._window_reused(sentences[start:end], reused):
+                        selection_results[start:end] = self._select_window(
+                            sentences, start, end, question)
+
+            # Process each sentence through stages 2-4
+            sentence_results = []
+            processed: Dict[Tuple[str, str], ClaimExtractionResult] = {}
+
+            with self._progress() as progress:
+                task = progress.add_task(
+                    f"Processing sentences...",
+                    total=len(sentences)
+                )
+
+                for i, sentence_obj in enumerate(sentences):
+                    progress.update(
+                        task,
+                        description=f"Processing sentence {i+1}/{len(sentences)}...",
+                        advance=1
+                    )
+
+                    # Identical sentences with identical context are processed once
+                    key = self._work_key(sentence_obj)
+                    if sentence_obj.sentence_id in reused:
+                        result = reused[sentence_obj.sentence_id]
+                    elif key in processed:
+                        result = self._duplicate_result(processed[key], sentence_obj)
+                    else:
+                        started = time.perf_counter()
+                        result = processed[key] = self._process_sentence(
+                            sentence_obj, selection_results[i])
+                        self._finish_timing(result, started)
+                    sentence_results.append(result)
+                    if progress_callback is not None:
+                        progress_callback(result, i + 1, len(sentences))
+
+            return self._end_run_span(span, self._build_pipeline_result(
+                text, question, sentences, sentence_results, start_time,
+                previous, checkpoint))
+
+    async def aextract_claims(
+        self,
+        text: str,
+        question: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        dedup_scope: Optional[Dict[Tuple[str, str], Any]] = None,
+        previous: Optional[PipelineResult] = None,
+        checkpoint: Optional[CheckpointJournal] = None
+    ) -> PipelineResult:
+        """Asynchronously extract claims from text.
+
+        With the "depth_first" scheduler, sentences are processed
+        concurrently with at most ``max_concurrency`` sentences in flight at
+        once; each sentence goes through Selection -> Disambiguation ->
+        Decomposition in order. With the "wavefront" scheduler, each stage
+        runs as its own wave over all sentences.
+
+        Args:
+            text: The text to extract claims from
+            question: Optional question for context (for backward compatibility)
+            progress_callback: Called as ``(result, completed, total)`` each
+                time a sentence is finished, in completion order
+            dedup_scope: Dict shared by concurrent calls (e.g. the documents
+                of one batch) so that a sentence repeated across them, with
+                the same context, is processed once. Sentences repeated
+                within one call are always processed once.
+            previous: Result of an earlier run on a previous version of the
+                text. Sentences whose text and context window are unchanged
+                reuse their earlier result; only the others are processed.
+            checkpoint: Journal that records each finished sentence; when
+                it resumes, sentences already in it are not processed again
+
+        Returns:
+            PipelineResult with sentence results in original sentence order
+        """
         start_time = time.time()
+        sentences = self._split_sentences(text, question)
+        return await self._aextract_traced(
+            text, question, sentences, start_time, progress_callback,
+            dedup_scope, previous, checkpoint)
+
+    def iter_claims(
+        self,
+        source: Union[str, TextIO, Iterable[str]],
+        question: Optional[str] = None,
+        ordered: bool = True,
+        keep_result: bool = False,
+        **options: Any
+    ) -> ClaimStream:
+        """Yield sentence results as they complete, from synchronous code.
+
+        Iterate the returned stream with ``for``; the run happens on a
+        background thread. The input is split lazily and yielded results
+        are not kept, so memory stays flat on large inputs (see
+        ClaimStream). ``stream.statistics`` holds running counts.
+
+        Args:
+            source: The text, a file object opened in text mode, or an
+                iterable of text pieces (e.g. ``iter_text_file(path)``)
+            question: Optional question for context (for backward compatibility)
+            ordered: Yield results in sentence order (True) or as they
+                complete (False)
+            keep_result: Also collect every result into ``stream.result``,
+                the run's PipelineResult, once iteration has finished
+            **options: Further keyword arguments of ``aextract_claims``
+
+        Returns:
+            ClaimStream over the input's ClaimExtractionResults
+        """
+        return ClaimStream(self, source, question, ordered, keep_result, **options)
+
+    def aiter_claims(
+        self,
+        source: Union[str, TextIO, Iterable[str]],
+        question: Optional[str] = None,
+        ordered: bool = True,
+        keep_result: bool = False,
+        **options: Any
+    ) -> ClaimStream:
+        """Yield sentence results as they complete, inside an event loop.
+
+        Iterate the returned stream with ``async for``. The input is split
+        lazily and yielded results are not kept, so memory stays flat on
+        large inputs (see ClaimStream). ``stream.statistics`` holds running
+        counts.
+
+        Args:
+            source: The text, a file object opened in text mode, or an
+                iterable of text pieces (e.g. ``iter_text_file(path)``)
+            question: Optional question for context (for backward compatibility)
+            ordered: Yield results in sentence order (True) or as they
+                complete (False)
+            keep_result: Also collect every result into ``stream.result``,
+                the run's PipelineResult, once iteration has finished
+            **options: Further keyword arguments of ``aextract_claims``
+
+        Returns:
+            ClaimStream over the input's ClaimExtractionResults
+        """
+        return ClaimStream(self, source, question, ordered, keep_result, **options)
+
+    async def _aextract_traced(
+        self,
+        text: str,
+        question: Optional[str],
+        sentences: List[SentenceWithContext],
+        start_time: float,
+        *args: Any,
+        **options: Any
+    ) -> PipelineResult:
+        """Run ``_aextract_sentences`` in the tracing span of the run."""
+        with self._run_span(text_chars=len(text)) as span:
+            return self._end_run_span(span, await self._aextract_sentences(
+                text, question, sentences, start_time, *args, **options))
+
+    async def _aextract_sentences(
+        self,
+        text: str,
+        question: Optional[str],
+        sentences: List[SentenceWithContext],
+        start_time: float,
+        progress_callback: Optional[ProgressCallback] = None,
+        dedup_scope: Optional[Dict[Tuple[str, str], Any]] = None,
+        previous: Optional[PipelineResult] = None,
+        checkpoint: Optional[CheckpointJournal] = None
+    ) -> PipelineResult:
+        """Process already split sentences (see ``aextract_claims``)."""
+        reused = self._reusable_results(sentences, previous)
+        progress_callback = self._start_checkpoint(
+            checkpoint, text, question, reused, progress_callback)
+        completed = 0
+        # (sentence, context) -> future of the first result computed for it
+        shared = dedup_scope if dedup_scope is not None else {}
+        loop = asyncio.get_running_loop()
+
+        def report(progress: Progress, task, result: ClaimExtractionResult) -> None:
+            nonlocal completed
+            completed += 1
+            progress.update(task, advance=1)
+            if progress_callback is not None:
+                progress_callback(result, completed, len(sentences))
+
+        if self.scheduler == "wavefront":
+            scheduler = WavefrontScheduler(
+                self,
+                stage_concurrency=self.stage_concurrency,
+                batch_size=self.stage_batch_size
+            )
+            # Only sentences no other item is already processing enter the
+            # waves; the rest reuse those results
+            owned = []
+            for sentence_obj in sentences:
+                key = self._work_key(sentence_obj)
+                if sentence_obj.sentence_id not in reused and key not in shared:
+                    shared[key] = loop.create_future()
+                    owned.append(sentence_obj)
+            owned_keys = {sentence_obj.sentence_id: self._work_key(sentence_obj)
+                          for sentence_obj in owned}
+
+            def on_result(progress: Progress, task, result: ClaimExtractionResult) -> None:
+                future = shared[owned_keys[result.sentence_id]]
+                if not future.done():
+                    future.set_result(result)
+                report(progress, task, result)
+
+            with self._progress() as progress:
+                task = progress.add_task(
+                    f"Processing {len(sentences)} sentences (wavefront)...",
+                    total=len(sentences)
+                )
+                try:
+                    owned_results = await scheduler.run(
+                        sentences,
+                        question=question,
+                        on_result=lambda result: on_result(progress, task, result),
+                        owned=set(owned_keys)
+                    )
+                except BaseException:
+                    self._cancel_pending(shared, owned_keys.values())
+                    raise
+
+                by_id = {result.sentence_id: result
+                         for result in owned_results if result is not None}
+                sentence_results = []
+                for sentence_obj in sentences:
+                    result = by_id.get(sentence_obj.sentence_id)
+                    if result is None and sentence_obj.sentence_id in reused:
+                        result = reused[sentence_obj.sentence_id]
+                        report(progress, task, result)
+                    elif result is None:
+                        result = self._duplicate_result(
+                            await self._shared_result(shared[self._work_key(sentence_obj)]),
+                            sentence_obj)
+                        report(progress, task, result)
+                    sentence_results.append(result)
+            return self._build_pipeline_result(
+                text, question, sentences, sentence_results, start_time,
+                previous, checkpoint)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        with self._progress() as progress:
+            task = progress.add_task(
+                f"Processing {len(sentences)} sentences "
+                f"(concurrency {self.max_concurrency})...",
+                total=len(sentences)
+            )
+
+            async def run(
+                sentence_obj: SentenceWithContext,
+                selection_result: Optional[StageResult] = None
+            ) -> ClaimExtractionResult:
+                if sentence_obj.sentence_id in reused:
+                    result = reused[sentence_obj.sentence_id]
+                else:
+                    result = await self._aprocess_shared(
+                        sentence_obj, shared, semaphore, selection_result)
+                report(progress, task, result)
+                return result
+
+            async def run_window(start: int, end: int) -> List[ClaimExtractionResult]:
+                if self._window_reused(sentences[start:end], reused):
+                    selection_results = [None] * (end - start)
+                else:
+                    async with semaphore:
+                        selection_results = await self._aselect_window(
+                            sentences, start, end, question)
+                return await asyncio.gather(*(
+                    run(sentence_obj, selection_result)
+                    for sentence_obj, selection_result
+                    in zip(sentences[start:end], selection_results)
+                ))
 
+            # gather preserves input order regardless of completion order
+            if self.selection_pack_size > 1:
+                windows = await asyncio.gather(*(
+                    run_window(start, end)
+                    for start, end in self._pack_windows(sentences)
+                ))
+                sentence_results = [result for window in windows for result in window]
+            else:
+                sentence_results = await asyncio.gather(
+                    *(run(sentence_obj) for sentence_obj in sentences)
+                )
+
+        return self._build_pipeline_result(
+            text, question, sentences, list(sentence_results), start_time,
+            previous, checkpoint)
+
+    def extract_claims_from(
+        self,
+        source: Union[TextIO, Iterable[str]],
+        question: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> PipelineResult:
+        """Extract claims from streamed text (see ``aextract_claims_from``)."""
+        return asyncio.run(self.aextract_claims_from(source, question, progress_callback))
+
+    async def aextract_claims_from(
+        self,
+        source: Union[TextIO, Iterable[str]],
+        question: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> PipelineResult:
+        """Asynchronously extract claims from streamed text.
+
+        Sentences are split lazily with ``SentenceSplitter.iter_split``, so
+        the first sentences are sent to the LLM while the rest of the input
+        is still being read, and only a sliding window of sentences and
+        contexts is held at a time. Identical sentences are deduplicated
+        against the last ``STREAM_DEDUP_ITEMS`` work items only, and the
+        sentence results are collected for the PipelineResult (use
+        ``aiter_claims`` to drop them instead). At most ``max_concurrency``
+        sentences are in flight. The wavefront scheduler and Selection
+        packing need all sentences up front; with them, the input is read
+        completely and passed to ``aextract_claims``.
+
+        Args:
+            source: File object opened in text mode, or an iterable of text
+                pieces (e.g. ``iter_text_file(path)``)
+            question: Optional question for context (for backward compatibility)
+            progress_callback: Called as ``(result, completed, total)`` each
+                time a sentence is finished; total is None until the whole
+                input has been read
+
+        Returns:
+            PipelineResult with sentence results in original sentence order.
+            Its ``text`` is empty unless the input was read completely; the
+            sentences' ``char_start``/``char_end`` metadata locate them in
+            the input.
+        """
+        if self._needs_all_sentences():
+            return await self.aextract_claims(
+                "".join(self._source_pieces(source)), question, progress_callback)
+
+        completed = 0
+
+        def report(index: int, result: ClaimExtractionResult, total: Optional[int]) -> None:
+            nonlocal completed
+            completed += 1
+            if progress_callback is not None:
+                progress_callback(result, completed, total)
+
+        return await self._aextract_lazily(source, question, report)
+
+    async def _aextract_lazily(
+        self,
+        source: Union[str, TextIO, Iterable[str]],
+        question: Optional[str],
+        on_result: Callable[[int, ClaimExtractionResult, Optional[int]], None],
+        keep_results: bool = True
+    ) -> Optional[PipelineResult]:
+        """Process lazily split input, ``max_concurrency`` sentences at a time.
+
+        Args:
+            source: Text, file object or iterable of text pieces
+            question: Optional question for context
+            on_result: Called as ``(index, result, total)`` as each sentence
+                finishes; total is None until the whole input has been read
+            keep_results: Collect the results into a PipelineResult
+
+        Returns:
+            PipelineResult with the results in sentence order (its text is
+            empty unless source is a string), or None without keep_results
+        """
+        start_time = time.time()
+        with self._run_span(streamed=True) as span:
+            if self.verbose:
+                self.console.print("\n[bold cyan]Starting Claim Extraction Pipeline "
+                                   "(streamed input)[/bold cyan]\n")
+
+            pieces = [source] if isinstance(source, str) else self._source_pieces(source)
+            sentences = enumerate(self.sentence_splitter.iter_split(pieces, question))
+            results: Dict[int, ClaimExtractionResult] = {}
+            shared: Dict[Tuple[str, str], Any] = _RecentWork(STREAM_DEDUP_ITEMS)
+            read_count = 0
+            claim_count = 0
+            total: Optional[int] = None
+
+            with self._progress() as progress:
+                task = progress.add_task("Processing streamed sentences...", total=None)
+
+                async def worker() -> None:
+                    nonlocal read_count, claim_count, total
+                    while True:
+                        try:
+                            index, sentence_obj = next(sentences)
+                        except StopIteration:
+                            total = read_count
+                            return
+                        read_count += 1
+                        result = await self._aprocess_shared(sentence_obj, shared)
+                        self._record_offsets(sentence_obj, result)
+                        if keep_results:
+                            results[index] = result
+                        if result.status == SentenceStatus.EXTRACTED:
+                            claim_count += len(result.claims)
+                        progress.update(task, advance=1)
+                        on_result(index, result, total)
+
+                # Each worker pulls the next sentence once its previous one is done
+                await asyncio.gather(*(worker() for _ in range(self.max_concurrency)))
+
+            if not keep_results:
+                if span.recording:
+                    span.set_attributes(sentences=read_count, claims=claim_count)
+                return None
+            # Offsets were recorded as each sentence finished. Streamed input
+            # is never held in full, so the result only has text given one
+            return self._end_run_span(span, self._build_pipeline_result(
+                source if isinstance(source, str) else "", question, [],
+                [results[i] for i in range(len(results))], start_time))
+
+    def _needs_all_sentences(self) -> bool:
+        """Whether runs need every sentence up front (wavefront, Selection packing)."""
+        return self.scheduler == "wavefront" or self.selection_pack_size > 1
+
+    @staticmethod
+    def _source_pieces(source: Union[TextIO, Iterable[str]]) -> Iterator[str]:
+        """Text pieces of a file object or iterable."""
+        if hasattr(source, "read"):
+            return iter(lambda: source.read(READ_CHARS), "")
+        return iter(source)
+
+    async def _aprocess_shared(
+        self,
+        sentence: SentenceWithContext,
+        shared: Dict[Tuple[str, str], Any],
+        semaphore: Optional[asyncio.Semaphore] = None,
+        selection_result: Optional[StageResult] = None
+    ) -> ClaimExtractionResult:
+        """Process a sentence once per identical work item in ``shared``.
+
+        If an identical item is already processed or in flight, its result
+        is awaited and copied instead of calling the LLM again.
+        """
+        key = self._work_key(sentence)
+        future = shared.get(key)
+        if future is not None:
+            return self._duplicate_result(await self._shared_result(future), sentence)
+
+        future = shared[key] = asyncio.get_running_loop().create_future()
+        started = time.perf_counter()
+        try:
+            async with semaphore or contextlib.nullcontext():
+                result = await self._aprocess_sentence(sentence, selection_result)
+        except BaseException:
+            self._cancel_pending(shared, [key])
+            raise
+        self._finish_timing(result, started)
+        future.set_result(result)
+        return result
+
+    @staticmethod
+    def _record_offsets(sentence: SentenceWithContext, result: ClaimExtractionResult) -> None:
+        """Copy the sentence's position in the text to its result's metadata."""
+        if sentence.metadata.get("char_start") is not None:
+            result.metadata.setdefault("char_start", sentence.metadata["char_start"])
+            result.metadata.setdefault("char_end", sentence.metadata["char_end"])
+
+    def _split_sentences(
+        self,
+        text: str,
+        question: Optional[str]
+    ) -> List[SentenceWithContext]:
+        """Run Stage 1 and report progress."""
         if self.verbose:
             self.console.print(
                 "\n[bold cyan]Starting Claim Extraction Pipeline[/bold cyan]")
@@ -84,37 +708,65 @@ class ClaimExtractionPipeline:
         if self.verbose:
             self.console.print(f"  ✓ Found {len(sentences)} sentences\n")
 
-        # Process each sentence through stages 2-4
-        sentence_results = []
+        return sentences
 
-        with Progress(
+    def _progress(self) -> Progress:
+        """Create the progress display used while processing sentences."""
+        return Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=self.console,
             disable=not self.verbose
-        ) as progress:
-            task = progress.add_task(
-                f"Processing sentences...",
-                total=len(sentences)
-            )
-
-            for i, sentence_obj in enumerate(sentences):
-                progress.update(
-                    task,
-                    description=f"Processing sentence {i+1}/{len(sentences)}...",
-                    advance=1
-                )
-
-                result = self._process_sentence(sentence_obj)
-                sentence_results.append(result)
+        )
 
+    def _build_pipeline_result(
+        self,
+        text: str,
+        question: Optional[str],
+        sentences: List[SentenceWithContext],
+        sentence_results: List[ClaimExtractionResult],
+        start_time: float,
+        previous: Optional[PipelineResult] = None,
+        checkpoint: Optional[CheckpointJournal] = None
+    ) -> PipelineResult:
+        """Assemble the PipelineResult and print the summary."""
         # Calculate statistics
         end_time = time.time()
         statistics = {
             "total_time_seconds": round(end_time - start_time, 2),
-            "sentences_processed": len(sentences),
-            "model_used": self.selection_agent.model_name
+            "sentences_processed": len(sentence_results),
+            "model_used": self.model,
+            "mode": self.mode
         }
+        if self.prefilter is not None:
+            statistics["prefilter"] = self._prefilter_statistics(sentence_results)
+        statistics["deduplication"] = self._deduplication_statistics(sentence_results)
+        statistics["timing"] = self._timing_statistics(sentence_results)
+        statistics["usage"] = usage_statistics(
+            ((stage, usage)
+             for r in sentence_results
+             for stage, usage in r.metadata.get("usage", {}).get("stages", {}).items()),
+            self.model
+        )
+        if previous is not None:
+            statistics["incremental"] = self._incremental_statistics(sentence_results)
+        if checkpoint is not None:
+            statistics["checkpoint"] = {
+                "path": str(checkpoint.path),
+                "resumed": checkpoint.resumed,
+                "recorded": checkpoint.recorded
+            }
+        cache = get_response_cache()
+        if cache is not None:
+            # Process-wide counters of the persistent response cache
+            statistics["cache"] = cache.stats()
+            if self.selection_cache is not None:
+                # Counters of this pipeline's Selection agent since creation
+                statistics["selection_cache"] = self.selection_agent.normalized_cache_stats()
+
+        # Record where each sentence is in the original text
+        for sentence, sentence_result in zip(sentences, sentence_results):
+            self._record_offsets(sentence, sentence_result)
 
         pipeline_result = PipelineResult(
             text=text,
@@ -129,21 +781,692 @@ class ClaimExtractionPipeline:
 
         return pipeline_result
 
-    def _process_sentence(self, sentence: SentenceWithContext) -> ClaimExtractionResult:
+    def _process_sentence(
+        self,
+        sentence: SentenceWithContext,
+        selection_result: Optional[StageResult] = None
+    ) -> ClaimExtractionResult:
         """Process a single sentence through stages 2-4.
 
         Args:
             sentence: SentenceWithContext object
+            selection_result: Selection output computed ahead of time (e.g.
+                by a packed call); Selection is run here if not provided
+
+        Returns:
+            ClaimExtractionResult for this sentence
+        """
+        # Stage 1.5: Local prefilter
+        prefiltered = self._check_prefilter(sentence)
+        if prefiltered is not None:
+            return prefiltered
+
+        if self.mode == "fused":
+            started = time.perf_counter()
+            with self._stage_span("fused", [sentence]) as span:
+                fused_result = self.fused_agent.process(sentence.text, sentence.context)
+                self._time_stage("fused", started, fused_result, span=span)
+            return self._unpack_fused(sentence, fused_result)
+
+        # Stage 2: Selection (Verifiable content detection)
+        if selection_result is None:
+            started = time.perf_counter()
+            with self._stage_span("selection", [sentence]) as span:
+                selection_result = self.selection_agent.process(
+                    sentence.text,
+                    sentence.context
+                )
+                self._time_stage("selection", started, selection_result, span=span)
+        terminal = self._check_selection(sentence, selection_result)
+        if terminal is not None:
+            return self._with_retry_metadata(terminal, selection_result)
+
+        selection_data: SelectionResult = selection_result.data
+        sentence_to_process = self._selected_sentence(sentence, selection_data)
+
+        # Stage 3: Disambiguation
+        started = time.perf_counter()
+        with self._stage_span("disambiguation", [sentence]) as span:
+            disambiguation_result = self.disambiguation_agent.process(
+                sentence_to_process,
+                sentence.context
+            )
+            self._time_stage("disambiguation", started, disambiguation_result, span=span)
+        terminal = self._check_disambiguation(sentence, disambiguation_result)
+        if terminal is not None:
+            return self._with_retry_metadata(
+                terminal, selection_result, disambiguation_result)
+
+        disambiguation_data: DisambiguationResult = disambiguation_result.data
+        final_sentence = self._disambiguated_sentence(
+            sentence_to_process, disambiguation_data)
+
+        # Stage 4: Decomposition (Claim extraction)
+        started = time.perf_counter()
+        with self._stage_span("decomposition", [sentence]) as span:
+            decomposition_result = self.decomposition_agent.process(
+                final_sentence,
+                sentence.context
+            )
+            self._time_stage("decomposition", started, decomposition_result, span=span)
+
+        return self._with_retry_metadata(
+            self._finalize(
+                sentence, selection_data, disambiguation_data, decomposition_result),
+            selection_result,
+            disambiguation_result,
+            decomposition_result
+        )
+
+    async def _aprocess_sentence(
+        self,
+        sentence: SentenceWithContext,
+        selection_result: Optional[StageResult] = None
+    ) -> ClaimExtractionResult:
+        """Asynchronously process a single sentence through stages 2-4.
+
+        Mirrors ``_process_sentence`` but awaits the agents' ``aprocess``.
+
+        Args:
+            sentence: SentenceWithContext object
+            selection_result: Selection output computed ahead of time
 
         Returns:
             ClaimExtractionResult for this sentence
         """
+        # Stage 1.5: Local prefilter
+        prefiltered = self._check_prefilter(sentence)
+        if prefiltered is not None:
+            return prefiltered
+
+        if self.mode == "fused":
+            started = time.perf_counter()
+            with self._stage_span("fused", [sentence]) as span:
+                fused_result = await self.fused_agent.aprocess(sentence.text, sentence.context)
+                self._time_stage("fused", started, fused_result, span=span)
+            return self._unpack_fused(sentence, fused_result)
+
         # Stage 2: Selection (Verifiable content detection)
-        selection_result = self.selection_agent.process(
-            sentence.text,
-            sentence.context
+        if selection_result is None:
+            started = time.perf_counter()
+            with self._stage_span("selection", [sentence]) as span:
+                selection_result = await self.selection_agent.aprocess(
+                    sentence.text,
+                    sentence.context
+                )
+                self._time_stage("selection", started, selection_result, span=span)
+        terminal = self._check_selection(sentence, selection_result)
+        if terminal is not None:
+            return self._with_retry_metadata(terminal, selection_result)
+
+        selection_data: SelectionResult = selection_result.data
+        sentence_to_process = self._selected_sentence(sentence, selection_data)
+
+        # Stage 3: Disambiguation
+        started = time.perf_counter()
+        with self._stage_span("disambiguation", [sentence]) as span:
+            disambiguation_result = await self.disambiguation_agent.aprocess(
+                sentence_to_process,
+                sentence.context
+            )
+            self._time_stage("disambiguation", started, disambiguation_result, span=span)
+        terminal = self._check_disambiguation(sentence, disambiguation_result)
+        if terminal is not None:
+            return self._with_retry_metadata(
+                terminal, selection_result, disambiguation_result)
+
+        disambiguation_data: DisambiguationResult = disambiguation_result.data
+        final_sentence = self._disambiguated_sentence(
+            sentence_to_process, disambiguation_data)
+
+        # Stage 4: Decomposition (Claim extraction)
+        started = time.perf_counter()
+        with self._stage_span("decomposition", [sentence]) as span:
+            decomposition_result = await self.decomposition_agent.aprocess(
+                final_sentence,
+                sentence.context
+            )
+            self._time_stage("decomposition", started, decomposition_result, span=span)
+
+        return self._with_retry_metadata(
+            self._finalize(
+                sentence, selection_data, disambiguation_data, decomposition_result),
+            selection_result,
+            disambiguation_result,
+            decomposition_result
+        )
+
+    def _unpack_fused(
+        self,
+        sentence: SentenceWithContext,
+        fused_result: StageResult
+    ) -> ClaimExtractionResult:
+        """Map a fused-mode result onto the staged decision logic.
+
+        Produces the same statuses and metadata as the staged path, so
+        callers cannot tell which mode produced a result.
+        """
+        return self._with_retry_metadata(
+            self._unpack_fused_result(sentence, fused_result), fused_result)
+
+    def _unpack_fused_result(
+        self,
+        sentence: SentenceWithContext,
+        fused_result: StageResult
+    ) -> ClaimExtractionResult:
+        """Build the sentence result from a fused-mode result."""
+        if not fused_result.success:
+            return ClaimExtractionResult(
+                source_sentence=sentence.text,
+                sentence_id=sentence.sentence_id,
+                status=SentenceStatus.PROCESSING_ERROR,
+                metadata={"error": fused_result.error}
+            )
+
+        fused_data: FusedExtractionResult = fused_result.data
+
+        terminal = self._check_selection(
+            sentence, StageResult(success=True, data=fused_data.selection))
+        if terminal is not None:
+            return terminal
+
+        disambiguation_result = (
+            StageResult(success=True, data=fused_data.disambiguation)
+            if fused_data.disambiguation is not None
+            else StageResult(
+                success=False,
+                error="Fused extraction failed: missing disambiguation result")
         )
+        terminal = self._check_disambiguation(sentence, disambiguation_result)
+        if terminal is not None:
+            return terminal
+
+        decomposition_result = (
+            StageResult(success=True, data=fused_data.decomposition)
+            if fused_data.decomposition is not None
+            else StageResult(
+                success=False,
+                error="Fused extraction failed: missing decomposition result")
+        )
+        return self._finalize(
+            sentence,
+            fused_data.selection,
+            fused_data.disambiguation,
+            decomposition_result
+        )
+
+    def _pack_windows(self, sentences: List[SentenceWithContext]) -> List[tuple]:
+        """Split sentence indices into consecutive (start, end) packing windows."""
+        size = self.selection_pack_size
+        return [
+            (start, min(start + size, len(sentences)))
+            for start in range(0, len(sentences), size)
+        ]
+
+    def _window_inputs(
+        self,
+        sentences: List[SentenceWithContext],
+        start: int,
+        end: int,
+        positions: List[int],
+        question: Optional[str]
+    ) -> tuple:
+        """Build packed Selection inputs and shared context for a window."""
+        items = [
+            (sentences[i].sentence_id, sentences[i].text, sentences[i].context)
+            for i in positions
+        ]
+        shared_context = self.sentence_splitter.build_window_context(
+            sentences, start, end, question)
+        return items, shared_context
+
+    def _window_positions(
+        self,
+        sentences: List[SentenceWithContext],
+        start: int,
+        end: int,
+        owned: Optional[Set[str]] = None
+    ) -> List[int]:
+        """Indices in sentences[start:end] that still need a Selection call.
+
+        With ``owned``, sentences not in it (processed elsewhere) are left out.
+        """
+        return [
+            i for i in range(start, end)
+            if (owned is None or sentences[i].sentence_id in owned)
+            and self._check_prefilter(sentences[i]) is None
+        ]
+
+    def _select_window(
+        self,
+        sentences: List[SentenceWithContext],
+        start: int,
+        end: int,
+        question: Optional[str]
+    ) -> List[Optional[StageResult]]:
+        """Run packed Selection for sentences[start:end].
+
+        Returns one entry per window sentence; prefiltered sentences get
+        None since they never reach Selection.
+        """
+        positions = self._window_positions(sentences, start, end)
+        results: List[Optional[StageResult]] = [None] * (end - start)
+        started = time.perf_counter()
+        with self._stage_span("selection", [sentences[i] for i in positions]) as span:
+            if len(positions) == 1:
+                sentence = sentences[positions[0]]
+                results[positions[0] - start] = self.selection_agent.process(
+                    sentence.text, sentence.context)
+            elif positions:
+                try:
+                    packed = self.selection_agent.process_packed(
+                        *self._window_inputs(sentences, start, end, positions, question))
+                except Exception as e:
+                    # Auth errors and an open circuit fail the window the way
+                    # they fail single calls
+                    packed = [StageResult(success=False, error=f"Selection failed: {e}")
+                              for _ in positions]
+                for i, result in zip(positions, packed):
+                    results[i - start] = result
+            self._time_stage("selection", started, *results, span=span)
+        return results
+
+    async def _aselect_window(
+        self,
+        sentences: List[SentenceWithContext],
+        start: int,
+        end: int,
+        question: Optional[str],
+        owned: Optional[Set[str]] = None
+    ) -> List[Optional[StageResult]]:
+        """Asynchronously run packed Selection for sentences[start:end].
+
+        Only sentences in ``owned`` (default: all) are classified; the
+        others still count as the window's neighbours.
+        """
+        positions = self._window_positions(sentences, start, end, owned)
+        results: List[Optional[StageResult]] = [None] * (end - start)
+        started = time.perf_counter()
+        with self._stage_span("selection", [sentences[i] for i in positions]) as span:
+            if len(positions) == 1:
+                sentence = sentences[positions[0]]
+                results[positions[0] - start] = await self.selection_agent.aprocess(
+                    sentence.text, sentence.context)
+            elif positions:
+                try:
+                    packed = await self.selection_agent.aprocess_packed(
+                        *self._window_inputs(sentences, start, end, positions, question))
+                except Exception as e:
+                    # Auth errors and an open circuit fail the window the way
+                    # they fail single calls
+                    packed = [StageResult(success=False, error=f"Selection failed: {e}")
+                              for _ in positions]
+                for i, result in zip(positions, packed):
+                    results[i - start] = result
+            self._time_stage("selection", started, *results, span=span)
+        return results
+
+    def _check_prefilter(
+        self,
+        sentence: SentenceWithContext
+    ) -> Optional[ClaimExtractionResult]:
+        """Return a terminal result if the local prefilter skips the sentence."""
+        if self.prefilter is None:
+            return None
+
+        decision = self.prefilter.check(sentence.text)
+        if not decision.skip:
+            return None
+
+        return ClaimExtractionResult(
+            source_sentence=sentence.text,
+            sentence_id=sentence.sentence_id,
+            status=SentenceStatus.NO_VERIFIABLE_CLAIMS,
+            metadata={
+                "reason": decision.reason,
+                "prefilter_rule": decision.rule
+            }
+        )
+
+    @staticmethod
+    def _prefilter_statistics(sentence_results: List[ClaimExtractionResult]) -> dict:
+        """Count sentences the prefilter skipped, per rule."""
+        by_rule: Dict[str, int] = {}
+        for result in sentence_results:
+            rule = result.metadata.get("prefilter_rule")
+            if rule is not None:
+                by_rule[rule] = by_rule.get(rule, 0) + 1
+
+        skipped = sum(by_rule.values())
+        return {
+            "sentences_skipped": skipped,
+            # Each skipped sentence avoids at least its Selection (or fused) call
+            "llm_calls_saved": skipped,
+            "by_rule": by_rule
+        }
+
+    @staticmethod
+    def _work_key(sentence: SentenceWithContext) -> Tuple[str, str]:
+        """Key of a sentence's work item: the sentence and its effective context."""
+        return (sentence.text, sentence.context)
 
+    @staticmethod
+    async def _shared_result(future: "asyncio.Future") -> ClaimExtractionResult:
+        """Wait for a shared result without letting our cancellation cancel it."""
+        if future.done():
+            return future.result()
+        return await asyncio.shield(future)
+
+    @staticmethod
+    def _cancel_pending(shared: Dict, keys) -> None:
+        """Cancel and forget unfinished shared results after a failure."""
+        for key in keys:
+            future = shared.get(key)
+            if future is not None and not future.done():
+                future.cancel()
+                del shared[key]
+
+    @staticmethod
+    def _duplicate_result(
+        result: ClaimExtractionResult,
+        sentence: SentenceWithContext,
+        marker: str = "deduplicated"
+    ) -> ClaimExtractionResult:
+        """Copy the result of an identical work item to another sentence.
+
+        The copy's metadata has ``marker`` set to True.
+        """
+        metadata = {
+            key: value for key, value in result.metadata.items()
+            if key not in _PER_SENTENCE_METADATA
+        }
+        metadata[marker] = True
+        return ClaimExtractionResult(
+            source_sentence=sentence.text,
+            sentence_id=sentence.sentence_id,
+            status=result.status,
+            claims=[
+                Claim(
+                    text=claim.text,
+                    source_sentence_id=sentence.sentence_id,
+                    confidence=claim.confidence
+                )
+                for claim in result.claims
+            ],
+            metadata=metadata
+        )
+
+    def _deduplication_statistics(
+        self,
+        sentence_results: List[ClaimExtractionResult]
+    ) -> dict:
+        """Count sentences answered from an identical work item."""
+        duplicates = [r for r in sentence_results if r.metadata.get("deduplicated")]
+        return {
+            "duplicate_sentences": len(duplicates),
+            "llm_calls_saved": sum(self._llm_calls(r) for r in duplicates)
+        }
+
+    def _reusable_results(
+        self,
+        sentences: List[SentenceWithContext],
+        previous: Optional[PipelineResult]
+    ) -> Dict[str, ClaimExtractionResult]:
+        """Results of a previous run that still apply, by new sentence_id.
+
+        The previous text is split again with this pipeline's splitter to
+        recover each earlier sentence's context. A sentence is reused if a
+        previous sentence had the same text and context window, wherever it
+        was in the text; failed sentences are always processed again.
+
+        Raises:
+            ValueError: If previous does not match this pipeline's splitting
+                of its own text
+        """
+        if previous is None:
+            return {}
+        old_sentences = self.sentence_splitter.split_and_create_context(
+            previous.text, previous.question)
+        if len(old_sentences) != len(previous.sentence_results):
+            raise ValueError(
+                "previous result does not match this pipeline's sentence splitting "
+                f"({len(previous.sentence_results)} results for "
+                f"{len(old_sentences)} sentences)"
+            )
+
+        old_results: Dict[Tuple[str, str], ClaimExtractionResult] = {}
+        for sentence_obj, result in zip(old_sentences, previous.sentence_results):
+            if result.status != SentenceStatus.PROCESSING_ERROR:
+                old_results.setdefault(self._work_key(sentence_obj), result)
+
+        reused = {}
+        for sentence_obj in sentences:
+            result = old_results.get(self._work_key(sentence_obj))
+            if result is not None:
+                reused[sentence_obj.sentence_id] = self._duplicate_result(
+                    result, sentence_obj, marker="reused")
+        return reused
+
+    def _checkpoint_settings(self) -> Dict[str, Any]:
+        """Settings that shape results and contexts, stored in checkpoint journals."""
+        prefilter = None
+        if self.prefilter is not None:
+            prefilter = {
+                "threshold": self.prefilter.threshold,
+                "rules": [[rule.name, rule.confidence] for rule in self.prefilter.rules],
+            }
+        return {
+            "model": self.model,
+            "temperature": self.temperature,
+            "mode": self.mode,
+            "context_sentences_before": self.sentence_splitter.context_sentences_before,
+            "context_sentences_after": self.sentence_splitter.context_sentences_after,
+            "include_headers": self.sentence_splitter.include_headers,
+            "include_question": self.sentence_splitter.include_question,
+            "prefilter": prefilter,
+        }
+
+    def _start_checkpoint(
+        self,
+        checkpoint: Optional[CheckpointJournal],
+        text: str,
+        question: Optional[str],
+        reused: Dict[str, ClaimExtractionResult],
+        progress_callback: Optional[ProgressCallback]
+    ) -> Optional[ProgressCallback]:
+        """Resume from a checkpoint journal and record results as they finish.
+
+        Results already in the journal are added to ``reused``.
+
+        Returns:
+            The progress callback to use for the run
+        """
+        if checkpoint is None:
+            return progress_callback
+        resumed = checkpoint.start(text, question, self._checkpoint_settings())
+        # Timing and usage describe the run that computed a result
+        for result in resumed.values():
+            result.metadata.pop("timing", None)
+            result.metadata.pop("usage", None)
+        reused.update(resumed)
+
+        def record(result: ClaimExtractionResult, completed: int, total: int) -> None:
+            if result.sentence_id not in resumed:
+                checkpoint.record(result)
+            if progress_callback is not None:
+                progress_callback(result, completed, total)
+
+        return record
+
+    @staticmethod
+    def _window_reused(
+        window: List[SentenceWithContext],
+        reused: Dict[str, ClaimExtractionResult]
+    ) -> bool:
+        """Whether every sentence of a packed window reuses an earlier result."""
+        return all(sentence_obj.sentence_id in reused for sentence_obj in window)
+
+    def _incremental_statistics(
+        self,
+        sentence_results: List[ClaimExtractionResult]
+    ) -> dict:
+        """Count sentences reused from a previous run and those recomputed."""
+        reused = [r for r in sentence_results if r.metadata.get("reused")]
+        return {
+            "reused": len(reused),
+            "recomputed": len(sentence_results) - len(reused),
+            "llm_calls_saved": sum(self._llm_calls(r) for r in reused)
+        }
+
+    def _llm_calls(self, result: ClaimExtractionResult) -> int:
+        """LLM calls that produced a sentence result (at least one for errors)."""
+        if "prefilter_rule" in result.metadata:
+            return 0
+        if self.mode == "fused":
+            return 1
+        if result.status == SentenceStatus.EXTRACTED:
+            return 3
+        if result.status == SentenceStatus.CANNOT_DISAMBIGUATE:
+            return 2
+        return 1
+
+    @staticmethod
+    def _with_retry_metadata(
+        result: ClaimExtractionResult,
+        *stage_results: StageResult
+    ) -> ClaimExtractionResult:
+        """Add the LLM calls' total retries and backoff time to a sentence result.
+
+        The timing of each call is added under ``metadata["timing"]["stages"]``
+        and its token usage under ``metadata["usage"]["stages"]``, next to the
+        sentence's total usage. A packed Selection call that fell back to
+        single calls is recorded under ``metadata["packed_fallback"]``.
+        """
+        call_stats = [r.metadata for r in stage_results if "retries" in r.metadata]
+        for r in stage_results:
+            if "packed_fallback" in r.metadata:
+                result.metadata["packed_fallback"] = r.metadata["packed_fallback"]
+        if call_stats:
+            result.metadata["retries"] = sum(m["retries"] for m in call_stats)
+            result.metadata["backoff_seconds"] = round(
+                sum(m["backoff_seconds"] for m in call_stats), 3)
+        result.metadata["timing"] = {"stages": {
+            r.timing["stage"]: call_timing(
+                r.timing["seconds"],
+                wait_seconds=r.timing.get("wait_seconds", 0.0),
+                attempts=r.timing.get("attempts", 1),
+                cache_hit=r.timing.get("cache_hit", False)
+            )
+            for r in stage_results if "stage" in r.timing
+        }}
+        stage_usage = {
+            r.timing["stage"]: add_usage(empty_usage(), r.usage)
+            for r in stage_results if "stage" in r.timing
+        }
+        total = empty_usage()
+        for usage in stage_usage.values():
+            add_usage(total, usage)
+        result.metadata["usage"] = {**total, "stages": stage_usage}
+        return result
+
+    def _run_span(self, **attributes: Any):
+        """Tracing span of one extraction run."""
+        return start_span(
+            "run", pipeline="claim_extraction", model=self.model, mode=self.mode,
+            scheduler=self.scheduler, **attributes)
+
+    @staticmethod
+    def _end_run_span(span, result: PipelineResult) -> PipelineResult:
+        """Add a run's sentence and claim counts and tokens to its tracing span."""
+        if span.recording:
+            span.set_attributes(
+                sentences=len(result.sentence_results),
+                claims=len(result.get_all_claims()),
+                **usage_totals(result.statistics["usage"])
+            )
+        return result
+
+    def _stage_span(self, stage: str, sentences: List[SentenceWithContext]):
+        """Tracing span of one stage call for one or more sentences."""
+        if not sentences:
+            return NULL_SPAN
+        if len(sentences) == 1:
+            return start_span(
+                "stage", stage=stage, model=self.model, sentence_id=sentences[0].sentence_id)
+        return start_span(
+            "stage", stage=stage, model=self.model,
+            sentence_ids=[sentence.sentence_id for sentence in sentences])
+
+    @staticmethod
+    def _time_stage(
+        stage: str,
+        started: float,
+        *stage_results: Optional[StageResult],
+        span=NULL_SPAN
+    ) -> None:
+        """Record the stage and wall time of a call in its results' timing.
+
+        Results that already carry a wall time (e.g. from an inner packed
+        call) keep it. The call's outcome, attempts and tokens are added to
+        its tracing span.
+        """
+        seconds = time.perf_counter() - started
+        results = [r for r in stage_results if r is not None]
+        for stage_result in results:
+            stage_result.timing.setdefault("stage", stage)
+            stage_result.timing.setdefault("seconds", seconds)
+        if span.recording:
+            usage = empty_usage()
+            for stage_result in results:
+                add_usage(usage, stage_result.usage)
+            errors = [r.error for r in results if not r.success]
+            span.set_attributes(
+                success=not errors,
+                error=errors[0] if errors else None,
+                attempts=sum(r.timing.get("attempts", 1) for r in results),
+                cache_hit=bool(results) and all(r.timing.get("cache_hit") for r in results),
+                **usage
+            )
+
+    @staticmethod
+    def _finish_timing(result: ClaimExtractionResult, started: float) -> None:
+        """Record a sentence's wall time and the part not spent in LLM calls.
+
+        ``queue_seconds`` is the time the sentence waited for a free slot or
+        for a stage worker; stage calls that ran before ``started`` (packed
+        Selection) count towards the wall time.
+        """
+        stages = result.metadata.get("timing", {}).get("stages", {})
+        busy = round(sum(call["seconds"] for call in stages.values()), 4)
+        seconds = max(time.perf_counter() - started, busy)
+        result.metadata["timing"] = {
+            "seconds": round(seconds, 4),
+            "queue_seconds": round(seconds - busy, 4),
+            "stages": stages
+        }
+
+    @staticmethod
+    def _timing_statistics(sentence_results: List[ClaimExtractionResult]) -> dict:
+        """Aggregate the timing of the sentences processed in this run.
+
+        Copies of other results (deduplicated or reused) carry no timing and
+        are not counted. Calls serving several sentences (batches, packed
+        Selection) count once per sentence.
+        """
+        timings = [r.metadata["timing"] for r in sentence_results if "timing" in r.metadata]
+        return {
+            "sentences": summarize_durations(t["seconds"] for t in timings),
+            "queue_seconds": summarize_durations(t["queue_seconds"] for t in timings),
+            "stages": stage_statistics(
+                (stage, call) for t in timings for stage, call in t["stages"].items())
+        }
+
+    def _check_selection(
+        self,
+        sentence: SentenceWithContext,
+        selection_result: StageResult
+    ) -> Optional[ClaimExtractionResult]:
+        """Return a terminal result if the sentence stops after Selection."""
         if not selection_result.success:
             return ClaimExtractionResult(
                 source_sentence=sentence.text,
@@ -165,19 +1488,26 @@ class ClaimExtractionPipeline:
                 }
             )
 
-        # Use rewritten sentence if available, otherwise original
-        sentence_to_process = (
+        return None
+
+    @staticmethod
+    def _selected_sentence(
+        sentence: SentenceWithContext,
+        selection_data: SelectionResult
+    ) -> str:
+        """Use rewritten sentence if available, otherwise original."""
+        return (
             selection_data.rewritten_sentence
             if selection_data.rewritten_sentence
             else sentence.text
         )
 
-        # Stage 3: Disambiguation
-        disambiguation_result = self.disambiguation_agent.process(
-            sentence_to_process,
-            sentence.context
-        )
-
+    def _check_disambiguation(
+        self,
+        sentence: SentenceWithContext,
+        disambiguation_result: StageResult
+    ) -> Optional[ClaimExtractionResult]:
+        """Return a terminal result if the sentence stops after Disambiguation."""
         if not disambiguation_result.success:
             return ClaimExtractionResult(
                 source_sentence=sentence.text,
@@ -199,19 +1529,28 @@ class ClaimExtractionPipeline:
                 }
             )
 
-        # Use disambiguated sentence if available
-        final_sentence = (
+        return None
+
+    @staticmethod
+    def _disambiguated_sentence(
+        sentence_to_process: str,
+        disambiguation_data: DisambiguationResult
+    ) -> str:
+        """Use disambiguated sentence if available."""
+        return (
             disambiguation_data.disambiguated_sentence
             if disambiguation_data.disambiguated_sentence
             else sentence_to_process
         )
 
-        # Stage 4: Decomposition (Claim extraction)
-        decomposition_result = self.decomposition_agent.process(
-            final_sentence,
-            sentence.context
-        )
-
+    def _finalize(
+        self,
+        sentence: SentenceWithContext,
+        selection_data: SelectionResult,
+        disambiguation_data: DisambiguationResult,
+        decomposition_result: StageResult
+    ) -> ClaimExtractionResult:
+        """Build the final result from the Decomposition stage output."""
         if not decomposition_result.success:
             return ClaimExtractionResult(
                 source_sentence=sentence.text,
@@ -270,3 +1609,4 @@ class ClaimExtractionPipeline:
 
         if stats['processing_error'] > 0:
             self.console.print(f"🔴 Errors: {stats['processing_error']}")
+        self.console.print(f"🔢 Tokens: {format_usage(result.statistics['usage'])}")
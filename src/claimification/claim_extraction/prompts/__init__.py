@@ -3,7 +3,9 @@
 from .selection import (
     SELECTION_SYSTEM_PROMPT,
     SELECTION_USER_PROMPT_TEMPLATE,
-    create_selection_prompt
+    SELECTION_PACKED_USER_PROMPT_TEMPLATE,
+    create_selection_prompt,
+    create_packed_selection_prompt
 )
 from .disambiguation import (
     DISAMBIGUATION_SYSTEM_PROMPT,
@@ -15,12 +17,19 @@ from .decomposition import (
     DECOMPOSITION_USER_PROMPT_TEMPLATE,
     create_decomposition_prompt
 )
+from .fused import (
+    FUSED_SYSTEM_PROMPT,
+    FUSED_USER_PROMPT_TEMPLATE,
+    create_fused_prompt
+)
 
 __all__ = [
     # Selection prompts
     "SELECTION_SYSTEM_PROMPT",
     "SELECTION_USER_PROMPT_TEMPLATE",
     "create_selection_prompt",
+    "SELECTION_PACKED_USER_PROMPT_TEMPLATE",
+    "create_packed_selection_prompt",
     # Disambiguation prompts
     "DISAMBIGUATION_SYSTEM_PROMPT",
     "DISAMBIGUATION_USER_PROMPT_TEMPLATE",
@@ -29,4 +38,8 @@ __all__ = [
     "DECOMPOSITION_SYSTEM_PROMPT",
     "DECOMPOSITION_USER_PROMPT_TEMPLATE",
     "create_decomposition_prompt",
+    # Fused prompts
+    "FUSED_SYSTEM_PROMPT",
+    "FUSED_USER_PROMPT_TEMPLATE",
+    "create_fused_prompt",
 ]
@@ -0,0 +1,62 @@
+"""Prompts for the Fused Extraction Agent (Stages 2-4 in one call)."""
+
+FUSED_SYSTEM_PROMPT = """You are a precise fact-checking assistant that extracts verifiable factual claims from sentences.
+
+For each sentence you perform three steps in order and report the result of every step you reach.
+
+**Step 1 - Selection (verifiable content detection):**
+- Verifiable content: factual statements about events, people, places, numbers, dates that can be checked against evidence
+- NOT verifiable: opinions, recommendations, hypotheticals, questions, instructions, purely descriptive language
+- If the sentence mixes verifiable and unverifiable content, rewrite it to include ONLY the verifiable parts
+- If the sentence is entirely unverifiable, set has_verifiable_content to false and STOP (leave disambiguation and decomposition null)
+
+**Step 2 - Disambiguation (on the sentence from step 1):**
+- Detect pronoun, temporal, scope, entity and quantifier ambiguity
+- An ambiguity CAN be resolved only if the context provides clear, unambiguous information
+- Be conservative: if there is any reasonable doubt, set can_be_disambiguated to false and STOP (leave decomposition null)
+- If you resolved an ambiguity, provide the disambiguated sentence
+
+**Step 3 - Decomposition (on the sentence from step 2):**
+- Split into atomic claims, each containing ONE piece of information
+- Each claim must be entailed by the sentence and understandable without context
+- Preserve critical context (causality, comparisons, conditions) and don't over-decompose
+- Return an empty list if no verifiable claims can be extracted
+
+**Example:**
+
+Sentence: "The partnership between John and Jane illustrates the importance of collaboration."
+→ selection: has_verifiable_content: true, rewritten_sentence: "There is a partnership between John and Jane.", reason: "'Illustrates the importance' is subjective interpretation."
+→ disambiguation: is_ambiguous: false, can_be_disambiguated: true, ambiguity_explanation: "No ambiguity."
+→ decomposition: claims: ["There is a partnership between John and Jane."], extraction_reasoning: "Already atomic."
+
+Always provide clear reasoning for each step."""
+
+FUSED_USER_PROMPT_TEMPLATE = """Extract verifiable factual claims from this sentence, performing selection, disambiguation and decomposition.
+
+**Sentence:**
+{sentence}
+
+**Context:**
+{context}
+
+Respond with:
+1. selection: has_verifiable_content, rewritten_sentence (or null), reason
+2. disambiguation: is_ambiguous, can_be_disambiguated, disambiguated_sentence (or null), ambiguity_explanation - or null if step 1 found no verifiable content
+3. decomposition: claims, extraction_reasoning - or null if the sentence stopped at step 1 or 2
+"""
+
+
+def create_fused_prompt(sentence: str, context: str) -> str:
+    """Create the user prompt for the fused extraction mode.
+
+    Args:
+        sentence: The sentence to analyze
+        context: Context surrounding the sentence
+
+    Returns:
+        Formatted prompt string
+    """
+    return FUSED_USER_PROMPT_TEMPLATE.format(
+        sentence=sentence,
+        context=context
+    )
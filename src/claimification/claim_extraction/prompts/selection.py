@@ -67,3 +67,40 @@ def create_selection_prompt(sentence: str, context: str) -> str:
         sentence=sentence,
         context=context
     )
+
+
+SELECTION_PACKED_USER_PROMPT_TEMPLATE = """Analyze each of the following sentences and determine if it contains verifiable content.
+
+Judge every sentence on its own. The sentences are consecutive, so each one is also context for the others.
+
+**Sentences:**
+{sentences}
+
+**Context:**
+{context}
+
+Return exactly one result per sentence, using the sentence ID shown in brackets. For each sentence respond with:
+1. sentence_id: the ID of the sentence
+2. has_verifiable_content: true/false
+3. rewritten_sentence: if the sentence has partial verifiable content, provide the rewritten version with ONLY verifiable content. Otherwise, leave null.
+4. reason: Clear explanation of your decision
+"""
+
+
+def create_packed_selection_prompt(sentences: list[tuple[str, str]], context: str) -> str:
+    """Create the user prompt for a packed Selection call.
+
+    Args:
+        sentences: List of (sentence_id, sentence) tuples to analyze together
+        context: Context shared by all sentences in the window
+
+    Returns:
+        Formatted prompt string
+    """
+    sentence_lines = "\n".join(
+        f"[{sentence_id}] {sentence}" for sentence_id, sentence in sentences
+    )
+    return SELECTION_PACKED_USER_PROMPT_TEMPLATE.format(
+        sentences=sentence_lines,
+        context=context
+    )
@@ -0,0 +1,285 @@
+"""Stage-wavefront scheduler for the claim extraction pipeline.
+
+Instead of sending each sentence depth-first through Selection ->
+Disambiguation -> Decomposition, the scheduler runs every stage as its own
+pool of workers fed by a queue. All sentences enter the Selection queue at
+once; survivors are pushed to the Disambiguation queue as soon as their
+Selection call finishes, and so on. Each stage has its own concurrency limit
+and can group queued items into batched LLM calls. When Selection packing is
+enabled, the Selection queue holds windows of consecutive sentences that are
+classified in one packed call each.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set
+
+from ..utils.hooks import NULL_SPAN
+from .models import (
+    SentenceWithContext,
+    ClaimExtractionResult,
+    SelectionResult,
+    DisambiguationResult,
+    StageResult
+)
+
+if TYPE_CHECKING:
+    from .pipeline import ClaimExtractionPipeline
+
+
+STAGES = ("selection", "disambiguation", "decomposition")
+
+
+@dataclass
+class _WorkItem:
+    """A sentence moving through the stage queues."""
+    index: int
+    sentence: SentenceWithContext
+    selection_data: Optional[SelectionResult] = None
+    sentence_to_process: Optional[str] = None
+    disambiguation_data: Optional[DisambiguationResult] = None
+    final_sentence: Optional[str] = None
+    stage_results: List[StageResult] = field(default_factory=list)
+
+
+class WavefrontScheduler:
+    """Runs the LLM stages as concurrent waves connected by queues."""
+
+    def __init__(
+        self,
+        pipeline: "ClaimExtractionPipeline",
+        stage_concurrency: Optional[Dict[str, int]] = None,
+        batch_size: int = 1
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            pipeline: Pipeline providing the agents and result helpers
+            stage_concurrency: Number of workers per stage, keyed by
+                "selection", "disambiguation" and "decomposition"
+                (default: the pipeline's max_concurrency for every stage)
+            batch_size: Maximum number of queued items a worker sends in one
+                ``aprocess_batch`` call (1 = one ``aprocess`` call per item)
+        """
+        unknown = set(stage_concurrency or {}) - set(STAGES)
+        if unknown:
+            raise ValueError(f"Unknown stages in stage_concurrency: {sorted(unknown)}")
+        if any(workers < 1 for workers in (stage_concurrency or {}).values()):
+            raise ValueError("stage_concurrency values must be at least 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.pipeline = pipeline
+        self.stage_concurrency = {
+            stage: (stage_concurrency or {}).get(stage, pipeline.max_concurrency)
+            for stage in STAGES
+        }
+        self.batch_size = batch_size
+
+    async def run(
+        self,
+        sentences: List[SentenceWithContext],
+        question: Optional[str] = None,
+        on_result: Optional[Callable[[ClaimExtractionResult], None]] = None,
+        owned: Optional[Set[str]] = None
+    ) -> List[Optional[ClaimExtractionResult]]:
+        """Process the sentences and return results in sentence order.
+
+        Args:
+            sentences: All sentences of the document, in order
+            question: Optional question, used for packed Selection context
+            on_result: Optional callback invoked as each sentence finishes
+            owned: IDs of the sentences to process (default: all). The
+                others are only used as neighbours, so packed Selection
+                windows follow the sentences' real document positions.
+
+        Returns:
+            One entry per input sentence; None for sentences not processed
+        """
+        results: List[Optional[ClaimExtractionResult]] = [None] * len(sentences)
+        work_items = [
+            _WorkItem(index=index, sentence=sentence)
+            for index, sentence in enumerate(sentences)
+            if owned is None or sentence.sentence_id in owned
+        ]
+        if not work_items:
+            return results
+
+        queues = {stage: asyncio.Queue() for stage in STAGES}
+        remaining = len(work_items)
+        done = asyncio.Event()
+        # Sentences wait in the stage queues from the start of the run
+        started = time.perf_counter()
+
+        def finish(item: _WorkItem, result: ClaimExtractionResult) -> None:
+            nonlocal remaining
+            self.pipeline._finish_timing(result, started)
+            results[item.index] = result
+            remaining -= 1
+            if on_result is not None:
+                on_result(result)
+            if remaining == 0:
+                done.set()
+
+        handlers = {
+            "selection": self._after_selection,
+            "disambiguation": self._after_disambiguation,
+            "decomposition": self._after_decomposition,
+        }
+        next_stage = {"selection": "disambiguation", "disambiguation": "decomposition"}
+
+        # Queue entries are groups of items: packing windows for Selection,
+        # single items otherwise
+        async def worker(stage: str) -> None:
+            queue = queues[stage]
+            while True:
+                groups = [await queue.get()]
+                while len(groups) < self.batch_size and not queue.empty():
+                    groups.append(queue.get_nowait())
+                items = [item for group in groups for item in group]
+
+                call_started = time.perf_counter()
+                # Packed windows report their own stage spans
+                packed = stage == "selection" and self.pipeline.selection_pack_size > 1
+                span = NULL_SPAN if packed else self.pipeline._stage_span(
+                    stage, [item.sentence for item in items])
+                with span:
+                    try:
+                        if packed:
+                            bounds = [self._window_bounds(group[0].index, len(sentences))
+                                      for group in groups]
+                            windows = await asyncio.gather(*(
+                                self.pipeline._aselect_window(
+                                    sentences, start, end, question, owned)
+                                for start, end in bounds
+                            ))
+                            # Windows are aligned to the full index range; pick
+                            # the entries for the items actually queued
+                            stage_results = [
+                                window[item.index - start]
+                                for group, (start, _), window in zip(groups, bounds, windows)
+                                for item in group
+                            ]
+                        else:
+                            stage_results = await self._run_stage(stage, items)
+                    except Exception as e:
+                        # Never let a worker die: that would stall the whole run
+                        stage_results = [
+                            StageResult(success=False, error=f"{stage.capitalize()} failed: {e}")
+                            for _ in items
+                        ]
+                    self.pipeline._time_stage(
+                        stage, call_started, *stage_results, span=span)
+
+                for item, stage_result in zip(items, stage_results):
+                    item.stage_results.append(stage_result)
+                    terminal = handlers[stage](item, stage_result)
+                    if terminal is not None:
+                        finish(item, self.pipeline._with_retry_metadata(
+                            terminal, *item.stage_results))
+                    else:
+                        queues[next_stage[stage]].put_nowait([item])
+
+        # Prefiltered sentences finish immediately and never enter a queue
+        pending = []
+        for item in work_items:
+            prefiltered = self.pipeline._check_prefilter(item.sentence)
+            if prefiltered is not None:
+                finish(item, prefiltered)
+            else:
+                pending.append(item)
+        if remaining == 0:
+            return results
+
+        for start, end in self.pipeline._pack_windows(sentences):
+            window = [item for item in pending if start <= item.index < end]
+            if not window:
+                continue
+            queues["selection"].put_nowait(window)
+
+        workers = [
+            asyncio.create_task(worker(stage))
+            for stage in STAGES
+            for _ in range(self.stage_concurrency[stage])
+        ]
+        # Workers only stop by raising (e.g. from on_result); surface that
+        # error instead of waiting for sentences that will never finish
+        waiter = asyncio.ensure_future(done.wait())
+        try:
+            await asyncio.wait([waiter, *workers], return_when=asyncio.FIRST_COMPLETED)
+            for task in workers:
+                if task.done() and not task.cancelled() and task.exception() is not None:
+                    raise task.exception()
+        finally:
+            for task in [waiter, *workers]:
+                task.cancel()
+            await asyncio.gather(waiter, *workers, return_exceptions=True)
+
+        return results
+
+    def _window_bounds(self, index: int, total: int) -> tuple:
+        """(start, end) of the packing window containing a sentence index."""
+        size = self.pipeline.selection_pack_size
+        start = index - index % size
+        return start, min(start + size, total)
+
+    async def _run_stage(self, stage: str, items: List[_WorkItem]) -> List[StageResult]:
+        """Call the stage's agent for a group of queued items."""
+        agent = {
+            "selection": self.pipeline.selection_agent,
+            "disambiguation": self.pipeline.disambiguation_agent,
+            "decomposition": self.pipeline.decomposition_agent,
+        }[stage]
+        inputs = [
+            (self._stage_input(stage, item), item.sentence.context)
+            for item in items
+        ]
+
+        if len(inputs) == 1:
+            return [await agent.aprocess(*inputs[0])]
+        return await agent.aprocess_batch(inputs, max_concurrency=len(inputs))
+
+    @staticmethod
+    def _stage_input(stage: str, item: _WorkItem) -> str:
+        """Sentence text sent to a given stage."""
+        if stage == "selection":
+            return item.sentence.text
+        if stage == "disambiguation":
+            return item.sentence_to_process
+        return item.final_sentence
+
+    def _after_selection(
+        self,
+        item: _WorkItem,
+        stage_result: StageResult
+    ) -> Optional[ClaimExtractionResult]:
+        """Record Selection output; return a result if the sentence stops here."""
+        terminal = self.pipeline._check_selection(item.sentence, stage_result)
+        if terminal is None:
+            item.selection_data = stage_result.data
+            item.sentence_to_process = self.pipeline._selected_sentence(
+                item.sentence, item.selection_data)
+        return terminal
+
+    def _after_disambiguation(
+        self,
+        item: _WorkItem,
+        stage_result: StageResult
+    ) -> Optional[ClaimExtractionResult]:
+        """Record Disambiguation output; return a result if the sentence stops here."""
+        terminal = self.pipeline._check_disambiguation(item.sentence, stage_result)
+        if terminal is None:
+            item.disambiguation_data = stage_result.data
+            item.final_sentence = self.pipeline._disambiguated_sentence(
+                item.sentence_to_process, item.disambiguation_data)
+        return terminal
+
+    def _after_decomposition(
+        self,
+        item: _WorkItem,
+        stage_result: StageResult
+    ) -> ClaimExtractionResult:
+        """Build the final result from the Decomposition output."""
+        return self.pipeline._finalize(
+            item.sentence, item.selection_data, item.disambiguation_data, stage_result)
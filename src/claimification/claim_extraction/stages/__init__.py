@@ -1,13 +1,19 @@
 """Pipeline stages for claim extraction."""
 
 from .sentence_splitter import SentenceSplitter
+from .prefilter import SentencePrefilter, PrefilterRule, PrefilterDecision
 from .selection_agent import SelectionAgent
 from .disambiguation_agent import DisambiguationAgent
 from .decomposition_agent import DecompositionAgent
+from .fused_agent import FusedExtractionAgent
 
 __all__ = [
     "SentenceSplitter",
+    "SentencePrefilter",
+    "PrefilterRule",
+    "PrefilterDecision",
     "SelectionAgent",
     "DisambiguationAgent",
     "DecompositionAgent",
+    "FusedExtractionAgent",
 ]
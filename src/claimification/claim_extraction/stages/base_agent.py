@@ -0,0 +1,422 @@
+"""Shared execution logic for the LLM-backed claim extraction agents.
+
+The Selection, Disambiguation and Decomposition agents only differ in their
+prompts and output schema. This module holds the common sync/async
+invocation code so each agent only has to describe what it asks the LLM.
+Responses are served from the persistent response cache when enabled, and
+the token usage of every call is recorded on its StageResult. Requests,
+retries and cache lookups are reported to the tracing hooks.
+"""
+
+import asyncio
+import time
+from typing import Any, Optional, Type
+from langchain_core.callbacks import UsageMetadataCallbackHandler
+from pydantic import BaseModel
+
+from ...utils.cache import get_response_cache
+from ...utils.hooks import emit, llm_span
+from ...utils.invocation import request_cache_key
+from ...utils.llm_clients import provider_for_model
+from ...utils.rate_limiter import RateLimiter, estimate_tokens, get_rate_limiter
+from ...utils.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    RetryState,
+    acall_with_retry,
+    call_with_retry,
+    get_circuit_breaker
+)
+from ...utils.usage import callback_usage, usage_callback
+from ..models import StageResult
+
+
+# Default number of parallel LLM calls for process_batch/aprocess_batch
+DEFAULT_BATCH_CONCURRENCY = 8
+
+
+class BaseAgent:
+    """Base class for agents that call a structured-output LLM chain.
+
+    Subclasses must set ``result_model`` and ``stage_name`` and define
+    ``self.prompt``, ``self.structured_llm`` and ``self.max_retries`` in
+    their ``__init__``.
+    """
+
+    result_model: Type[BaseModel]
+    stage_name: str
+    # Overrides the default RetryPolicy(max_attempts=max_retries)
+    retry_policy: Optional[RetryPolicy] = None
+
+    def _create_user_prompt(self, sentence: str, context: str) -> str:
+        """Create the user prompt for this stage."""
+        raise NotImplementedError
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """The process-wide rate limiter for this agent's provider and model."""
+        return get_rate_limiter(provider_for_model(self.model_name), self.model_name)
+
+    def _request_tokens(self, user_prompt: str) -> int:
+        """Estimate the tokens one call counts against a tokens-per-minute limit."""
+        return estimate_tokens(self.prompt.format(user_prompt=user_prompt)) + self.max_tokens
+
+    def _build_chain(self):
+        """Create the prompt | structured LLM chain."""
+        return self.prompt | self.structured_llm
+
+    def _coerce_result(self, result: Any) -> BaseModel:
+        """Convert a dict result to the stage's result model if needed."""
+        if isinstance(result, dict):
+            result = self.result_model(**result)
+        return result
+
+    def _error_result(
+        self,
+        error: Exception,
+        state: Optional[RetryState] = None,
+        usage: Optional[UsageMetadataCallbackHandler] = None
+    ) -> StageResult:
+        """Wrap an exception in a failed StageResult.
+
+        Failed attempts may still have used tokens, which are kept.
+        """
+        return StageResult(
+            success=False,
+            error=f"{self.stage_name} failed: {str(error)}",
+            metadata=state.as_metadata() if state is not None else {},
+            timing=state.as_timing() if state is not None else {},
+            usage=callback_usage(usage) if usage is not None else {}
+        )
+
+    def _retry_policy(self) -> RetryPolicy:
+        """The agent's retry policy (``retry_policy`` or one built from max_retries)."""
+        return self.retry_policy or RetryPolicy(max_attempts=self.max_retries)
+
+    def _cache_key(
+        self,
+        user_prompt: str,
+        output_model: Optional[Type[BaseModel]] = None
+    ) -> Optional[str]:
+        """Response cache key of one call (None if caching is disabled)."""
+        if get_response_cache() is None:
+            return None
+        messages = [
+            (message.type, message.content)
+            for message in self.prompt.format_messages(user_prompt=user_prompt)
+        ]
+        return request_cache_key(
+            self.model_name,
+            self.temperature,
+            messages,
+            output_model or self.result_model
+        )
+
+    def _cached_result(self, key: Optional[str]) -> Optional[StageResult]:
+        """The cached StageResult for key, or None on a miss."""
+        cache = get_response_cache()
+        if key is None or cache is None:
+            return None
+        data = cache.get_model(key, self.result_model)
+        self._report_cache(data is not None)
+        if data is None:
+            return None
+        return StageResult(
+            success=True,
+            data=data,
+            metadata={"cache_hit": True},
+            timing={"attempts": 0, "wait_seconds": 0.0, "cache_hit": True}
+        )
+
+    def _report_cache(self, hit: bool, tier: str = "exact") -> None:
+        """Report a response cache lookup to the tracing hooks."""
+        emit("cache_hit" if hit else "cache_miss",
+             agent=self.stage_name, model=self.model_name, tier=tier)
+
+    @staticmethod
+    def _store_result(key: Optional[str], data: Any) -> None:
+        """Store a fresh response in the cache (if caching is on)."""
+        cache = get_response_cache()
+        if key is not None and cache is not None:
+            cache.set_model(key, data)
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        """The process-wide circuit breaker for this agent's provider."""
+        return get_circuit_breaker(provider_for_model(self.model_name))
+
+    def process(self, sentence: str, context: str) -> StageResult:
+        """Process a sentence through this stage.
+
+        Failed calls are retried according to the agent's RetryPolicy; the
+        returned metadata records retries and backoff time, and its timing
+        the attempts and rate-limit wait.
+
+        Args:
+            sentence: The sentence to analyze
+            context: Context surrounding the sentence
+
+        Returns:
+            StageResult containing the stage's result model or error
+        """
+        state = RetryState()
+        usage = usage_callback()
+        try:
+            user_prompt = self._create_user_prompt(sentence, context)
+            key = self._cache_key(user_prompt)
+            cached = self._cached_result(key)
+            if cached is not None:
+                return cached
+            chain = self._build_chain()
+
+            def attempt():
+                state.wait_seconds += self.rate_limiter.acquire(
+                    self._request_tokens(user_prompt))
+                with llm_span([usage], agent=self.stage_name, model=self.model_name,
+                              attempt=state.attempts):
+                    return self._coerce_result(chain.invoke(
+                        {"user_prompt": user_prompt}, config={"callbacks": [usage]}))
+
+            data = call_with_retry(
+                attempt, self._retry_policy(), self.circuit_breaker, state)
+            self._store_result(key, data)
+            return StageResult(
+                success=True,
+                data=data,
+                metadata=state.as_metadata(),
+                timing=state.as_timing(),
+                usage=callback_usage(usage)
+            )
+
+        except Exception as e:
+            return self._error_result(e, state, usage)
+
+    async def aprocess(self, sentence: str, context: str) -> StageResult:
+        """Asynchronously process a sentence through this stage.
+
+        Uses the chain's ``ainvoke`` so many sentences can be awaited
+        concurrently without blocking on network round-trips.
+
+        Args:
+            sentence: The sentence to analyze
+            context: Context surrounding the sentence
+
+        Returns:
+            StageResult containing the stage's result model or error
+        """
+        state = RetryState()
+        usage = usage_callback()
+        try:
+            user_prompt = self._create_user_prompt(sentence, context)
+            key = self._cache_key(user_prompt)
+            cached = self._cached_result(key)
+            if cached is not None:
+                return cached
+            chain = self._build_chain()
+
+            async def attempt():
+                state.wait_seconds += await self.rate_limiter.aacquire(
+                    self._request_tokens(user_prompt))
+                with llm_span([usage], agent=self.stage_name, model=self.model_name,
+                              attempt=state.attempts):
+                    return self._coerce_result(await chain.ainvoke(
+                        {"user_prompt": user_prompt}, config={"callbacks": [usage]}))
+
+            data = await acall_with_retry(
+                attempt, self._retry_policy(), self.circuit_breaker, state)
+            self._store_result(key, data)
+            return StageResult(
+                success=True,
+                data=data,
+                metadata=state.as_metadata(),
+                timing=state.as_timing(),
+                usage=callback_usage(usage)
+            )
+
+        except Exception as e:
+            return self._error_result(e, state, usage)
+
+    def process_batch(
+        self,
+        sentences_with_context: list[tuple[str, str]],
+        max_concurrency: Optional[int] = None
+    ) -> list[StageResult]:
+        """Process multiple sentences in batch.
+
+        Uses the chain's native ``batch`` so requests run concurrently.
+        Failures are isolated per item: an item the retry policy gives up on
+        gets a failed StageResult while the other items succeed normally.
+        Retried items are sent again together after the longest backoff
+        any of them needs.
+
+        Args:
+            sentences_with_context: List of (sentence, context) tuples
+            max_concurrency: Maximum number of parallel LLM calls
+                (default: DEFAULT_BATCH_CONCURRENCY)
+
+        Returns:
+            List of StageResult objects, in input order
+        """
+        chain = self._build_chain()
+        inputs, results, keys = self._prepare_batch(sentences_with_context)
+        states = [RetryState() for _ in sentences_with_context]
+        usages = [usage_callback() for _ in sentences_with_context]
+        config = {"max_concurrency": max_concurrency or DEFAULT_BATCH_CONCURRENCY}
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        while pending:
+            if not self._batch_allowed(pending, results, states, usages):
+                break
+            for i in pending:
+                states[i].wait_seconds += self.rate_limiter.acquire(
+                    self._request_tokens(inputs[i]["user_prompt"]))
+                states[i].attempts += 1
+            with self._batch_span(pending, usages):
+                outputs = chain.batch(
+                    [inputs[i] for i in pending],
+                    config=[{**config, "callbacks": [usages[i]]} for i in pending],
+                    return_exceptions=True
+                )
+            pending, delay = self._collect_batch(
+                pending, outputs, results, states, usages, keys)
+            if pending and delay > 0:
+                time.sleep(delay)
+
+        return results
+
+    async def aprocess_batch(
+        self,
+        sentences_with_context: list[tuple[str, str]],
+        max_concurrency: Optional[int] = None
+    ) -> list[StageResult]:
+        """Asynchronously process multiple sentences in batch.
+
+        Async counterpart of ``process_batch`` built on the chain's ``abatch``.
+
+        Args:
+            sentences_with_context: List of (sentence, context) tuples
+            max_concurrency: Maximum number of parallel LLM calls
+                (default: DEFAULT_BATCH_CONCURRENCY)
+
+        Returns:
+            List of StageResult objects, in input order
+        """
+        chain = self._build_chain()
+        inputs, results, keys = self._prepare_batch(sentences_with_context)
+        states = [RetryState() for _ in sentences_with_context]
+        usages = [usage_callback() for _ in sentences_with_context]
+        config = {"max_concurrency": max_concurrency or DEFAULT_BATCH_CONCURRENCY}
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        while pending:
+            if not self._batch_allowed(pending, results, states, usages):
+                break
+            for i in pending:
+                states[i].wait_seconds += await self.rate_limiter.aacquire(
+                    self._request_tokens(inputs[i]["user_prompt"]))
+                states[i].attempts += 1
+            with self._batch_span(pending, usages):
+                outputs = await chain.abatch(
+                    [inputs[i] for i in pending],
+                    config=[{**config, "callbacks": [usages[i]]} for i in pending],
+                    return_exceptions=True
+                )
+            pending, delay = self._collect_batch(
+                pending, outputs, results, states, usages, keys)
+            if pending and delay > 0:
+                await asyncio.sleep(delay)
+
+        return results
+
+    def _prepare_batch(
+        self,
+        sentences_with_context: list[tuple[str, str]]
+    ) -> tuple[dict[int, dict], list[Optional[StageResult]], dict[int, Optional[str]]]:
+        """Build chain inputs and cache keys for a batch.
+
+        Items whose prompt cannot be built fail, and cached items are
+        answered right away; only the remaining items have no result.
+        """
+        inputs: dict[int, dict] = {}
+        keys: dict[int, Optional[str]] = {}
+        results: list[Optional[StageResult]] = [None] * len(sentences_with_context)
+        for i, (sentence, context) in enumerate(sentences_with_context):
+            try:
+                inputs[i] = {"user_prompt": self._create_user_prompt(sentence, context)}
+                keys[i] = self._cache_key(inputs[i]["user_prompt"])
+                results[i] = self._cached_result(keys[i])
+            except Exception as e:
+                results[i] = self._error_result(e)
+        return inputs, results, keys
+
+    def _batch_span(self, pending: list[int], usages: list[UsageMetadataCallbackHandler]):
+        """Tracing span of one batched round of requests."""
+        return llm_span([usages[i] for i in pending], agent=self.stage_name,
+                        model=self.model_name, items=len(pending))
+
+    def _batch_allowed(
+        self,
+        pending: list[int],
+        results: list[Optional[StageResult]],
+        states: list[RetryState],
+        usages: list[UsageMetadataCallbackHandler]
+    ) -> bool:
+        """Check the circuit breaker; fail all pending items if it is open."""
+        try:
+            self.circuit_breaker.before_call()
+            return True
+        except CircuitOpenError as e:
+            for i in pending:
+                results[i] = self._error_result(e, states[i], usages[i])
+            return False
+
+    def _collect_batch(
+        self,
+        pending: list[int],
+        outputs: list[Any],
+        results: list[Optional[StageResult]],
+        states: list[RetryState],
+        usages: list[UsageMetadataCallbackHandler],
+        keys: dict[int, Optional[str]]
+    ) -> tuple[list[int], float]:
+        """Store batch outputs (and cache them) and decide which items to retry.
+
+        Returns:
+            Indices to retry and the seconds to wait before retrying them
+        """
+        policy = self._retry_policy()
+        breaker = self.circuit_breaker
+        retry: list[int] = []
+        delay = 0.0
+        for i, output in zip(pending, outputs):
+            if not isinstance(output, Exception):
+                try:
+                    data = self._coerce_result(output)
+                    breaker.record_success()
+                    self._store_result(keys[i], data)
+                    results[i] = StageResult(
+                        success=True,
+                        data=data,
+                        metadata=states[i].as_metadata(),
+                        timing=states[i].as_timing(),
+                        usage=callback_usage(usages[i])
+                    )
+                    continue
+                except Exception as e:
+                    output = e
+            item_delay = policy.next_delay(output, states[i])
+            breaker.record_failure(states[i].last_error_kind)
+            if item_delay is None:
+                results[i] = self._error_result(output, states[i], usages[i])
+            else:
+                emit("retry", agent=self.stage_name, item=i, attempt=states[i].attempts,
+                     error_kind=states[i].last_error_kind.value,
+                     error=f"{type(output).__name__}: {output}")
+                retry.append(i)
+                delay = max(delay, item_delay)
+
+        # Retried items all wait for the shared backoff
+        for i in retry:
+            states[i].backoff_seconds += delay
+        return retry, delay
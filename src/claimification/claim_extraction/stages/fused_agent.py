@@ -0,0 +1,60 @@
+"""Stages 2-4 fused: Fused Extraction Agent.
+
+This agent runs Selection, Disambiguation and Decomposition in a single
+LLM call, trading some accuracy for one round-trip per sentence.
+"""
+
+from typing import Optional
+from langchain_core.prompts import ChatPromptTemplate
+
+from ..models import FusedExtractionResult
+from ..prompts.fused import (
+    FUSED_SYSTEM_PROMPT,
+    create_fused_prompt
+)
+from ...utils.llm_clients import get_chat_model
+from .base_agent import BaseAgent
+
+
+class FusedExtractionAgent(BaseAgent):
+    """Agent for running all claim extraction stages in one call."""
+
+    result_model = FusedExtractionResult
+    stage_name = "Fused extraction"
+
+    def __init__(
+        self,
+        model: str = "gpt-5-nano-2025-08-07",
+        temperature: float = 0.0,
+        max_tokens: int = 2000,
+        max_retries: int = 3
+    ):
+        """Initialize the Fused Extraction Agent.
+
+        Args:
+            model: LLM model to use (e.g., "gpt-5-nano-2025-08-07", "claude-3-5-sonnet-20241022")
+            temperature: Temperature for LLM (0.0 for deterministic)
+            max_tokens: Maximum tokens for response
+            max_retries: Maximum number of retries on failure
+        """
+        self.model_name = model
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.max_retries = max_retries
+
+        # Shared client for this configuration (see utils.llm_clients)
+        self.llm = get_chat_model(model, temperature, max_tokens)
+
+        # Create structured output LLM
+        self.structured_llm = self.llm.with_structured_output(
+            FusedExtractionResult)
+
+        # Create prompt template
+        self.prompt = ChatPromptTemplate.from_messages([
+            ("system", FUSED_SYSTEM_PROMPT),
+            ("user", "{user_prompt}")
+        ])
+
+    def _create_user_prompt(self, sentence: str, context: str) -> str:
+        """Create the user prompt for the fused stages."""
+        return create_fused_prompt(sentence, context)
@@ -0,0 +1,236 @@
+"""Stage 1.5: Local Prefilter - Obvious Non-Claim Detection.
+
+Cheap, rule-based check that runs between sentence splitting and the
+Selection agent. Sentences that are obviously unverifiable (questions,
+markdown headers, one-word bullets, boilerplate) are marked as having no
+verifiable claims without spending an LLM call.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Union
+
+
+# Confidence a rule must reach to skip a sentence
+STRICTNESS_THRESHOLDS = {
+    "strict": 0.9,
+    "lenient": 0.6,
+}
+
+BOILERPLATE_PATTERNS = [
+    r"^let me know if\b",
+    r"^(i )?hope (this|that) helps\b",
+    r"^feel free to\b",
+    r"^(please )?don'?t hesitate to\b",
+    r"^(i'?m |i am )?happy to help\b",
+    r"^is there anything else\b",
+    r"^thanks?( you)? for (asking|reading|your question)\b",
+    r"^(sure|certainly|of course|great question)[!.,]",
+]
+
+IMPERATIVE_VERBS = {
+    "consider", "make", "ensure", "remember", "try", "please", "check",
+    "avoid", "use", "keep", "note", "see", "click", "contact", "follow",
+    "read", "visit", "ask", "let's", "don't",
+}
+
+# Finite verbs after the first word mean the sentence states something
+# ("Use of coal rose", "Note that Paris is ...") rather than instructs
+FINITE_VERBS = {
+    "is", "are", "was", "were", "has", "have", "had", "does", "did", "will",
+    "would", "can", "could", "should", "may", "might", "must", "shall",
+    "rose", "fell", "grew", "became", "began", "went", "won", "lost", "saw",
+    "made", "took", "gave", "found", "came", "left", "held", "led", "built",
+}
+
+OPINION_PREFIXES = [
+    r"^i (think|believe|feel|suspect|guess)\b",
+    r"^in my (opinion|view|experience)\b",
+    r"^personally\b",
+]
+
+
+@dataclass
+class PrefilterRule:
+    """A single prefilter rule.
+
+    Attributes:
+        name: Short identifier recorded with each decision
+        check: Returns True if the (stripped) sentence matches the rule
+        reason: Human-readable explanation stored in the result metadata
+        confidence: How sure the rule is that a match has no verifiable
+            content (0-1); compared against the prefilter threshold
+    """
+    name: str
+    check: Callable[[str], bool]
+    reason: str
+    confidence: float
+
+
+@dataclass
+class PrefilterDecision:
+    """Outcome of running the prefilter on one sentence."""
+    skip: bool
+    rule: Optional[str] = None
+    reason: Optional[str] = None
+    confidence: float = 0.0
+
+
+def _is_question(sentence: str) -> bool:
+    return sentence.rstrip("\"')*_ ").endswith("?")
+
+
+def _is_markdown_header(sentence: str) -> bool:
+    # The splitter can glue a header to the following sentence; only a
+    # header on its own is skipped
+    return "\n" not in sentence and re.match(r"^#{1,6}\s", sentence) is not None
+
+
+def _has_no_letters(sentence: str) -> bool:
+    return not any(char.isalpha() for char in sentence)
+
+
+def _is_short_fragment(sentence: str) -> bool:
+    # Strip list markers and emphasis, e.g. "- **Overview:**"
+    stripped = re.sub(r"^([-*+]|\d+[.)])\s+", "", sentence).strip("*_:. ")
+    words = stripped.split()
+    return len(words) <= 1 and not any(char.isdigit() for char in stripped)
+
+
+def _is_boilerplate(sentence: str) -> bool:
+    lowered = sentence.lower()
+    return any(re.match(pattern, lowered) for pattern in BOILERPLATE_PATTERNS)
+
+
+def _has_digits(sentence: str) -> bool:
+    return any(char.isdigit() for char in sentence)
+
+
+def _is_imperative(sentence: str) -> bool:
+    stripped = re.sub(r"^([-*+]|\d+[.)])\s+", "", sentence)
+    words = [word.lower().strip(",:;.!*_\"'()") for word in stripped.split()]
+    if not words or words[0] not in IMPERATIVE_VERBS:
+        return False
+    # Numbers suggest a claim; "Use of ..." is a noun phrase, and a later
+    # finite verb means the first word is not a command
+    if _has_digits(stripped) or words[1:2] == ["of"]:
+        return False
+    return not any(word in FINITE_VERBS or word.endswith("ed") for word in words[1:])
+
+
+def _is_opinion(sentence: str) -> bool:
+    # "I think GDP grew 3% in 2022." still holds an extractable claim
+    if _has_digits(sentence):
+        return False
+    lowered = sentence.lower()
+    return any(re.match(pattern, lowered) for pattern in OPINION_PREFIXES)
+
+
+DEFAULT_RULES = [
+    PrefilterRule(
+        name="no_letters",
+        check=_has_no_letters,
+        reason="Sentence contains no words (separator or formatting only).",
+        confidence=0.99
+    ),
+    PrefilterRule(
+        name="question",
+        check=_is_question,
+        reason="Sentence is a question, which makes no verifiable assertion.",
+        confidence=0.95
+    ),
+    PrefilterRule(
+        name="boilerplate",
+        check=_is_boilerplate,
+        reason="Sentence is conversational boilerplate.",
+        confidence=0.95
+    ),
+    PrefilterRule(
+        name="markdown_header",
+        check=_is_markdown_header,
+        reason="Sentence is a markdown header.",
+        confidence=0.9
+    ),
+    PrefilterRule(
+        name="short_fragment",
+        check=_is_short_fragment,
+        reason="Sentence is a one-word fragment without numbers.",
+        confidence=0.9
+    ),
+    PrefilterRule(
+        name="imperative",
+        check=_is_imperative,
+        reason="Sentence is an instruction or recommendation without figures.",
+        confidence=0.7
+    ),
+    PrefilterRule(
+        name="opinion",
+        check=_is_opinion,
+        reason="Sentence is framed as a personal opinion without figures.",
+        confidence=0.6
+    ),
+]
+
+
+class SentencePrefilter:
+    """Rule-based filter for obviously unverifiable sentences.
+
+    Each rule has a confidence; a sentence is skipped if any matching rule
+    reaches the threshold. The "strict" threshold only uses near-certain
+    rules (questions, headers, boilerplate, fragments); "lenient" also skips
+    imperatives and opinion-framed sentences.
+    """
+
+    def __init__(
+        self,
+        threshold: Union[str, float] = "strict",
+        rules: Optional[List[PrefilterRule]] = None,
+        extra_rules: Optional[List[PrefilterRule]] = None
+    ):
+        """Initialize the prefilter.
+
+        Args:
+            threshold: "strict", "lenient" or a minimum rule confidence (0-1)
+            rules: Rules to use instead of DEFAULT_RULES
+            extra_rules: Additional rules appended to the rule list
+        """
+        if isinstance(threshold, str):
+            if threshold not in STRICTNESS_THRESHOLDS:
+                raise ValueError(
+                    f"Unknown threshold: {threshold} "
+                    f"(expected one of {list(STRICTNESS_THRESHOLDS)} or a number)")
+            threshold = STRICTNESS_THRESHOLDS[threshold]
+        if not 0 <= threshold <= 1:
+            raise ValueError("Threshold must be between 0 and 1")
+
+        self.threshold = threshold
+        self.rules = list(DEFAULT_RULES if rules is None else rules) + list(extra_rules or [])
+
+    def check(self, sentence: str) -> PrefilterDecision:
+        """Decide whether a sentence can skip the LLM stages.
+
+        Args:
+            sentence: The sentence text
+
+        Returns:
+            PrefilterDecision; ``skip`` is True if a rule at or above the
+            threshold matched, with the most confident such rule recorded
+        """
+        stripped = sentence.strip()
+        best: Optional[PrefilterRule] = None
+        for rule in self.rules:
+            if rule.confidence < self.threshold:
+                continue
+            if best is not None and rule.confidence <= best.confidence:
+                continue
+            if rule.check(stripped):
+                best = rule
+
+        if best is None:
+            return PrefilterDecision(skip=False)
+        return PrefilterDecision(
+            skip=True,
+            rule=best.name,
+            reason=best.reason,
+            confidence=best.confidence
+        )
@@ -4,27 +4,52 @@ This agent determines if a sentence contains verifiable content
 and rewrites it if it contains both verifiable and unverifiable parts.
 """
 
-from typing import Optional
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
+import asyncio
+import random
+from typing import Any, Optional
+from langchain_core.callbacks import UsageMetadataCallbackHandler
 from langchain_core.prompts import ChatPromptTemplate
 
-from ..models import SelectionResult, StageResult
+from ..models import SelectionResult, PackedSelectionResult, StageResult
 from ..prompts.selection import (
     SELECTION_SYSTEM_PROMPT,
-    create_selection_prompt
+    create_selection_prompt,
+    create_packed_selection_prompt
 )
+from ...utils.cache import get_response_cache, normalize_for_cache
+from ...utils.hooks import emit, llm_span
+from ...utils.invocation import request_cache_key
+from ...utils.llm_clients import get_chat_model
+from ...utils.retry import (
+    CircuitOpenError,
+    ErrorKind,
+    RetryState,
+    acall_with_retry,
+    call_with_retry
+)
+from ...utils.usage import add_usage, callback_usage, usage_callback
+from .base_agent import BaseAgent
+
+
+# Keys of the normalized Selection cache tier: the normalized sentence
+# alone, or together with the normalized context
+NORMALIZED_CACHE_MODES = ("sentence", "sentence_and_context")
 
 
-class SelectionAgent:
+class SelectionAgent(BaseAgent):
     """Agent for detecting verifiable content in sentences."""
 
+    result_model = SelectionResult
+    stage_name = "Selection"
+
     def __init__(
         self,
         model: str = "gpt-5-nano-2025-08-07",
         temperature: float = 0.0,
         max_tokens: int = 1000,
-        max_retries: int = 3
+        max_retries: int = 3,
+        normalized_cache: Optional[str] = None,
+        audit_rate: float = 0.0
     ):
         """Initialize the Selection Agent.
 
@@ -33,46 +58,39 @@ class SelectionAgent:
             temperature: Temperature for LLM (0.0 for deterministic)
             max_tokens: Maximum tokens for response
             max_retries: Maximum number of retries on failure
+            normalized_cache: Enables a second response cache tier keyed on
+                the normalized sentence ("sentence") or on the normalized
+                sentence and context ("sentence_and_context"), so repeats
+                that differ only in whitespace, quotes or trailing citations
+                hit the cache. Requires the response cache (utils.cache)
+            audit_rate: Fraction of normalized-tier hits that are answered
+                without that tier as well, to measure how often the reused
+                decision agrees with a fresh one
         """
+        if normalized_cache is not None and normalized_cache not in NORMALIZED_CACHE_MODES:
+            raise ValueError(
+                f"Unknown normalized_cache: {normalized_cache} "
+                f"(expected one of {NORMALIZED_CACHE_MODES})")
+        if not 0.0 <= audit_rate <= 1.0:
+            raise ValueError("audit_rate must be between 0 and 1")
+
         self.model_name = model
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.max_retries = max_retries
+        self.normalized_cache = normalized_cache
+        self.audit_rate = audit_rate
+        self.normalized_hits = 0
+        self.normalized_misses = 0
+        self.audits = 0
+        self.audit_agreements = 0
 
-        # Initialize LLM based on model name
-        if "gpt" in model or "openai" in model:
-            # Use max_completion_tokens for newer models (gpt-5-nano, gpt-4o, etc.)
-            # For reasoning models, set reasoning_effort to "low" to minimize token usage
-            if "gpt-5" in model or "gpt-4o" in model:
-                model_kwargs = {
-                    "max_completion_tokens": max_tokens,
-                }
-                # Add reasoning_effort for reasoning models
-                if "gpt-5" in model or "o1" in model:
-                    model_kwargs["reasoning_effort"] = "low"
-
-                self.llm = ChatOpenAI(
-                    model=model,
-                    temperature=temperature,
-                    model_kwargs=model_kwargs
-                )
-            else:
-                self.llm = ChatOpenAI(
-                    model=model,
-                    temperature=temperature,
-                    max_tokens=max_tokens
-                )
-        elif "claude" in model or "anthropic" in model:
-            self.llm = ChatAnthropic(
-                model=model,
-                temperature=temperature,
-                max_tokens=max_tokens
-            )
-        else:
-            raise ValueError(f"Unsupported model: {model}")
+        # Shared client for this configuration (see utils.llm_clients)
+        self.llm = get_chat_model(model, temperature, max_tokens)
 
         # Create structured output LLM
         self.structured_llm = self.llm.with_structured_output(SelectionResult)
+        self.packed_llm = self.llm.with_structured_output(PackedSelectionResult)
 
         # Create prompt template
         self.prompt = ChatPromptTemplate.from_messages([
@@ -80,55 +98,407 @@ class SelectionAgent:
             ("user", "{user_prompt}")
         ])
 
+    def _create_user_prompt(self, sentence: str, context: str) -> str:
+        """Create the user prompt for the Selection stage."""
+        return create_selection_prompt(sentence, context)
+
     def process(self, sentence: str, context: str) -> StageResult:
-        """Process a sentence to detect verifiable content.
+        """Process a sentence, consulting the normalized cache tier first.
 
         Args:
             sentence: The sentence to analyze
             context: Context surrounding the sentence
 
         Returns:
-            StageResult containing SelectionResult or error
+            StageResult containing a SelectionResult or error
         """
-        try:
-            # Create user prompt
-            user_prompt = create_selection_prompt(sentence, context)
-
-            # Create chain
-            chain = self.prompt | self.structured_llm
-
-            # Execute with retries
-            for attempt in range(self.max_retries):
-                try:
-                    result = chain.invoke({
-                        "user_prompt": user_prompt
-                    })
-                    # Convert dict to SelectionResult if needed
-                    if isinstance(result, dict):
-                        result = SelectionResult(**result)
-                    return StageResult(success=True, data=result)
-                except Exception as e:
-                    if attempt == self.max_retries - 1:
-                        raise
-                    continue
-
-        except Exception as e:
-            return StageResult(
-                success=False,
-                error=f"Selection failed: {str(e)}"
-            )
+        key = self._normalized_key(sentence, context)
+        hit, audit = self._normalized_lookup(key)
+        if hit is not None and not audit:
+            return hit
+        return self._normalized_record(key, hit, super().process(sentence, context))
+
+    async def aprocess(self, sentence: str, context: str) -> StageResult:
+        """Asynchronously process a sentence, consulting the normalized tier first.
+
+        Args:
+            sentence: The sentence to analyze
+            context: Context surrounding the sentence
+
+        Returns:
+            StageResult containing a SelectionResult or error
+        """
+        key = self._normalized_key(sentence, context)
+        hit, audit = self._normalized_lookup(key)
+        if hit is not None and not audit:
+            return hit
+        return self._normalized_record(
+            key, hit, await super().aprocess(sentence, context))
+
+    def process_batch(
+        self,
+        sentences_with_context: list[tuple[str, str]],
+        max_concurrency: Optional[int] = None
+    ) -> list[StageResult]:
+        """Process sentences in batch; normalized-tier hits skip the batch call."""
+        if self.normalized_cache is None:
+            return super().process_batch(sentences_with_context, max_concurrency)
+        keys, hits, pending = self._normalized_batch_lookup(sentences_with_context)
+        fresh = super().process_batch(
+            [sentences_with_context[i] for i in pending], max_concurrency) if pending else []
+        return self._normalized_batch_merge(keys, hits, pending, fresh)
+
+    async def aprocess_batch(
+        self,
+        sentences_with_context: list[tuple[str, str]],
+        max_concurrency: Optional[int] = None
+    ) -> list[StageResult]:
+        """Async counterpart of ``process_batch``."""
+        if self.normalized_cache is None:
+            return await super().aprocess_batch(sentences_with_context, max_concurrency)
+        keys, hits, pending = self._normalized_batch_lookup(sentences_with_context)
+        fresh = await super().aprocess_batch(
+            [sentences_with_context[i] for i in pending], max_concurrency) if pending else []
+        return self._normalized_batch_merge(keys, hits, pending, fresh)
+
+    def normalized_cache_stats(self) -> dict[str, Any]:
+        """Hit rate of the normalized tier and agreement of audited hits."""
+        lookups = self.normalized_hits + self.normalized_misses
+        return {
+            "mode": self.normalized_cache,
+            "hits": self.normalized_hits,
+            "misses": self.normalized_misses,
+            "hit_rate": round(self.normalized_hits / lookups, 4) if lookups else None,
+            "audits": self.audits,
+            "agreement_rate": (
+                round(self.audit_agreements / self.audits, 4) if self.audits else None
+            ),
+        }
+
+    def _normalized_key(self, sentence: str, context: str) -> Optional[str]:
+        """Normalized-tier cache key (None if the tier or the cache is off)."""
+        if self.normalized_cache is None or get_response_cache() is None:
+            return None
+        # The system prompt keeps entries from outliving prompt changes
+        messages = [
+            ("system", SELECTION_SYSTEM_PROMPT),
+            ("sentence", normalize_for_cache(sentence)),
+        ]
+        if self.normalized_cache == "sentence_and_context":
+            messages.append(("context", normalize_for_cache(context)))
+        return request_cache_key(self.model_name, self.temperature, messages, SelectionResult)
+
+    def _normalized_lookup(self, key: Optional[str]) -> tuple[Optional[StageResult], bool]:
+        """Look up the normalized tier.
+
+        Returns:
+            The cached StageResult (or None) and whether to audit the hit
+        """
+        cache = get_response_cache()
+        if key is None or cache is None:
+            return None, False
+        data = cache.get_model(key, SelectionResult)
+        self._report_cache(data is not None, tier="normalized")
+        if data is None:
+            self.normalized_misses += 1
+            return None, False
+        self.normalized_hits += 1
+        hit = StageResult(
+            success=True,
+            data=data,
+            metadata={"cache_hit": True, "cache_tier": "normalized"},
+            timing={"attempts": 0, "wait_seconds": 0.0, "cache_hit": True}
+        )
+        return hit, random.random() < self.audit_rate
+
+    def _normalized_record(
+        self,
+        key: Optional[str],
+        hit: Optional[StageResult],
+        result: StageResult
+    ) -> StageResult:
+        """Store a fresh result in the normalized tier, or score an audit.
+
+        An audited hit is compared with the fresh result, which is returned.
+        """
+        if hit is not None and not result.success:
+            # A failed audit call keeps the cached answer
+            return hit
+        if key is None or not result.success:
+            return result
+        if hit is None:
+            self._store_result(key, result.data)
+            return result
+        self.audits += 1
+        if hit.data.has_verifiable_content == result.data.has_verifiable_content:
+            self.audit_agreements += 1
+        return result
+
+    def _normalized_batch_lookup(
+        self,
+        sentences_with_context: list[tuple[str, str]]
+    ) -> tuple[list[Optional[str]], list[Optional[StageResult]], list[int]]:
+        """Look up a batch; returns keys, hits and the indices still to process."""
+        keys, hits, pending = [], [], []
+        for i, (sentence, context) in enumerate(sentences_with_context):
+            key = self._normalized_key(sentence, context)
+            hit, audit = self._normalized_lookup(key)
+            keys.append(key)
+            hits.append(hit)
+            if hit is None or audit:
+                pending.append(i)
+        return keys, hits, pending
+
+    def _normalized_batch_merge(
+        self,
+        keys: list[Optional[str]],
+        hits: list[Optional[StageResult]],
+        pending: list[int],
+        fresh: list[StageResult]
+    ) -> list[StageResult]:
+        """Combine normalized-tier hits with the freshly processed items."""
+        results = list(hits)
+        for i, result in zip(pending, fresh):
+            results[i] = self._normalized_record(keys[i], hits[i], result)
+        return results
+
+    def process_packed(
+        self,
+        sentences: list[tuple[str, str, str]],
+        shared_context: str
+    ) -> list[StageResult]:
+        """Classify several consecutive sentences in a single LLM call.
+
+        The packed call sends the system prompt once for the whole window.
+        Sentences the model drops, duplicates or answers under an unknown ID
+        (or all of them, if the packed output does not match the schema)
+        fall back to a regular single-sentence ``process`` call with their
+        own context. Other failures of the packed call fail the whole window
+        without fallback calls, so a struggling provider gets no extra load.
+
+        Args:
+            sentences: List of (sentence_id, sentence, context) tuples
+            shared_context: Context for the window as a whole
+
+        Returns:
+            List of StageResult objects, in input order
+
+        Raises:
+            CircuitOpenError: If the provider's circuit breaker is open
+            Exception: The packed call's error, if it was an auth error
+        """
+        chain = self.prompt | self.packed_llm
+        user_prompt = self._create_packed_prompt(sentences, shared_context)
+        key = self._cache_key(user_prompt, PackedSelectionResult)
+
+        state = RetryState()
+        usage = usage_callback()
 
-    def process_batch(self, sentences_with_context: list[tuple[str, str]]) -> list[StageResult]:
-        """Process multiple sentences in batch.
+        def attempt():
+            state.wait_seconds += self.rate_limiter.acquire(self._request_tokens(user_prompt))
+            with self._packed_span(usage, state, sentences):
+                return chain.invoke({"user_prompt": user_prompt}, config={"callbacks": [usage]})
+
+        packed = self._cached_packed(key)
+        fallback = {}
+        if packed is None:
+            try:
+                packed = call_with_retry(
+                    attempt, self._retry_policy(), self.circuit_breaker, state)
+                self._store_result(key, packed)
+            except Exception as e:
+                failed = self._packed_failure(sentences, e, state, usage)
+                if failed is not None:
+                    return failed
+                fallback = self._packed_fallback(sentences, e, state)
+
+        # No attempts means the packed response came from the cache
+        timing = {**state.as_timing(), "cache_hit": state.attempts == 0}
+        results = self._unpack(sentences, packed, timing)
+        for i, (_, sentence, context) in enumerate(sentences):
+            if results[i] is None:
+                results[i] = self.process(sentence, context)
+                results[i].metadata.update(fallback)
+        self._add_packed_usage(results, usage)
+        return results
+
+    async def aprocess_packed(
+        self,
+        sentences: list[tuple[str, str, str]],
+        shared_context: str
+    ) -> list[StageResult]:
+        """Asynchronously classify several sentences in a single LLM call.
+
+        Async counterpart of ``process_packed``; fallback calls for dropped
+        sentences run concurrently.
 
         Args:
-            sentences_with_context: List of (sentence, context) tuples
+            sentences: List of (sentence_id, sentence, context) tuples
+            shared_context: Context for the window as a whole
 
         Returns:
-            List of StageResult objects
+            List of StageResult objects, in input order
+
+        Raises:
+            CircuitOpenError: If the provider's circuit breaker is open
+            Exception: The packed call's error, if it was an auth error
         """
-        results = []
-        for sentence, context in sentences_with_context:
-            result = self.process(sentence, context)
-            results.append(result)
+        chain = self.prompt | self.packed_llm
+        user_prompt = self._create_packed_prompt(sentences, shared_context)
+        key = self._cache_key(user_prompt, PackedSelectionResult)
+
+        state = RetryState()
+        usage = usage_callback()
+
+        async def attempt():
+            state.wait_seconds += await self.rate_limiter.aacquire(
+                self._request_tokens(user_prompt))
+            with self._packed_span(usage, state, sentences):
+                return await chain.ainvoke(
+                    {"user_prompt": user_prompt}, config={"callbacks": [usage]})
+
+        packed = self._cached_packed(key)
+        fallback = {}
+        if packed is None:
+            try:
+                packed = await acall_with_retry(
+                    attempt, self._retry_policy(), self.circuit_breaker, state)
+                self._store_result(key, packed)
+            except Exception as e:
+                failed = self._packed_failure(sentences, e, state, usage)
+                if failed is not None:
+                    return failed
+                fallback = self._packed_fallback(sentences, e, state)
+
+        # No attempts means the packed response came from the cache
+        timing = {**state.as_timing(), "cache_hit": state.attempts == 0}
+        results = self._unpack(sentences, packed, timing)
+        missing = [i for i, result in enumerate(results) if result is None]
+        fallbacks = await asyncio.gather(
+            *(self.aprocess(sentences[i][1], sentences[i][2]) for i in missing)
+        )
+        for i, result in zip(missing, fallbacks):
+            result.metadata.update(fallback)
+            results[i] = result
+        self._add_packed_usage(results, usage)
+        return results
+
+    def _packed_failure(
+        self,
+        sentences: list[tuple[str, str, str]],
+        error: Exception,
+        state: RetryState,
+        usage: UsageMetadataCallbackHandler
+    ) -> Optional[list[StageResult]]:
+        """Handle a failed packed call that should not fall back.
+
+        Auth errors and an open circuit are raised. Schema failures return
+        None, so that the sentences fall back to single calls; any other
+        error (e.g. transient failures after the last retry) fails every
+        sentence of the window with it.
+        """
+        if isinstance(error, CircuitOpenError) or state.last_error_kind is ErrorKind.AUTH:
+            raise error
+        if state.last_error_kind is ErrorKind.SCHEMA:
+            return None
+        results = [self._error_result(error, state) for _ in sentences]
+        self._add_packed_usage(results, usage)
+        return results
+
+    def _packed_fallback(
+        self,
+        sentences: list[tuple[str, str, str]],
+        error: Exception,
+        state: RetryState
+    ) -> dict[str, Any]:
+        """Report a packed call whose output did not match the schema.
+
+        Returns:
+            Metadata recorded on the window's fallback results
+        """
+        emit("packed_fallback", agent=self.stage_name, items=len(sentences),
+             error=f"{type(error).__name__}: {error}", **state.as_metadata())
+        return {"packed_fallback": {"error": str(error), **state.as_metadata()}}
+
+    @staticmethod
+    def _add_packed_usage(
+        results: list[StageResult],
+        usage: UsageMetadataCallbackHandler
+    ) -> None:
+        """Count the packed call's token usage once, on the window's first result."""
+        if results:
+            results[0].usage = add_usage(callback_usage(usage), results[0].usage)
+
+    def _cached_packed(self, key: Optional[str]) -> Optional[PackedSelectionResult]:
+        """The cached packed response for key, or None on a miss."""
+        cache = get_response_cache()
+        if key is None or cache is None:
+            return None
+        packed = cache.get_model(key, PackedSelectionResult)
+        self._report_cache(packed is not None, tier="packed")
+        return packed
+
+    def _packed_span(
+        self,
+        usage: UsageMetadataCallbackHandler,
+        state: RetryState,
+        sentences: list[tuple[str, str, str]]
+    ):
+        """Tracing span of one packed request."""
+        return llm_span([usage], agent=self.stage_name, model=self.model_name,
+                        attempt=state.attempts, items=len(sentences))
+
+    @staticmethod
+    def _create_packed_prompt(
+        sentences: list[tuple[str, str, str]],
+        shared_context: str
+    ) -> str:
+        """Create the user prompt for a packed call."""
+        return create_packed_selection_prompt(
+            [(sentence_id, sentence) for sentence_id, sentence, _ in sentences],
+            shared_context
+        )
+
+    @staticmethod
+    def _unpack(
+        sentences: list[tuple[str, str, str]],
+        packed,
+        timing: dict[str, Any]
+    ) -> list[Optional[StageResult]]:
+        """Map a packed response back to input order.
+
+        Every answer gets the packed call's timing. Returns None for every
+        sentence without a usable answer.
+        """
+        results: list[Optional[StageResult]] = [None] * len(sentences)
+        if packed is None:
+            return results
+
+        try:
+            if isinstance(packed, dict):
+                packed = PackedSelectionResult(**packed)
+            items = packed.results
+        except Exception:
+            return results
+
+        positions = {sentence_id: i for i, (sentence_id, _, _) in enumerate(sentences)}
+        seen = set()
+        for item in items:
+            position = positions.get(item.sentence_id)
+            if position is None:
+                continue
+            if item.sentence_id in seen:
+                # Conflicting duplicate answers: let the single call decide
+                results[position] = None
+                continue
+            seen.add(item.sentence_id)
+            results[position] = StageResult(
+                success=True,
+                data=SelectionResult(
+                    has_verifiable_content=item.has_verifiable_content,
+                    rewritten_sentence=item.rewritten_sentence,
+                    reason=item.reason
+                ),
+                timing=dict(timing)
+            )
         return results
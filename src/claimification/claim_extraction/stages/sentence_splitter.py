@@ -5,8 +5,29 @@ context for each sentence (surrounding sentences, headers, question).
 """
 
 import re
-from typing import List, Optional
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
 from ..models import SentenceWithContext, SentenceMetadata
+from ...utils.chunking import SENTENCE_BOUNDARY
+
+
+# Characters read per call when iter_split is given a file object
+READ_CHARS = 64 * 1024
+
+PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+MARKDOWN_HEADER = re.compile(r'^(#{1,6})\s+(.+)$')
+
+
+@dataclass
+class _SentenceRecord:
+    """A sentence found by iter_split, before its context is known."""
+    text: str
+    char_start: int
+    char_end: int
+    paragraph: int
+    headers: List[str]
 
 
 class SentenceSplitter:
@@ -52,6 +73,8 @@ class SentenceSplitter:
 
         # Split into sentences
         sentences = self._split_into_sentences(text)
+        offsets = self._locate_sentences(text, sentences)
+        paragraph_starts = self._paragraph_starts(text)
 
         # Create context for each sentence
         results = []
@@ -67,10 +90,17 @@ class SentenceSplitter:
             )
 
             # Create metadata
+            char_start, char_end = offsets[i]
+            if char_start is not None:
+                paragraph = bisect_right(paragraph_starts, char_start) - 1
+            else:
+                paragraph = self._get_paragraph_number(text, sentence_text)
             metadata = SentenceMetadata(
                 position=i,
                 headers=headers_map.get(i, []),
-                paragraph=self._get_paragraph_number(text, sentence_text)
+                paragraph=paragraph,
+                char_start=char_start,
+                char_end=char_end
             ).to_dict()
 
             results.append(SentenceWithContext(
@@ -82,6 +112,161 @@ class SentenceSplitter:
 
         return results
 
+    def iter_split(
+        self,
+        source: Union[TextIO, Iterable[str]],
+        question: Optional[str] = None
+    ) -> Iterator[SentenceWithContext]:
+        """Split streamed text into sentences, yielding each one lazily.
+
+        The text is read piece by piece and only a sliding window of
+        sentences is kept for building contexts, so memory does not grow
+        with the input. A sentence is yielded as soon as the sentences
+        that follow it in its context have been read. Sentences, IDs,
+        offsets, paragraphs and contexts match ``split_and_create_context``,
+        except that a sentence's section headers are those in effect where
+        it starts.
+
+        Args:
+            source: File object opened in text mode, or an iterable of
+                text pieces (split anywhere, even inside a sentence)
+            question: Optional question for context (for backward compatibility)
+
+        Yields:
+            SentenceWithContext objects in text order
+        """
+        before = self.context_sentences_before
+        after = self.context_sentences_after
+        # Up to `before` yielded sentences, followed by those not yet yielded
+        window: Deque[_SentenceRecord] = deque()
+        next_pending = 0
+        position = 0
+
+        for record in self._iter_sentence_records(source):
+            window.append(record)
+            while len(window) - next_pending > after:
+                yield self._windowed_sentence(window, next_pending, position, question)
+                position += 1
+                next_pending += 1
+                while next_pending > before:
+                    window.popleft()
+                    next_pending -= 1
+
+        while next_pending < len(window):
+            yield self._windowed_sentence(window, next_pending, position, question)
+            position += 1
+            next_pending += 1
+
+    def _iter_sentence_records(
+        self,
+        source: Union[TextIO, Iterable[str]]
+    ) -> Iterator[_SentenceRecord]:
+        """Find sentences in streamed text, keeping only the unfinished tail."""
+        if hasattr(source, "read"):
+            pieces = iter(lambda: source.read(READ_CHARS), "")
+        else:
+            pieces = iter(source)
+
+        buffer = ""
+        offset = 0  # Position of buffer[0] in the whole text
+        scanned = 0  # Boundaries can only start at or after buffer[scanned]
+        state = {"paragraph": 0, "headers": []}
+        for piece in pieces:
+            buffer += piece
+            consumed = 0
+            # A boundary match is final: it ends at the next sentence's first letter
+            for boundary in SENTENCE_BOUNDARY.finditer(buffer, scanned):
+                record = self._sentence_record(
+                    buffer, consumed, boundary.start(), boundary.end(), offset, state)
+                if record is not None:
+                    yield record
+                consumed = boundary.end()
+            buffer = buffer[consumed:]
+            offset += consumed
+            # A boundary not found yet must start in the trailing whitespace,
+            # so a long sentence is not rescanned with every piece
+            scanned = len(buffer)
+            while scanned and buffer[scanned - 1].isspace():
+                scanned -= 1
+
+        record = self._sentence_record(buffer, 0, len(buffer), len(buffer), offset, state)
+        if record is not None:
+            yield record
+
+    def _sentence_record(
+        self,
+        buffer: str,
+        start: int,
+        end: int,
+        segment_end: int,
+        offset: int,
+        state: dict
+    ) -> Optional[_SentenceRecord]:
+        """Build the record of buffer[start:end] and advance paragraph/header state.
+
+        ``segment_end`` includes the whitespace after the sentence, so that
+        paragraph breaks between sentences are counted.
+        """
+        raw = buffer[start:end]
+        char_start = offset + start + len(raw) - len(raw.lstrip())
+        char_end = offset + start + len(raw.rstrip())
+
+        breaks = [offset + match.end()
+                  for match in PARAGRAPH_BREAK.finditer(buffer, start, segment_end)]
+        paragraph = state["paragraph"] + sum(1 for b in breaks if b <= char_start)
+        state["paragraph"] += len(breaks)
+
+        # Headers in effect at the sentence's first line of regular text
+        headers = None
+        for line in raw.split("\n"):
+            line = line.strip()
+            if not line:
+                continue
+            header_match = MARKDOWN_HEADER.match(line)
+            if header_match:
+                level = len(header_match.group(1))
+                state["headers"] = [h for h in state["headers"] if h[0] < level]
+                state["headers"].append((level, header_match.group(2)))
+            elif headers is None:
+                headers = [h[1] for h in state["headers"]]
+        if headers is None:
+            headers = [h[1] for h in state["headers"]]
+
+        text = PARAGRAPH_BREAK.sub("\n", raw).strip()
+        if not text:
+            return None
+        return _SentenceRecord(text, char_start, char_end, paragraph, headers)
+
+    def _windowed_sentence(
+        self,
+        window: Deque[_SentenceRecord],
+        index: int,
+        position: int,
+        question: Optional[str]
+    ) -> SentenceWithContext:
+        """Create the SentenceWithContext of window[index]."""
+        record = window[index]
+        headers = record.headers if self.include_headers else []
+        context = self._build_context(
+            question=question,
+            sentences=[r.text for r in window],
+            current_index=index,
+            headers_map={index: headers} if headers else {}
+        )
+        metadata = SentenceMetadata(
+            position=position,
+            headers=headers,
+            paragraph=record.paragraph,
+            char_start=record.char_start,
+            char_end=record.char_end
+        ).to_dict()
+        return SentenceWithContext(
+            sentence_id=f"sent_{position:03d}",
+            text=record.text,
+            context=context,
+            metadata=metadata
+        )
+
     def _split_into_sentences(self, text: str) -> List[str]:
         """Split text into sentences using regex.
 
@@ -98,8 +283,7 @@ class SentenceSplitter:
 
         # Simple sentence splitting pattern
         # This is a simplified version - spaCy would be more robust
-        pattern = r'(?<=[.!?])\s+(?=[A-Z])'
-        sentences = re.split(pattern, text)
+        sentences = SENTENCE_BOUNDARY.split(text)
 
         # Clean up
         sentences = [s.strip() for s in sentences if s.strip()]
@@ -115,6 +299,38 @@ class SentenceSplitter:
 
         return result
 
+    def _locate_sentences(
+        self,
+        text: str,
+        sentences: List[str]
+    ) -> List[Tuple[Optional[int], Optional[int]]]:
+        """Find each sentence's character span in the original text.
+
+        Sentences are searched in order from the end of the previous one.
+        A sentence that spans a collapsed blank line is matched with
+        flexible whitespace; one that still cannot be found gets no offsets.
+        """
+        offsets = []
+        cursor = 0
+        for sentence in sentences:
+            start = text.find(sentence, cursor)
+            if start != -1:
+                end = start + len(sentence)
+            else:
+                pattern = r'\s+'.join(re.escape(word) for word in sentence.split())
+                match = re.compile(pattern).search(text, cursor)
+                if match is None:
+                    offsets.append((None, None))
+                    continue
+                start, end = match.span()
+            cursor = end
+            offsets.append((start, end))
+        return offsets
+
+    def _paragraph_starts(self, text: str) -> List[int]:
+        """Start offsets of the paragraphs (separated by blank lines)."""
+        return [0] + [match.end() for match in re.finditer(r'\n\s*\n', text)]
+
     def _build_context(
         self,
         question: Optional[str],
@@ -156,6 +372,53 @@ class SentenceSplitter:
 
         return "\n\n".join(context_parts)
 
+    def build_window_context(
+        self,
+        sentences: List[SentenceWithContext],
+        start: int,
+        end: int,
+        question: Optional[str] = None
+    ) -> str:
+        """Build one context string shared by the window sentences[start:end].
+
+        Used when several consecutive sentences are analyzed in one call:
+        the window's own sentences are context for each other, so only the
+        sentences around the window (and headers/question) are included.
+
+        Args:
+            sentences: All sentences produced by split_and_create_context
+            start: Index of the first sentence in the window
+            end: Index after the last sentence in the window
+            question: Optional question for context
+
+        Returns:
+            Context string in the same format as per-sentence contexts
+        """
+        context_parts = []
+
+        # Add question
+        if self.include_question and question:
+            context_parts.append(f"**Question:** {question}")
+
+        # Add headers of the first sentence in the window
+        headers = sentences[start].metadata.get("headers") if self.include_headers else None
+        if headers:
+            context_parts.append(f"**Section:** {' > '.join(headers)}")
+
+        # Add sentences preceding the window
+        before_start = max(0, start - self.context_sentences_before)
+        if before_start < start:
+            preceding = " ".join(s.text for s in sentences[before_start:start])
+            context_parts.append(f"**Before:** {preceding}")
+
+        # Add sentences following the window
+        after_end = min(len(sentences), end + self.context_sentences_after)
+        if after_end > end:
+            following = " ".join(s.text for s in sentences[end:after_end])
+            context_parts.append(f"**After:** {following}")
+
+        return "\n\n".join(context_parts)
+
     def _extract_markdown_headers(self, text: str) -> dict:
         """Extract markdown headers and map them to sentence indices.
 
@@ -0,0 +1,212 @@
+"""Streaming access to the sentence results of an extraction run.
+
+``extract_claims`` returns once every sentence is done. A ClaimStream
+instead yields each ClaimExtractionResult as soon as it is ready, so
+consumers (e.g. a verification queue) can start on the first claims while
+the rest of the text is still being processed. Results are yielded in
+sentence order or in completion order, and running statistics are
+available while iterating. Input is split lazily and yielded results are
+not kept, so memory stays flat on large inputs unless the complete
+PipelineResult is asked for.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from contextlib import suppress
+from typing import (
+    TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, Iterator, Optional, TextIO, Union
+)
+
+from .models import ClaimExtractionResult, PipelineResult, SentenceStatus
+
+if TYPE_CHECKING:
+    from .pipeline import ClaimExtractionPipeline
+
+
+# Marks the end of the run in the result queue
+_DONE = object()
+
+
+class ClaimStream:
+    """Sentence results of one extraction run, yielded as they complete.
+
+    Iterate with ``async for`` inside an event loop, or with ``for`` from
+    synchronous code (the run then happens on a background thread). A
+    stream can be iterated once. Leaving the loop early cancels the
+    outstanding LLM calls.
+
+    The input is split lazily, as in ``aextract_claims_from``, and only
+    the running statistics outlive a yielded result. The wavefront
+    scheduler, Selection packing and the options other than
+    ``progress_callback`` need the whole text; with them, the input is
+    read and split completely before the run starts.
+
+    Attributes:
+        result: The complete PipelineResult once iteration has finished,
+            if the stream was created with ``keep_result=True``
+    """
+
+    def __init__(
+        self,
+        pipeline: "ClaimExtractionPipeline",
+        source: Union[str, TextIO, Iterable[str]],
+        question: Optional[str] = None,
+        ordered: bool = True,
+        keep_result: bool = False,
+        **options: Any
+    ):
+        """Initialize the stream (nothing runs until iteration starts).
+
+        Args:
+            pipeline: Pipeline that processes the text
+            source: The text, a file object opened in text mode, or an
+                iterable of text pieces
+            question: Optional question for context
+            ordered: Yield results in sentence order (True) or in
+                completion order (False)
+            keep_result: Also collect every result into ``result``
+            **options: Further keyword arguments of ``aextract_claims``
+                (progress_callback, dedup_scope, previous, checkpoint)
+        """
+        self.pipeline = pipeline
+        self.source = source
+        self.question = question
+        self.ordered = ordered
+        self.keep_result = keep_result
+        self.options = options
+        self.result: Optional[PipelineResult] = None
+        self._started = False
+        self._start_time: Optional[float] = None
+        self._total: Optional[int] = None
+        self._completed = 0
+        self._claims = 0
+        self._status_counts = {status.value: 0 for status in SentenceStatus}
+
+    @property
+    def statistics(self) -> Dict[str, Any]:
+        """Running counts of the finished sentences and their claims.
+
+        ``total_sentences`` is None until the whole input has been split.
+        """
+        elapsed = time.time() - self._start_time if self._start_time is not None else 0.0
+        return {
+            "completed": self._completed,
+            "total_sentences": self._total,
+            "total_claims": self._claims,
+            **self._status_counts,
+            "elapsed_seconds": round(elapsed, 2),
+        }
+
+    def _record(self, result: ClaimExtractionResult) -> None:
+        """Update the running statistics with a finished sentence."""
+        self._completed += 1
+        self._status_counts[result.status.value] += 1
+        if result.status == SentenceStatus.EXTRACTED:
+            self._claims += len(result.claims)
+
+    async def __aiter__(self) -> AsyncIterator[ClaimExtractionResult]:
+        if self._started:
+            raise RuntimeError("A ClaimStream can only be iterated once")
+        self._started = True
+        self._start_time = time.time()
+
+        results: asyncio.Queue = asyncio.Queue()
+        progress_callback = self.options.pop("progress_callback", None)
+
+        def on_result(index: int, result: ClaimExtractionResult, total: Optional[int]) -> None:
+            self._record(result)
+            results.put_nowait((index, result))
+            if progress_callback is not None:
+                progress_callback(result, self._completed, total)
+
+        run = asyncio.ensure_future(self._run(on_result))
+        run.add_done_callback(lambda _: results.put_nowait(_DONE))
+
+        try:
+            # Results that finished ahead of an earlier sentence, by index
+            waiting: Dict[int, ClaimExtractionResult] = {}
+            next_index = 0
+            while True:
+                item = await results.get()
+                if item is _DONE:
+                    break
+                index, result = item
+                if not self.ordered:
+                    yield result
+                    continue
+                waiting[index] = result
+                while next_index in waiting:
+                    yield waiting.pop(next_index)
+                    next_index += 1
+            # Re-raises the run's error, if any
+            self.result = await run
+            self._total = self._completed
+        finally:
+            if not run.done():
+                run.cancel()
+                with suppress(asyncio.CancelledError):
+                    await run
+
+    async def _run(self, on_result) -> Optional[PipelineResult]:
+        """Run the extraction, reporting results as ``(index, result, total)``."""
+        pipeline = self.pipeline
+        if not pipeline._needs_all_sentences() and not self.options:
+            return await pipeline._aextract_lazily(
+                self.source, self.question, on_result, keep_results=self.keep_result)
+
+        text = self.source if isinstance(self.source, str) else "".join(
+            pipeline._source_pieces(self.source))
+        sentences = pipeline._split_sentences(text, self.question)
+        self._total = len(sentences)
+        # Only the positions are kept to restore sentence order
+        positions = {sentence.sentence_id: i for i, sentence in enumerate(sentences)}
+
+        def report(result: ClaimExtractionResult, completed: int, total: int) -> None:
+            on_result(positions[result.sentence_id], result, total)
+
+        result = await pipeline._aextract_traced(
+            text, self.question, sentences, self._start_time,
+            progress_callback=report, **self.options)
+        return result if self.keep_result else None
+
+    def __iter__(self) -> Iterator[ClaimExtractionResult]:
+        items: queue.Queue = queue.Queue()
+        started = threading.Event()
+        runner: Dict[str, Any] = {}
+
+        async def consume() -> None:
+            runner["loop"] = asyncio.get_running_loop()
+            runner["task"] = asyncio.current_task()
+            started.set()
+            async for result in self.__aiter__():
+                items.put(result)
+
+        def work() -> None:
+            try:
+                asyncio.run(consume())
+                items.put(_DONE)
+            except BaseException as e:
+                items.put(e)
+            finally:
+                started.set()
+
+        thread = threading.Thread(target=work, daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = items.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            if thread.is_alive():
+                # Stopped early: cancel the run on its own loop
+                started.wait()
+                if "task" in runner:
+                    with suppress(RuntimeError):
+                        runner["loop"].call_soon_threadsafe(runner["task"].cancel)
+            thread.join()
@@ -1,21 +1,50 @@
 """Main CLI entry point for Claimification plugin."""
 
 import os
+import sys
 import json
+import asyncio
 import argparse
 from pathlib import Path
+from typing import List, Optional
 from dotenv import load_dotenv
 from rich.console import Console
 from rich.markdown import Markdown
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    TextColumn,
+    TimeElapsedColumn,
+    TimeRemainingColumn
+)
 
 from claimification.claim_extraction.pipeline import ClaimExtractionPipeline
+from claimification.claim_extraction.checkpoint import CheckpointJournal
+from claimification.claim_extraction.corpus import (
+    DEFAULT_DOCUMENT_CONCURRENCY,
+    completed_ids,
+    count_documents,
+    iter_documents,
+    run_corpus
+)
 from claimification.claim_extraction.models import PipelineResult, SentenceStatus
+from claimification.utils.cache import configure_response_cache
+from claimification.utils.hooks import JsonlEventLog, configure_hooks
+from claimification.utils.chunking import iter_text_file
+from claimification.utils.llm_clients import provider_for_model
+from claimification.utils.rate_limiter import configure_rate_limit
+from claimification.utils.usage import configure_prices, format_usage
 
 
 # Load environment variables
 load_dotenv()
 
 
+# Text files larger than this are streamed instead of read whole
+STREAM_FILE_BYTES = 16 * 1024 * 1024
+
+
 def format_results_markdown(result: PipelineResult) -> str:
     """Format pipeline results as markdown.
 
@@ -30,8 +59,9 @@ def format_results_markdown(result: PipelineResult) -> str:
     # Text and optional question
     if result.question:
         md_lines.append(f"**Question:** {result.question}\n")
-    md_lines.append(
-        f"**Text:** {result.text[:200]}{'...' if len(result.text) > 200 else ''}\n")
+    if result.text:
+        md_lines.append(
+            f"**Text:** {result.text[:200]}{'...' if len(result.text) > 200 else ''}\n")
 
     # Statistics
     stats = result.get_statistics_summary()
@@ -43,6 +73,8 @@ def format_results_markdown(result: PipelineResult) -> str:
     md_lines.append(f"- Cannot disambiguate: {stats['cannot_disambiguate']}")
     if stats['processing_error'] > 0:
         md_lines.append(f"- Processing errors: {stats['processing_error']}")
+    if "usage" in result.statistics:
+        md_lines.append(f"- Tokens: {format_usage(result.statistics['usage'])}")
     md_lines.append("")
 
     # Extracted Claims
@@ -84,6 +116,8 @@ def format_results_json(result: PipelineResult) -> str:
         "statistics": result.get_statistics_summary(),
         "sentences": []
     }
+    if "usage" in result.statistics:
+        output["usage"] = result.statistics["usage"]
 
     if result.question:
         output["question"] = result.question
@@ -101,10 +135,213 @@ def format_results_json(result: PipelineResult) -> str:
     return json.dumps(output, indent=2, ensure_ascii=False)
 
 
-def main():
+def add_pipeline_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the pipeline options shared by all commands."""
+    parser.add_argument(
+        "--model",
+        type=str,
+        default=os.getenv("CLAIMIFICATION_MODEL", "gpt-5-nano-2025-08-07"),
+        help="LLM model to use (default: gpt-5-nano-2025-08-07)"
+    )
+    parser.add_argument(
+        "--temperature",
+        type=float,
+        default=float(os.getenv("CLAIMIFICATION_TEMPERATURE", "0.0")),
+        help="LLM temperature (default: 0.0)"
+    )
+    parser.add_argument(
+        "--context-sentences",
+        type=int,
+        default=int(os.getenv("CLAIMIFICATION_CONTEXT_SENTENCES", "2")),
+        help="Number of surrounding sentences for context (default: 2)"
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        help=(
+            "SQLite file for caching LLM responses across runs "
+            "(default: CLAIMIFICATION_CACHE_PATH, or no cache)"
+        )
+    )
+    parser.add_argument(
+        "--prices",
+        type=Path,
+        help=(
+            "JSON price table (USD per million tokens by model prefix) for "
+            "cost estimates (default: CLAIMIFICATION_PRICES, or no estimates)"
+        )
+    )
+    parser.add_argument(
+        "--event-log",
+        type=Path,
+        help=(
+            "JSONL file receiving a tracing event per run, stage call, LLM "
+            "request, retry and cache lookup (default: CLAIMIFICATION_EVENT_LOG)"
+        )
+    )
+
+
+def batch_main(argv: Optional[List[str]] = None):
+    """Entry point of ``claimification batch``: extract claims from a corpus."""
+    parser = argparse.ArgumentParser(
+        prog="claimification batch",
+        description=(
+            "Extract claims from many documents in one process and write "
+            "the results as JSONL"
+        )
+    )
+    parser.add_argument(
+        "source",
+        help="Directory, glob pattern, or JSONL/gzip-JSONL file of documents"
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        help=(
+            "JSONL output file (default: stdout). Documents already in it "
+            "are skipped, so an interrupted run can simply be restarted"
+        )
+    )
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Start a new output file instead of skipping finished documents"
+    )
+    parser.add_argument(
+        "--per-sentence",
+        action="store_true",
+        help="Write one record per sentence instead of one per document"
+    )
+    parser.add_argument(
+        "--text-field",
+        default="text",
+        help="JSONL field holding the document text (default: text)"
+    )
+    parser.add_argument(
+        "--id-field",
+        default="id",
+        help="JSONL field holding the document ID (default: id)"
+    )
+    parser.add_argument(
+        "--documents-concurrency",
+        type=int,
+        default=DEFAULT_DOCUMENT_CONCURRENCY,
+        help=f"Documents processed at the same time (default: {DEFAULT_DOCUMENT_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=8,
+        help="Sentences of one document processed at the same time (default: 8)"
+    )
+    parser.add_argument(
+        "--rpm",
+        type=float,
+        help="Requests per minute allowed for the provider, across all documents"
+    )
+    parser.add_argument(
+        "--tpm",
+        type=float,
+        help="Tokens per minute allowed for the provider, across all documents"
+    )
+    add_pipeline_arguments(parser)
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Suppress progress output"
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.cache:
+        configure_response_cache(args.cache)
+    if args.prices:
+        configure_prices(args.prices)
+    if args.event_log:
+        configure_hooks(JsonlEventLog(args.event_log))
+    if args.rpm or args.tpm:
+        configure_rate_limit(
+            provider_for_model(args.model),
+            requests_per_minute=args.rpm,
+            tokens_per_minute=args.tpm
+        )
+
+    pipeline = ClaimExtractionPipeline(
+        model=args.model,
+        temperature=args.temperature,
+        context_sentences=args.context_sentences,
+        max_concurrency=args.max_concurrency,
+        verbose=False
+    )
+
+    skip = set()
+    if args.output and not args.overwrite:
+        skip = completed_ids(args.output)
+    # Progress goes to stderr so that stdout can carry the results
+    console = Console(stderr=True)
+    total = count_documents(args.source)
+    documents = iter_documents(args.source, args.text_field, args.id_field)
+
+    progress = Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        TimeRemainingColumn(),
+        console=console,
+        disable=args.quiet
+    )
+
+    def on_document(record: dict, completed: int) -> None:
+        elapsed = progress.tasks[task].elapsed or 0.0
+        rate = completed / elapsed if elapsed else 0.0
+        progress.update(task, completed=completed, description=f"{rate:.2f} docs/s")
+
+    if args.output:
+        mode = "w" if args.overwrite else "a"
+        output = args.output.open(mode, encoding="utf-8")
+        # Continue after a partial last line of an interrupted run
+        if mode == "a" and output.tell() > 0:
+            with args.output.open("rb") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    output.write("\n")
+    else:
+        output = sys.stdout
+
+    try:
+        with progress:
+            task = progress.add_task("Starting...", total=total)
+            summary = asyncio.run(run_corpus(
+                pipeline,
+                documents,
+                output,
+                per_sentence=args.per_sentence,
+                concurrency=args.documents_concurrency,
+                skip=skip,
+                on_document=on_document
+            ))
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    if not args.quiet:
+        console.print("\n[bold]Batch summary[/bold]")
+        for key, value in summary.items():
+            console.print(f"  {key.replace('_', ' ')}: {value}")
+    if summary["failed"]:
+        sys.exit(1)
+
+
+def main(argv: Optional[List[str]] = None):
     """Main CLI entry point."""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "batch":
+        return batch_main(argv[1:])
+
     parser = argparse.ArgumentParser(
-        description="Extract factual claims from text"
+        description="Extract factual claims from text (or: claimification batch --help)"
     )
     parser.add_argument(
         "--text",
@@ -123,24 +360,7 @@ def main():
         type=str,
         help="Optional question for context"
     )
-    parser.add_argument(
-        "--model",
-        type=str,
-        default=os.getenv("CLAIMIFICATION_MODEL", "gpt-5-nano-2025-08-07"),
-        help="LLM model to use (default: gpt-5-nano-2025-08-07)"
-    )
-    parser.add_argument(
-        "--temperature",
-        type=float,
-        default=float(os.getenv("CLAIMIFICATION_TEMPERATURE", "0.0")),
-        help="LLM temperature (default: 0.0)"
-    )
-    parser.add_argument(
-        "--context-sentences",
-        type=int,
-        default=int(os.getenv("CLAIMIFICATION_CONTEXT_SENTENCES", "2")),
-        help="Number of surrounding sentences for context (default: 2)"
-    )
+    add_pipeline_arguments(parser)
     parser.add_argument(
         "--output",
         "-o",
@@ -153,21 +373,45 @@ def main():
         default="markdown",
         help="Output format (default: markdown)"
     )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        help="JSONL journal that records each finished sentence"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume from the --checkpoint journal, skipping finished sentences"
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
         help="Suppress progress output"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
-    # Get text
+    # Get text; a large file is read while the first sentences are
+    # processed (its output has no "text"), unless the checkpoint journal
+    # needs the whole text up front
+    text = None
     if args.text:
         text = args.text
     elif args.text_file:
-        text = args.text_file.read_text(encoding="utf-8")
+        if args.checkpoint or args.text_file.stat().st_size <= STREAM_FILE_BYTES:
+            text = args.text_file.read_text(encoding="utf-8")
     else:
         parser.error("Either --text or --text-file must be provided")
+    if args.resume and not args.checkpoint:
+        parser.error("--resume requires --checkpoint")
+
+    # Reuse LLM responses from earlier runs
+    if args.cache:
+        configure_response_cache(args.cache)
+    if args.prices:
+        configure_prices(args.prices)
+    if args.event_log:
+        configure_hooks(JsonlEventLog(args.event_log))
 
     # Initialize pipeline
     pipeline = ClaimExtractionPipeline(
@@ -178,10 +422,18 @@ def main():
     )
 
     # Extract claims
-    result = pipeline.extract_claims(
-        text=text,
-        question=args.question
-    )
+    if text is None:
+        result = pipeline.extract_claims_from(
+            iter_text_file(args.text_file),
+            question=args.question
+        )
+    else:
+        result = pipeline.extract_claims(
+            text=text,
+            question=args.question,
+            checkpoint=CheckpointJournal(args.checkpoint, resume=args.resume)
+            if args.checkpoint else None
+        )
 
     # Format output
     if args.format == "markdown":
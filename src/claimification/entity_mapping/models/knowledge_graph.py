@@ -1,6 +1,6 @@
 """Knowledge graph data model."""
 
-from typing import List, Dict, Any
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -41,6 +41,27 @@ class GraphMetadata(BaseModel):
         description="Number of inferred relationships"
     )
 
+    total_time_seconds: Optional[float] = Field(
+        default=None,
+        description="Wall time of the extraction in seconds"
+    )
+
+    stage_timing: Dict[str, Any] = Field(
+        default_factory=dict,
+        description=(
+            "Per-stage LLM call statistics: calls, attempts, retries, cache hits "
+            "and p50/p95/max of call time and rate-limit wait"
+        )
+    )
+
+    token_usage: Dict[str, Any] = Field(
+        default_factory=dict,
+        description=(
+            "Input, output and reasoning tokens in total and per stage, with "
+            "the estimated cost if the model has a configured price"
+        )
+    )
+
 
 class KnowledgeGraph(BaseModel):
     """Represents a complete knowledge graph extracted from text.
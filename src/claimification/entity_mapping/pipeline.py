@@ -1,12 +1,34 @@
 """Entity Relationship Mapping Pipeline - orchestrates all stages."""
 
-from typing import Optional
-from claimification.entity_mapping.models import KnowledgeGraph, GraphMetadata
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional
+from claimification.entity_mapping.models import (
+    Entity,
+    GraphMetadata,
+    KnowledgeGraph,
+    Relationship
+)
 from claimification.entity_mapping.stages import (
     EntityExtractionStage,
     RelationshipExtractionStage,
     RelationshipInferenceStage
 )
+from claimification.entity_mapping.utils.graph_utils import merge_knowledge_graphs
+from claimification.utils.chunking import (
+    DEFAULT_CHUNK_CHARS,
+    DEFAULT_OVERLAP_CHARS,
+    TextChunk,
+    plan_chunks
+)
+from claimification.utils.hooks import NULL_SPAN, start_span
+from claimification.utils.timing import record_calls, stage_statistics
+from claimification.utils.usage import usage_statistics, usage_totals
+
+
+# progress_callback(stage, completed, total), called per finished stage
+# (per finished chunk, with stage "chunk", for chunked texts)
+StageProgressCallback = Callable[[str, int, int], None]
 
 
 class EntityMappingPipeline:
@@ -23,7 +45,10 @@ class EntityMappingPipeline:
         model: str = "gpt-5-nano-2025-08-07",
         temperature: float = 0.0,
         confidence_threshold: float = 0.7,
-        include_inferred: bool = True
+        include_inferred: bool = True,
+        max_chunk_chars: int = DEFAULT_CHUNK_CHARS,
+        chunk_overlap_chars: int = DEFAULT_OVERLAP_CHARS,
+        chunk_concurrency: int = 4
     ):
         """Initialize the entity mapping pipeline.
 
@@ -32,11 +57,22 @@ class EntityMappingPipeline:
             temperature: Sampling temperature (0.0 for deterministic)
             confidence_threshold: Minimum confidence for inferred relationships
             include_inferred: Whether to run Stage 3 (inference)
+            max_chunk_chars: Texts longer than this are processed in
+                sentence-aligned chunks whose graphs are merged
+            chunk_overlap_chars: Preceding text passed as context with each
+                chunk
+            chunk_concurrency: Maximum number of chunks processed at once
+                by ``aextract_knowledge_graph``
         """
+        if chunk_concurrency < 1:
+            raise ValueError("chunk_concurrency must be at least 1")
         self.model = model
         self.temperature = temperature
         self.confidence_threshold = confidence_threshold
         self.include_inferred = include_inferred
+        self.max_chunk_chars = max_chunk_chars
+        self.chunk_overlap_chars = chunk_overlap_chars
+        self.chunk_concurrency = chunk_concurrency
 
         # Initialize stages
         self.stage1 = EntityExtractionStage(model, temperature)
@@ -50,22 +86,54 @@ class EntityMappingPipeline:
     def extract_knowledge_graph(
         self,
         text: str,
-        context: Optional[str] = None
+        context: Optional[str] = None,
+        progress_callback: Optional[StageProgressCallback] = None
     ) -> KnowledgeGraph:
         """Extract complete knowledge graph from text.
 
         Args:
             text: The text to analyze
             context: Optional contextual information
+            progress_callback: Called as ``(stage, completed, total)`` after
+                each stage
 
         Returns:
-            KnowledgeGraph with entities and relationships
+            KnowledgeGraph with entities and relationships; its metadata
+            includes the wall time, per-stage call timing and token usage
         """
+        started = time.perf_counter()
+        with self._run_span(text) as span, record_calls() as calls:
+            graph = self._with_timing(
+                self._extract_knowledge_graph(text, context, progress_callback),
+                calls, started, span)
+        return graph
+
+    def _extract_knowledge_graph(
+        self,
+        text: str,
+        context: Optional[str],
+        progress_callback: Optional[StageProgressCallback]
+    ) -> KnowledgeGraph:
+        """Run the stages, or the chunks of a long text (see ``extract_knowledge_graph``)."""
+        if len(text) > self.max_chunk_chars:
+            chunks = plan_chunks(text, self.max_chunk_chars, self.chunk_overlap_chars)
+            graphs = []
+            for chunk in chunks:
+                graphs.append(self.extract_knowledge_graph(
+                    chunk.text(text), self._chunk_context(text, chunk, context)))
+                if progress_callback is not None:
+                    progress_callback("chunk", len(graphs), len(chunks))
+            return merge_knowledge_graphs(graphs, self.model, context)
+
+        report = self._stage_reporter(progress_callback)
+
         # Stage 1: Extract entities
         entities = self.stage1.extract_entities(text, context)
+        report("entity_extraction")
 
         # Stage 2: Extract explicit relationships
         explicit_relationships = self.stage2.extract_relationships(text, entities)
+        report("relationship_extraction")
 
         # Stage 3: Infer implicit relationships (if enabled)
         inferred_relationships = []
@@ -75,7 +143,159 @@ class EntityMappingPipeline:
                 entities,
                 explicit_relationships
             )
+            report("relationship_inference")
+
+        return self._build_graph(entities, explicit_relationships, inferred_relationships)
+
+    async def aextract_knowledge_graph(
+        self,
+        text: str,
+        context: Optional[str] = None,
+        progress_callback: Optional[StageProgressCallback] = None
+    ) -> KnowledgeGraph:
+        """Asynchronously extract complete knowledge graph from text.
+
+        Awaits the stages' async methods, so the event loop stays free and
+        cancelling the caller cancels the outstanding LLM call. Long texts
+        are split into chunks, at most ``chunk_concurrency`` in flight.
 
+        Args:
+            text: The text to analyze
+            context: Optional contextual information
+            progress_callback: Called as ``(stage, completed, total)`` after
+                each stage
+
+        Returns:
+            KnowledgeGraph with entities and relationships; its metadata
+            includes the wall time, per-stage call timing and token usage
+        """
+        started = time.perf_counter()
+        with self._run_span(text) as span, record_calls() as calls:
+            graph = self._with_timing(
+                await self._aextract_knowledge_graph(text, context, progress_callback),
+                calls, started, span)
+        return graph
+
+    async def _aextract_knowledge_graph(
+        self,
+        text: str,
+        context: Optional[str],
+        progress_callback: Optional[StageProgressCallback]
+    ) -> KnowledgeGraph:
+        """Async counterpart of ``_extract_knowledge_graph``."""
+        if len(text) > self.max_chunk_chars:
+            return await self._aextract_chunked(text, context, progress_callback)
+
+        report = self._stage_reporter(progress_callback)
+
+        # Stage 1: Extract entities
+        entities = await self.stage1.aextract_entities(text, context)
+        report("entity_extraction")
+
+        # Stage 2: Extract explicit relationships
+        explicit_relationships = await self.stage2.aextract_relationships(text, entities)
+        report("relationship_extraction")
+
+        # Stage 3: Infer implicit relationships (if enabled)
+        inferred_relationships = []
+        if self.include_inferred:
+            inferred_relationships = await self.stage3.ainfer_relationships(
+                text,
+                entities,
+                explicit_relationships
+            )
+            report("relationship_inference")
+
+        return self._build_graph(entities, explicit_relationships, inferred_relationships)
+
+    async def _aextract_chunked(
+        self,
+        text: str,
+        context: Optional[str],
+        progress_callback: Optional[StageProgressCallback]
+    ) -> KnowledgeGraph:
+        """Extract graphs of the text's chunks concurrently and merge them."""
+        chunks = plan_chunks(text, self.max_chunk_chars, self.chunk_overlap_chars)
+        pending = iter(chunks)
+        graphs: Dict[int, KnowledgeGraph] = {}
+
+        # A fixed set of workers keeps at most chunk_concurrency chunk texts
+        # and prompts in memory at once
+        async def worker() -> None:
+            for chunk in pending:
+                graphs[chunk.index] = await self.aextract_knowledge_graph(
+                    chunk.text(text), self._chunk_context(text, chunk, context))
+                if progress_callback is not None:
+                    progress_callback("chunk", len(graphs), len(chunks))
+
+        await asyncio.gather(*(
+            worker() for _ in range(min(self.chunk_concurrency, len(chunks)))
+        ))
+        return merge_knowledge_graphs(
+            [graphs[index] for index in range(len(chunks))], self.model, context)
+
+    def _run_span(self, text: str):
+        """Tracing span of one extraction run (or of one chunk of a long text)."""
+        return start_span(
+            "run", pipeline="entity_mapping", model=self.model, text_chars=len(text))
+
+    def _with_timing(
+        self,
+        graph: KnowledgeGraph,
+        calls: List[Dict[str, Any]],
+        started: float,
+        span=NULL_SPAN
+    ) -> KnowledgeGraph:
+        """Add the wall time, call statistics and token usage to a graph's metadata.
+
+        For chunked texts, the calls of all chunks are aggregated. The
+        graph's size and tokens are also added to the run's tracing span.
+        """
+        graph.metadata.total_time_seconds = round(time.perf_counter() - started, 2)
+        graph.metadata.stage_timing = stage_statistics(
+            (call["stage"], call) for call in calls)
+        graph.metadata.token_usage = usage_statistics(
+            ((call["stage"], call.get("usage", {})) for call in calls), self.model)
+        if span.recording:
+            span.set_attributes(
+                entities=len(graph.entities),
+                relationships=len(graph.relationships),
+                **usage_totals(graph.metadata.token_usage)
+            )
+        return graph
+
+    @staticmethod
+    def _chunk_context(text: str, chunk: TextChunk, context: Optional[str]) -> Optional[str]:
+        """Combine the caller's context with the text preceding a chunk."""
+        overlap = chunk.overlap(text)
+        if not overlap:
+            return context
+        preceding = f"Preceding text (for reference only): {overlap}"
+        return f"{context}\n\n{preceding}" if context else preceding
+
+    def _stage_reporter(
+        self,
+        progress_callback: Optional[StageProgressCallback]
+    ) -> Callable[[str], None]:
+        """Wrap a progress callback so stages only report their name."""
+        total = 3 if self.include_inferred else 2
+        completed = 0
+
+        def report(stage: str) -> None:
+            nonlocal completed
+            completed += 1
+            if progress_callback is not None:
+                progress_callback(stage, completed, total)
+
+        return report
+
+    def _build_graph(
+        self,
+        entities: List[Entity],
+        explicit_relationships: List[Relationship],
+        inferred_relationships: List[Relationship]
+    ) -> KnowledgeGraph:
+        """Combine stage outputs into a KnowledgeGraph with metadata."""
         # Combine all relationships
         all_relationships = explicit_relationships + inferred_relationships
 
@@ -1,14 +1,14 @@
 """Entity extraction stage using LangChain."""
 
-import os
 from typing import List, Optional
 from pydantic import BaseModel
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
 from langchain_core.prompts import ChatPromptTemplate
 
 from claimification.entity_mapping.models.entity import Entity, EntityType
 from claimification.entity_mapping.prompts.entity_extraction import build_entity_extraction_prompt
+from claimification.utils.invocation import ainvoke_chain, invoke_chain, request_cache_key
+from claimification.utils.llm_clients import get_chat_model
+from claimification.utils.retry import RetryPolicy
 
 
 class EntityExtractionOutput(BaseModel):
@@ -22,34 +22,24 @@ class EntityExtractionStage:
     def __init__(
         self,
         model: str = "gpt-5-nano-2025-08-07",
-        temperature: float = 0.0
+        temperature: float = 0.0,
+        max_retries: int = 3
     ):
         """Initialize entity extraction stage.
 
         Args:
             model: LLM model to use
             temperature: Sampling temperature (0.0 for deterministic)
+            max_retries: Maximum attempts per LLM call
         """
         self.model_name = model
         self.temperature = temperature
+        self.retry_policy = RetryPolicy(max_attempts=max_retries)
         self.llm = self._initialize_llm()
 
     def _initialize_llm(self):
-        """Initialize LangChain LLM client."""
-        if "gpt" in self.model_name or "o1" in self.model_name:
-            return ChatOpenAI(
-                model=self.model_name,
-                temperature=self.temperature,
-                api_key=os.getenv("OPENAI_API_KEY")
-            )
-        elif "claude" in self.model_name:
-            return ChatAnthropic(
-                model=self.model_name,
-                temperature=self.temperature,
-                api_key=os.getenv("ANTHROPIC_API_KEY")
-            )
-        else:
-            raise ValueError(f"Unsupported model: {self.model_name}")
+        """Get the shared LangChain client for this stage's model."""
+        return get_chat_model(self.model_name, self.temperature)
 
     def extract_entities(
         self,
@@ -65,9 +55,60 @@ class EntityExtractionStage:
         Returns:
             List of extracted Entity objects
         """
-        # Build prompt
         prompts = build_entity_extraction_prompt(text, context)
 
+        # Invoke chain within the process-wide provider quota, with retries
+        result = invoke_chain(
+            self._build_chain(prompts),
+            self.model_name,
+            self.retry_policy,
+            prompts["system"] + prompts["user"],
+            cache_key=self._cache_key(prompts),
+            output_model=EntityExtractionOutput,
+            stage="entity_extraction"
+        )
+
+        return self._to_entities(result, context)
+
+    async def aextract_entities(
+        self,
+        text: str,
+        context: Optional[str] = None
+    ) -> List[Entity]:
+        """Asynchronously extract entities from text.
+
+        Args:
+            text: The text to extract entities from
+            context: Optional contextual information
+
+        Returns:
+            List of extracted Entity objects
+        """
+        prompts = build_entity_extraction_prompt(text, context)
+
+        result = await ainvoke_chain(
+            self._build_chain(prompts),
+            self.model_name,
+            self.retry_policy,
+            prompts["system"] + prompts["user"],
+            cache_key=self._cache_key(prompts),
+            output_model=EntityExtractionOutput,
+            stage="entity_extraction"
+        )
+
+        return self._to_entities(result, context)
+
+    def _cache_key(self, prompts: dict) -> Optional[str]:
+        """Response cache key of one request (None if caching is disabled)."""
+        return request_cache_key(
+            self.model_name,
+            self.temperature,
+            [("system", prompts["system"]), ("user", prompts["user"])],
+            EntityExtractionOutput
+        )
+
+    def _build_chain(self, prompts: dict):
+        """Create the prompt | structured LLM chain for one request."""
         # Create LangChain prompt template
         prompt_template = ChatPromptTemplate.from_messages([
             ("system", prompts["system"]),
@@ -76,12 +117,14 @@ class EntityExtractionStage:
 
         # Create structured output chain
         structured_llm = self.llm.with_structured_output(EntityExtractionOutput)
-        chain = prompt_template | structured_llm
+        return prompt_template | structured_llm
 
-        # Invoke chain
-        result = chain.invoke({})
-
-        # Convert to Entity objects with IDs
+    @staticmethod
+    def _to_entities(
+        result: EntityExtractionOutput,
+        context: Optional[str]
+    ) -> List[Entity]:
+        """Convert the LLM output to Entity objects with IDs."""
         entities = []
         for i, entity_dict in enumerate(result.entities, start=1):
             entity = Entity(
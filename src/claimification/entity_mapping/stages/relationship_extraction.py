@@ -1,10 +1,7 @@
 """Explicit relationship extraction stage using LangChain."""
 
-import os
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
 from langchain_core.prompts import ChatPromptTemplate
 
 from claimification.entity_mapping.models.entity import Entity
@@ -12,6 +9,9 @@ from claimification.entity_mapping.models.relationship import Relationship
 from claimification.entity_mapping.prompts.relationship_extraction import (
     build_relationship_extraction_prompt
 )
+from claimification.utils.invocation import ainvoke_chain, invoke_chain, request_cache_key
+from claimification.utils.llm_clients import get_chat_model
+from claimification.utils.retry import RetryPolicy
 
 
 class RelationshipExtractionOutput(BaseModel):
@@ -25,34 +25,24 @@ class RelationshipExtractionStage:
     def __init__(
         self,
         model: str = "gpt-5-nano-2025-08-07",
-        temperature: float = 0.0
+        temperature: float = 0.0,
+        max_retries: int = 3
     ):
         """Initialize relationship extraction stage.
 
         Args:
             model: LLM model to use
             temperature: Sampling temperature (0.0 for deterministic)
+            max_retries: Maximum attempts per LLM call
         """
         self.model_name = model
         self.temperature = temperature
+        self.retry_policy = RetryPolicy(max_attempts=max_retries)
         self.llm = self._initialize_llm()
 
     def _initialize_llm(self):
-        """Initialize LangChain LLM client."""
-        if "gpt" in self.model_name or "o1" in self.model_name:
-            return ChatOpenAI(
-                model=self.model_name,
-                temperature=self.temperature,
-                api_key=os.getenv("OPENAI_API_KEY")
-            )
-        elif "claude" in self.model_name:
-            return ChatAnthropic(
-                model=self.model_name,
-                temperature=self.temperature,
-                api_key=os.getenv("ANTHROPIC_API_KEY")
-            )
-        else:
-            raise ValueError(f"Unsupported model: {self.model_name}")
+        """Get the shared LangChain client for this stage's model."""
+        return get_chat_model(self.model_name, self.temperature)
 
     def extract_relationships(
         self,
@@ -71,9 +61,63 @@ class RelationshipExtractionStage:
         if not entities:
             return []
 
-        # Build prompt
         prompts = build_relationship_extraction_prompt(text, entities)
 
+        # Invoke chain within the process-wide provider quota, with retries
+        result = invoke_chain(
+            self._build_chain(prompts),
+            self.model_name,
+            self.retry_policy,
+            prompts["system"] + prompts["user"],
+            cache_key=self._cache_key(prompts),
+            output_model=RelationshipExtractionOutput,
+            stage="relationship_extraction"
+        )
+
+        return self._to_relationships(result)
+
+    async def aextract_relationships(
+        self,
+        text: str,
+        entities: List[Entity]
+    ) -> List[Relationship]:
+        """Asynchronously extract explicit relationships from text.
+
+        Args:
+            text: The original text
+            entities: List of entities from Stage 1
+
+        Returns:
+            List of explicit Relationship objects
+        """
+        if not entities:
+            return []
+
+        prompts = build_relationship_extraction_prompt(text, entities)
+
+        result = await ainvoke_chain(
+            self._build_chain(prompts),
+            self.model_name,
+            self.retry_policy,
+            prompts["system"] + prompts["user"],
+            cache_key=self._cache_key(prompts),
+            output_model=RelationshipExtractionOutput,
+            stage="relationship_extraction"
+        )
+
+        return self._to_relationships(result)
+
+    def _cache_key(self, prompts: dict) -> Optional[str]:
+        """Response cache key of one request (None if caching is disabled)."""
+        return request_cache_key(
+            self.model_name,
+            self.temperature,
+            [("system", prompts["system"]), ("user", prompts["user"])],
+            RelationshipExtractionOutput
+        )
+
+    def _build_chain(self, prompts: dict):
+        """Create the prompt | structured LLM chain for one request."""
         # Create LangChain prompt template
         prompt_template = ChatPromptTemplate.from_messages([
             ("system", prompts["system"]),
@@ -82,12 +126,11 @@ class RelationshipExtractionStage:
 
         # Create structured output chain
         structured_llm = self.llm.with_structured_output(RelationshipExtractionOutput)
-        chain = prompt_template | structured_llm
-
-        # Invoke chain
-        result = chain.invoke({})
+        return prompt_template | structured_llm
 
-        # Convert to Relationship objects (all explicit)
+    @staticmethod
+    def _to_relationships(result: RelationshipExtractionOutput) -> List[Relationship]:
+        """Convert the LLM output to Relationship objects (all explicit)."""
         relationships = []
         for rel_dict in result.relationships:
             relationship = Relationship(
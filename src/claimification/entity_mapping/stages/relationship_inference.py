@@ -1,10 +1,7 @@
 """Relationship inference stage using LangChain."""
 
-import os
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
 from langchain_core.prompts import ChatPromptTemplate
 
 from claimification.entity_mapping.models.entity import Entity
@@ -12,6 +9,9 @@ from claimification.entity_mapping.models.relationship import Relationship
 from claimification.entity_mapping.prompts.relationship_inference import (
     build_relationship_inference_prompt
 )
+from claimification.utils.invocation import ainvoke_chain, invoke_chain, request_cache_key
+from claimification.utils.llm_clients import get_chat_model
+from claimification.utils.retry import RetryPolicy
 
 
 class RelationshipInferenceOutput(BaseModel):
@@ -26,7 +26,8 @@ class RelationshipInferenceStage:
         self,
         model: str = "gpt-5-nano-2025-08-07",
         temperature: float = 0.0,
-        confidence_threshold: float = 0.7
+        confidence_threshold: float = 0.7,
+        max_retries: int = 3
     ):
         """Initialize relationship inference stage.
 
@@ -34,28 +35,17 @@ class RelationshipInferenceStage:
             model: LLM model to use
             temperature: Sampling temperature (0.0 for deterministic)
             confidence_threshold: Minimum confidence for inferred relationships
+            max_retries: Maximum attempts per LLM call
         """
         self.model_name = model
         self.temperature = temperature
         self.confidence_threshold = confidence_threshold
+        self.retry_policy = RetryPolicy(max_attempts=max_retries)
         self.llm = self._initialize_llm()
 
     def _initialize_llm(self):
-        """Initialize LangChain LLM client."""
-        if "gpt" in self.model_name or "o1" in self.model_name:
-            return ChatOpenAI(
-                model=self.model_name,
-                temperature=self.temperature,
-                api_key=os.getenv("OPENAI_API_KEY")
-            )
-        elif "claude" in self.model_name:
-            return ChatAnthropic(
-                model=self.model_name,
-                temperature=self.temperature,
-                api_key=os.getenv("ANTHROPIC_API_KEY")
-            )
-        else:
-            raise ValueError(f"Unsupported model: {self.model_name}")
+        """Get the shared LangChain client for this stage's model."""
+        return get_chat_model(self.model_name, self.temperature)
 
     def infer_relationships(
         self,
@@ -76,13 +66,73 @@ class RelationshipInferenceStage:
         if not entities:
             return []
 
-        # Build prompt
         prompts = build_relationship_inference_prompt(
             text,
             entities,
             existing_relationships
         )
 
+        # Invoke chain within the process-wide provider quota, with retries
+        result = invoke_chain(
+            self._build_chain(prompts),
+            self.model_name,
+            self.retry_policy,
+            prompts["system"] + prompts["user"],
+            cache_key=self._cache_key(prompts),
+            output_model=RelationshipInferenceOutput,
+            stage="relationship_inference"
+        )
+
+        return self._to_relationships(result)
+
+    async def ainfer_relationships(
+        self,
+        text: str,
+        entities: List[Entity],
+        existing_relationships: List[Relationship]
+    ) -> List[Relationship]:
+        """Asynchronously infer implicit relationships from text.
+
+        Args:
+            text: The original text
+            entities: List of entities from Stage 1
+            existing_relationships: Explicit relationships from Stage 2
+
+        Returns:
+            List of inferred Relationship objects
+        """
+        if not entities:
+            return []
+
+        prompts = build_relationship_inference_prompt(
+            text,
+            entities,
+            existing_relationships
+        )
+
+        result = await ainvoke_chain(
+            self._build_chain(prompts),
+            self.model_name,
+            self.retry_policy,
+            prompts["system"] + prompts["user"],
+            cache_key=self._cache_key(prompts),
+            output_model=RelationshipInferenceOutput,
+            stage="relationship_inference"
+        )
+
+        return self._to_relationships(result)
+
+    def _cache_key(self, prompts: dict) -> Optional[str]:
+        """Response cache key of one request (None if caching is disabled)."""
+        return request_cache_key(
+            self.model_name,
+            self.temperature,
+            [("system", prompts["system"]), ("user", prompts["user"])],
+            RelationshipInferenceOutput
+        )
+
+    def _build_chain(self, prompts: dict):
+        """Create the prompt | structured LLM chain for one request."""
         # Create LangChain prompt template
         prompt_template = ChatPromptTemplate.from_messages([
             ("system", prompts["system"]),
@@ -91,12 +141,10 @@ class RelationshipInferenceStage:
 
         # Create structured output chain
         structured_llm = self.llm.with_structured_output(RelationshipInferenceOutput)
-        chain = prompt_template | structured_llm
-
-        # Invoke chain
-        result = chain.invoke({})
+        return prompt_template | structured_llm
 
-        # Convert to Relationship objects (all inferred)
+    def _to_relationships(self, result: RelationshipInferenceOutput) -> List[Relationship]:
+        """Convert the LLM output to Relationship objects (all inferred)."""
         relationships = []
         for rel_dict in result.relationships:
             confidence = rel_dict.get("confidence", 0.0)
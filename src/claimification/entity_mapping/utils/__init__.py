@@ -0,0 +1,5 @@
+"""Utilities for entity relationship mapping."""
+
+from claimification.entity_mapping.utils.graph_utils import merge_knowledge_graphs
+
+__all__ = ["merge_knowledge_graphs"]
@@ -0,0 +1,83 @@
+"""Utilities for combining knowledge graphs."""
+
+from typing import Dict, List, Optional, Tuple
+
+from claimification.entity_mapping.models import (
+    Entity,
+    GraphMetadata,
+    KnowledgeGraph,
+    Relationship
+)
+
+
+def merge_knowledge_graphs(
+    graphs: List[KnowledgeGraph],
+    model_used: str,
+    context: Optional[str] = None
+) -> KnowledgeGraph:
+    """Merge graphs extracted from chunks of one text into a single graph.
+
+    Entities with the same canonical text (case-insensitive) and type are
+    merged and renumbered ``e1, e2, ...`` in order of first appearance, so
+    IDs are stable for a given chunking. Relationships are remapped to the
+    merged IDs; duplicates keep the explicit one, or else the one with the
+    highest confidence.
+
+    Args:
+        graphs: Graphs of consecutive chunks, in text order
+        model_used: Model name for the merged graph's metadata
+        context: Context to record on the merged entities
+
+    Returns:
+        The merged KnowledgeGraph
+    """
+    entities: Dict[Tuple[str, str], Entity] = {}
+    relationships: Dict[Tuple[str, str, str], Relationship] = {}
+
+    for graph in graphs:
+        # Map this graph's entity IDs to merged IDs
+        id_map: Dict[str, str] = {}
+        for entity in graph.entities:
+            key = (entity.text.strip().lower(), str(entity.type))
+            merged = entities.get(key)
+            if merged is None:
+                merged = entities[key] = Entity(
+                    id=f"e{len(entities) + 1}",
+                    text=entity.text,
+                    type=entity.type,
+                    mentions=[],
+                    context=context
+                )
+            for mention in entity.mentions:
+                if mention not in merged.mentions:
+                    merged.mentions.append(mention)
+            id_map[entity.id] = merged.id
+
+        for rel in graph.relationships:
+            source = id_map.get(rel.source_entity_id)
+            target = id_map.get(rel.target_entity_id)
+            if source is None or target is None:
+                continue
+            key = (source, target, rel.relationship_type)
+            existing = relationships.get(key)
+            if existing is not None and (
+                not existing.is_inferred or existing.confidence >= rel.confidence
+            ):
+                continue
+            relationships[key] = rel.model_copy(
+                update={"source_entity_id": source, "target_entity_id": target})
+
+    all_relationships = list(relationships.values())
+    explicit = sum(1 for rel in all_relationships if not rel.is_inferred)
+
+    return KnowledgeGraph(
+        entities=list(entities.values()),
+        relationships=all_relationships,
+        metadata=GraphMetadata(
+            model_used=model_used,
+            total_entities=len(entities),
+            total_relationships=len(all_relationships),
+            explicit_relationships=explicit,
+            inferred_relationships=len(all_relationships) - explicit
+        )
+    )
@@ -0,0 +1,113 @@
+"""Batch tool calls: one extraction per document, many documents per call.
+
+A batch call validates and processes each document independently, so one
+bad or failing document yields an error entry instead of failing the whole
+call. Documents share the server's warm pipeline (and with it the LLM
+clients and rate limits); at most ``max_concurrency`` run at once.
+"""
+
+import asyncio
+import json
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from claimification.utils.usage import sum_usage
+
+
+# Maximum number of documents accepted in one batch call
+DEFAULT_MAX_BATCH_SIZE = int(os.getenv("CLAIMIFICATION_MCP_MAX_BATCH_SIZE", "100"))
+# Documents of one batch processed at the same time
+DEFAULT_BATCH_CONCURRENCY = int(os.getenv("CLAIMIFICATION_MCP_BATCH_CONCURRENCY", "4"))
+
+# Called with (item, completed, total) as each document finishes
+ItemCallback = Callable[[Dict[str, Any], int, int], None]
+
+
+def validate_batch(texts: Any, max_size: int = DEFAULT_MAX_BATCH_SIZE) -> List[str]:
+    """Validate the ``texts`` argument of a batch tool.
+
+    Args:
+        texts: Tool argument, expected to be a list of strings
+        max_size: Maximum number of documents
+
+    Returns:
+        The texts
+
+    Raises:
+        ValueError: If texts is not a non-empty list of strings within the limit
+    """
+    if not isinstance(texts, list) or not texts:
+        raise ValueError("texts must be a non-empty array of strings")
+    if len(texts) > max_size:
+        raise ValueError(f"Too many texts (max {max_size} per batch)")
+    if not all(isinstance(text, str) for text in texts):
+        raise ValueError("texts must contain only strings")
+    return texts
+
+
+async def run_batch(
+    texts: List[str],
+    process: Callable[[str], Awaitable[Dict[str, Any]]],
+    validate: Callable[[str], None],
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    on_item: Optional[ItemCallback] = None
+) -> List[Dict[str, Any]]:
+    """Process each text, collecting per-document results or errors.
+
+    Args:
+        texts: Documents to process
+        process: Coroutine function returning the compact result of one text
+        validate: Raises ValueError for a text that must not be processed
+        max_concurrency: Maximum number of documents processed at once
+        on_item: Optional callback run as each document finishes
+
+    Returns:
+        One entry per text, in input order: ``{"index": i, **result}`` on
+        success, ``{"index": i, "error": message}`` on failure
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    completed = 0
+
+    async def run_one(index: int, text: str) -> Dict[str, Any]:
+        nonlocal completed
+        async with semaphore:
+            try:
+                validate(text)
+                item = {"index": index, **await process(text)}
+            except Exception as e:
+                item = {"index": index, "error": str(e)}
+        completed += 1
+        if on_item is not None:
+            on_item(item, completed, len(texts))
+        return item
+
+    return list(await asyncio.gather(
+        *(run_one(index, text) for index, text in enumerate(texts))
+    ))
+
+
+def format_batch_result(items: List[Dict[str, Any]]) -> str:
+    """Serialize batch results as compact JSON with success/failure counts.
+
+    If the items report token usage, the batch's total usage is included.
+    """
+    failed = sum(1 for item in items if "error" in item)
+    output: Dict[str, Any] = {
+        "documents": len(items),
+        "succeeded": len(items) - failed,
+        "failed": failed,
+    }
+    usages = [item["usage"] for item in items if "usage" in item]
+    if usages:
+        output["usage"] = sum_usage(usages)
+    output["results"] = items
+    return json.dumps(
+        output,
+        ensure_ascii=False,
+        separators=(",", ":")
+    )
+
+
+def format_batch_error(error: Exception) -> str:
+    """Serialize an error that rejected the whole batch."""
+    return json.dumps({"error": str(error)}, ensure_ascii=False)
@@ -31,12 +31,33 @@ from mcp.types import Tool, TextContent
 
 # Claim Extraction imports
 from claimification.claim_extraction.pipeline import ClaimExtractionPipeline
-from claimification.claim_extraction.models import PipelineResult
-
+from claimification.claim_extraction.models import ClaimExtractionResult, PipelineResult
+from claimification.mcp_servers.batch import (
+    DEFAULT_MAX_BATCH_SIZE,
+    format_batch_error,
+    format_batch_result,
+    run_batch,
+    validate_batch
+)
+from claimification.mcp_servers.job_limiter import DEFAULT_MAX_INPUT_CHARS, JobLimiter
+from claimification.mcp_servers.pipeline_pool import PipelinePool, env_flag
+from claimification.mcp_servers.progress import ProgressReporter
+from claimification.utils.usage import format_usage, usage_totals
+
+
+DEFAULT_MODEL = os.getenv("CLAIMIFICATION_MODEL", "gpt-5-nano-2025-08-07")
 
 # Initialize server
 server = Server("claim-extraction")
 
+# Warm pipelines reused across tool calls (no console output in MCP mode)
+pipeline_pool = PipelinePool(
+    lambda **settings: ClaimExtractionPipeline(verbose=False, **settings)
+)
+
+# Bounds concurrent extractions (CLAIMIFICATION_MCP_MAX_JOBS/_MAX_QUEUED)
+job_limiter = JobLimiter()
+
 
 def format_result_as_markdown(result: PipelineResult) -> str:
     """Format PipelineResult as readable markdown.
@@ -58,6 +79,8 @@ def format_result_as_markdown(result: PipelineResult) -> str:
     output_lines.append(f"- **Claims extracted:** {stats['total_claims']}")
     output_lines.append(f"- **Processing time:** {result.statistics.get('total_time_seconds', 'N/A')}s")
     output_lines.append(f"- **Model used:** {result.statistics.get('model_used', 'N/A')}")
+    if "usage" in result.statistics:
+        output_lines.append(f"- **Tokens:** {format_usage(result.statistics['usage'])}")
     output_lines.append("")
 
     # Extracted claims
@@ -102,6 +125,50 @@ def format_result_as_markdown(result: PipelineResult) -> str:
     return "\n".join(output_lines)
 
 
+def format_progress_message(
+    sentence_result: ClaimExtractionResult,
+    completed: int,
+    total: int,
+    include_claims: bool
+) -> str:
+    """Describe a finished sentence for a progress notification.
+
+    Args:
+        sentence_result: The finished sentence
+        completed: Number of sentences finished so far
+        total: Total number of sentences
+        include_claims: Append the sentence's extracted claims
+
+    Returns:
+        Progress message text
+    """
+    message = f"Sentence {completed}/{total}: {sentence_result.status.value}"
+    if include_claims and sentence_result.claims:
+        message += "\n" + "\n".join(f"- {claim.text}" for claim in sentence_result.claims)
+    return message
+
+
+def compact_result(result: PipelineResult) -> dict[str, Any]:
+    """Reduce a PipelineResult to the fields a batch caller needs.
+
+    Args:
+        result: The pipeline result of one document
+
+    Returns:
+        Claims, sentence count, token usage and (if any) number of failed
+        sentences
+    """
+    stats = result.get_statistics_summary()
+    compact: dict[str, Any] = {
+        "claims": [claim.text for claim in result.get_all_claims()],
+        "sentences": stats["total_sentences"],
+        "usage": usage_totals(result.statistics.get("usage", {})),
+    }
+    if stats["processing_error"]:
+        compact["sentence_errors"] = stats["processing_error"]
+    return compact
+
+
 def validate_input(text: str) -> None:
     """Validate input text.
 
@@ -113,8 +180,8 @@ def validate_input(text: str) -> None:
     """
     if not text or len(text.strip()) == 0:
         raise ValueError("Text cannot be empty")
-    if len(text) > 50000:  # ~50KB limit
-        raise ValueError("Text too long (max 50,000 characters)")
+    if len(text) > DEFAULT_MAX_INPUT_CHARS:
+        raise ValueError(f"Text too long (max {DEFAULT_MAX_INPUT_CHARS:,} characters)")
 
 
 @server.list_tools()
@@ -134,7 +201,10 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "text": {
                         "type": "string",
-                        "description": "The text to extract claims from (max 50,000 characters)"
+                        "description": (
+                            f"The text to extract claims from (max {DEFAULT_MAX_INPUT_CHARS:,} "
+                            "characters)"
+                        )
                     },
                     "question": {
                         "type": "string",
@@ -144,10 +214,52 @@ async def list_tools() -> list[Tool]:
                         "type": "string",
                         "description": "Optional LLM model to use (default: gpt-5-nano-2025-08-07)",
                         "default": "gpt-5-nano-2025-08-07"
+                    },
+                    "stream_claims": {
+                        "type": "boolean",
+                        "description": (
+                            "Include each finished sentence's claims in the progress "
+                            "notifications, so early claims arrive before the full report"
+                        ),
+                        "default": False
                     }
                 },
                 "required": ["text"]
             }
+        ),
+        Tool(
+            name="extract_claims_batch",
+            description=(
+                "Extract verifiable factual claims from many short texts in one call "
+                "(e.g., ticket comments or chat messages). Returns compact JSON with one "
+                "result per text, in input order; a text that fails gets an error entry "
+                "instead of failing the whole batch."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "texts": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": (
+                            f"The texts to extract claims from (max {DEFAULT_MAX_BATCH_SIZE} "
+                            f"texts, each max {DEFAULT_MAX_INPUT_CHARS:,} characters)"
+                        ),
+                        "minItems": 1,
+                        "maxItems": DEFAULT_MAX_BATCH_SIZE
+                    },
+                    "question": {
+                        "type": "string",
+                        "description": "Optional question for additional context, shared by all texts"
+                    },
+                    "model": {
+                        "type": "string",
+                        "description": "Optional LLM model to use (default: gpt-5-nano-2025-08-07)",
+                        "default": "gpt-5-nano-2025-08-07"
+                    }
+                },
+                "required": ["texts"]
+            }
         )
     ]
 
@@ -163,6 +275,8 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     Returns:
         List of TextContent responses
     """
+    if name == "extract_claims_batch":
+        return await call_batch_tool(arguments)
     if name != "extract_claims":
         raise ValueError(f"Unknown tool: {name}")
 
@@ -170,23 +284,32 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         # Extract arguments
         text = arguments.get("text", "")
         question = arguments.get("question")
-        model = arguments.get("model", os.getenv("CLAIMIFICATION_MODEL", "gpt-5-nano-2025-08-07"))
+        model = arguments.get("model", DEFAULT_MODEL)
+        stream_claims = arguments.get("stream_claims", False)
 
         # Validate input
         validate_input(text)
 
-        # Initialize pipeline (with verbose=False for MCP)
-        pipeline = ClaimExtractionPipeline(
-            model=model,
-            temperature=0.0,
-            verbose=False  # No console output in MCP mode
-        )
+        # Reuse the warm pipeline for these settings
+        pipeline = pipeline_pool.get(model=model, temperature=0.0)
 
-        # Run extraction
-        result: PipelineResult = pipeline.extract_claims(
-            text=text,
-            question=question
-        )
+        # Run extraction on the async path so the stdio loop stays responsive;
+        # cancelling this request cancels the outstanding LLM calls
+        # Notify the client as sentences finish (if it sent a progress token)
+        reporter = ProgressReporter.for_request(server)
+
+        def on_sentence(sentence_result: ClaimExtractionResult, completed: int, total: int):
+            reporter.report(
+                completed, total,
+                format_progress_message(sentence_result, completed, total, stream_claims)
+            )
+
+        async with reporter, job_limiter.slot():
+            result: PipelineResult = await pipeline.aextract_claims(
+                text=text,
+                question=question,
+                progress_callback=on_sentence
+            )
 
         # Format result
         formatted_output = format_result_as_markdown(result)
@@ -206,7 +329,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 
 **Suggestions:**
 - Check that your API key (OPENAI_API_KEY or ANTHROPIC_API_KEY) is set in .env
-- Ensure the input text is not empty and under 50,000 characters
+- Ensure the input text is not empty and under {DEFAULT_MAX_INPUT_CHARS:,} characters
 - Verify your API key has sufficient credits
 - Try a different model if the current one is unavailable
 
@@ -220,10 +343,53 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         ]
 
 
+async def call_batch_tool(arguments: dict[str, Any]) -> list[TextContent]:
+    """Handle an extract_claims_batch call.
+
+    Args:
+        arguments: Tool arguments
+
+    Returns:
+        A single TextContent with the batch results as JSON
+    """
+    try:
+        texts = validate_batch(arguments.get("texts"))
+        question = arguments.get("question")
+        pipeline = pipeline_pool.get(
+            model=arguments.get("model", DEFAULT_MODEL), temperature=0.0)
+
+        # Sentences repeated across the batch's documents are processed once
+        dedup_scope: dict = {}
+
+        async def process(text: str) -> dict[str, Any]:
+            return compact_result(await pipeline.aextract_claims(
+                text=text, question=question, dedup_scope=dedup_scope))
+
+        # Report each finished document (if the client sent a progress token)
+        reporter = ProgressReporter.for_request(server)
+
+        def on_item(item: dict[str, Any], completed: int, total: int):
+            status = "error" if "error" in item else f"{len(item['claims'])} claims"
+            reporter.report(completed, total, f"Text {item['index'] + 1}: {status}")
+
+        # The whole batch occupies one job slot
+        async with reporter, job_limiter.slot():
+            items = await run_batch(texts, process, validate_input, on_item=on_item)
+
+        return [TextContent(type="text", text=format_batch_result(items))]
+
+    except Exception as e:
+        return [TextContent(type="text", text=format_batch_error(e))]
+
+
 async def main():
     """Main entry point for the MCP server."""
     from mcp.server.stdio import stdio_server
 
+    # Build the default pipeline before the first tool call arrives
+    if env_flag("CLAIMIFICATION_MCP_PREWARM"):
+        pipeline_pool.prewarm(model=DEFAULT_MODEL, temperature=0.0)
+
     async with stdio_server() as (read_stream, write_stream):
         await server.run(
             read_stream,
@@ -31,11 +31,61 @@ from mcp.types import Tool, TextContent
 
 # Entity mapping imports
 from claimification.entity_mapping import EntityMappingPipeline, KnowledgeGraph
+from claimification.mcp_servers.batch import (
+    DEFAULT_MAX_BATCH_SIZE,
+    format_batch_error,
+    format_batch_result,
+    run_batch,
+    validate_batch
+)
+from claimification.mcp_servers.job_limiter import DEFAULT_MAX_INPUT_CHARS, JobLimiter
+from claimification.mcp_servers.pipeline_pool import PipelinePool, env_flag
+from claimification.mcp_servers.progress import ProgressReporter
+from claimification.utils.usage import format_usage, usage_totals
 
 
+DEFAULT_MODEL = os.getenv("ENTITY_MAPPING_MODEL", "gpt-5-nano-2025-08-07")
+
 # Initialize server
 server = Server("entity-mapping")
 
+# Warm pipelines reused across tool calls
+pipeline_pool = PipelinePool(EntityMappingPipeline)
+
+# Bounds concurrent extractions (CLAIMIFICATION_MCP_MAX_JOBS/_MAX_QUEUED)
+job_limiter = JobLimiter()
+
+
+def compact_graph(knowledge_graph: KnowledgeGraph) -> dict[str, Any]:
+    """Reduce a KnowledgeGraph to the fields a batch caller needs.
+
+    Args:
+        knowledge_graph: The graph of one document
+
+    Returns:
+        Entities (id, text, type), relationships (source, target, type,
+        plus confidence for inferred ones) and token usage
+    """
+    relationships = []
+    for rel in knowledge_graph.relationships:
+        compact = {
+            "source": rel.source_entity_id,
+            "target": rel.target_entity_id,
+            "type": rel.relationship_type,
+        }
+        if rel.is_inferred:
+            compact["confidence"] = rel.confidence
+        relationships.append(compact)
+
+    return {
+        "entities": [
+            {"id": entity.id, "text": entity.text, "type": entity.type}
+            for entity in knowledge_graph.entities
+        ],
+        "relationships": relationships,
+        "usage": usage_totals(knowledge_graph.metadata.token_usage),
+    }
+
 
 def validate_input(text: str) -> None:
     """Validate input text.
@@ -48,8 +98,8 @@ def validate_input(text: str) -> None:
     """
     if not text or len(text.strip()) == 0:
         raise ValueError("Text cannot be empty")
-    if len(text) > 50000:  # ~50KB limit
-        raise ValueError("Text too long (max 50,000 characters)")
+    if len(text) > DEFAULT_MAX_INPUT_CHARS:
+        raise ValueError(f"Text too long (max {DEFAULT_MAX_INPUT_CHARS:,} characters)")
 
 
 @server.list_tools()
@@ -70,7 +120,10 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "text": {
                         "type": "string",
-                        "description": "The text to analyze (max 50,000 characters)"
+                        "description": (
+                            f"The text to analyze (max {DEFAULT_MAX_INPUT_CHARS:,} characters; "
+                            "long texts are processed in chunks)"
+                        )
                     },
                     "context": {
                         "type": "string",
@@ -96,6 +149,52 @@ async def list_tools() -> list[Tool]:
                 },
                 "required": ["text"]
             }
+        ),
+        Tool(
+            name="extract_entities_and_relationships_batch",
+            description=(
+                "Extract entities and relationships from many short texts in one call "
+                "(e.g., ticket comments or chat messages). Returns compact JSON with one "
+                "graph per text, in input order; a text that fails gets an error entry "
+                "instead of failing the whole batch."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "texts": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": (
+                            f"The texts to analyze (max {DEFAULT_MAX_BATCH_SIZE} texts, "
+                            f"each max {DEFAULT_MAX_INPUT_CHARS:,} characters)"
+                        ),
+                        "minItems": 1,
+                        "maxItems": DEFAULT_MAX_BATCH_SIZE
+                    },
+                    "context": {
+                        "type": "string",
+                        "description": "Optional contextual information, shared by all texts"
+                    },
+                    "model": {
+                        "type": "string",
+                        "description": "Optional LLM model to use (default: gpt-5-nano-2025-08-07)",
+                        "default": "gpt-5-nano-2025-08-07"
+                    },
+                    "include_inferred": {
+                        "type": "boolean",
+                        "description": "Whether to include inferred relationships (default: true)",
+                        "default": True
+                    },
+                    "confidence_threshold": {
+                        "type": "number",
+                        "description": "Minimum confidence for inferred relationships (default: 0.7)",
+                        "default": 0.7,
+                        "minimum": 0.0,
+                        "maximum": 1.0
+                    }
+                },
+                "required": ["texts"]
+            }
         )
     ]
 
@@ -111,6 +210,8 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     Returns:
         List of TextContent responses
     """
+    if name == "extract_entities_and_relationships_batch":
+        return await call_batch_tool(arguments)
     if name != "extract_entities_and_relationships":
         raise ValueError(f"Unknown tool: {name}")
 
@@ -118,15 +219,15 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         # Extract arguments
         text = arguments.get("text", "")
         context = arguments.get("context")
-        model = arguments.get("model", os.getenv("ENTITY_MAPPING_MODEL", "gpt-5-nano-2025-08-07"))
+        model = arguments.get("model", DEFAULT_MODEL)
         include_inferred = arguments.get("include_inferred", True)
         confidence_threshold = arguments.get("confidence_threshold", 0.7)
 
         # Validate input
         validate_input(text)
 
-        # Initialize pipeline
-        pipeline = EntityMappingPipeline(
+        # Reuse the warm pipeline for these settings
+        pipeline = pipeline_pool.get(
             model=model,
             temperature=0.0,
             confidence_threshold=confidence_threshold,
@@ -134,10 +235,18 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         )
 
         # Extract knowledge graph
-        knowledge_graph: KnowledgeGraph = pipeline.extract_knowledge_graph(
-            text=text,
-            context=context
-        )
+        # Notify the client after each stage (if it sent a progress token)
+        reporter = ProgressReporter.for_request(server)
+
+        def on_stage(stage: str, completed: int, total: int):
+            reporter.report(completed, total, f"Finished {stage.replace('_', ' ')}")
+
+        async with reporter, job_limiter.slot():
+            knowledge_graph: KnowledgeGraph = await pipeline.aextract_knowledge_graph(
+                text=text,
+                context=context,
+                progress_callback=on_stage
+            )
 
         # Format output as markdown with both summary and JSON
         output_lines = ["# Entity Relationship Mapping Results\n"]
@@ -155,6 +264,9 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         output_lines.append(f"- **Explicit relationships:** {knowledge_graph.metadata.explicit_relationships}")
         output_lines.append(f"- **Inferred relationships:** {knowledge_graph.metadata.inferred_relationships}")
         output_lines.append(f"- **Created at:** {knowledge_graph.metadata.created_at}")
+        if knowledge_graph.metadata.token_usage:
+            output_lines.append(
+                f"- **Tokens:** {format_usage(knowledge_graph.metadata.token_usage)}")
         output_lines.append("\n")
 
         # JSON export
@@ -180,7 +292,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 
 **Suggestions:**
 - Check that your API key (OPENAI_API_KEY or ANTHROPIC_API_KEY) is set
-- Ensure the input text is not empty and under 50,000 characters
+- Ensure the input text is not empty and under {DEFAULT_MAX_INPUT_CHARS:,} characters
 - Verify your API key has sufficient credits
 - Try a different model if the current one is unavailable
 
@@ -194,10 +306,59 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         ]
 
 
+async def call_batch_tool(arguments: dict[str, Any]) -> list[TextContent]:
+    """Handle an extract_entities_and_relationships_batch call.
+
+    Args:
+        arguments: Tool arguments
+
+    Returns:
+        A single TextContent with the batch results as JSON
+    """
+    try:
+        texts = validate_batch(arguments.get("texts"))
+        context = arguments.get("context")
+        pipeline = pipeline_pool.get(
+            model=arguments.get("model", DEFAULT_MODEL),
+            temperature=0.0,
+            confidence_threshold=arguments.get("confidence_threshold", 0.7),
+            include_inferred=arguments.get("include_inferred", True)
+        )
+
+        async def process(text: str) -> dict[str, Any]:
+            return compact_graph(
+                await pipeline.aextract_knowledge_graph(text=text, context=context))
+
+        # Report each finished document (if the client sent a progress token)
+        reporter = ProgressReporter.for_request(server)
+
+        def on_item(item: dict[str, Any], completed: int, total: int):
+            status = "error" if "error" in item else f"{len(item['entities'])} entities"
+            reporter.report(completed, total, f"Text {item['index'] + 1}: {status}")
+
+        # The whole batch occupies one job slot
+        async with reporter, job_limiter.slot():
+            items = await run_batch(texts, process, validate_input, on_item=on_item)
+
+        return [TextContent(type="text", text=format_batch_result(items))]
+
+    except Exception as e:
+        return [TextContent(type="text", text=format_batch_error(e))]
+
+
 async def main():
     """Main entry point for the MCP server."""
     from mcp.server.stdio import stdio_server
 
+    # Build the default pipeline before the first tool call arrives
+    if env_flag("CLAIMIFICATION_MCP_PREWARM"):
+        pipeline_pool.prewarm(
+            model=DEFAULT_MODEL,
+            temperature=0.0,
+            confidence_threshold=0.7,
+            include_inferred=True
+        )
+
     async with stdio_server() as (read_stream, write_stream):
         await server.run(
             read_stream,
@@ -0,0 +1,83 @@
+"""Admission control for concurrent MCP tool calls.
+
+A server process runs at most ``max_in_flight`` extraction jobs at once and
+lets at most ``max_queued`` further calls wait for a slot. Calls beyond that
+are rejected right away with ServerBusyError instead of piling up. Inputs
+longer than ``DEFAULT_MAX_INPUT_CHARS`` are rejected before they take a slot.
+"""
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+
+DEFAULT_MAX_JOBS = int(os.getenv("CLAIMIFICATION_MCP_MAX_JOBS", "4"))
+DEFAULT_MAX_QUEUED = int(os.getenv("CLAIMIFICATION_MCP_MAX_QUEUED", "16"))
+# Longest accepted input; longer texts are processed in chunks up to this size
+DEFAULT_MAX_INPUT_CHARS = int(os.getenv("CLAIMIFICATION_MCP_MAX_INPUT_CHARS", "1000000"))
+
+
+class ServerBusyError(RuntimeError):
+    """Raised when both the job slots and the wait queue are full."""
+
+
+class JobLimiter:
+    """Bounds in-flight and waiting tool calls of one server."""
+
+    def __init__(
+        self,
+        max_in_flight: int = DEFAULT_MAX_JOBS,
+        max_queued: int = DEFAULT_MAX_QUEUED
+    ):
+        """Initialize the limiter.
+
+        Args:
+            max_in_flight: Maximum number of jobs running at once
+            max_queued: Maximum number of jobs waiting for a slot
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        if max_queued < 0:
+            raise ValueError("max_queued must not be negative")
+        self.max_in_flight = max_in_flight
+        self.max_queued = max_queued
+        self.in_flight = 0
+        self.queued = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # A semaphore is bound to the loop it is first awaited in
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._loop = loop
+        return self._semaphore
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a job slot for the duration of the block.
+
+        Raises:
+            ServerBusyError: If all slots are taken and the queue is full
+        """
+        semaphore = self._get_semaphore()
+        if semaphore.locked() and self.queued >= self.max_queued:
+            raise ServerBusyError(
+                f"Server busy: {self.in_flight} jobs running and "
+                f"{self.queued} waiting (limit {self.max_in_flight} + {self.max_queued})"
+            )
+
+        self.queued += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.queued -= 1
+
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            semaphore.release()
@@ -0,0 +1,149 @@
+"""Warm pipeline pool shared by tool calls of one MCP server process.
+
+Building a pipeline per tool call throws away its agents and prompt chains.
+The pool keeps one long-lived pipeline per settings combination and hands
+the same instance to every call with those settings. Pipelines hold no
+per-call state, so concurrent calls can share an instance.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+# Pipelines unused for this long are dropped
+DEFAULT_IDLE_TIMEOUT = float(os.getenv("CLAIMIFICATION_MCP_POOL_IDLE_SECONDS", "900"))
+# Maximum number of distinct settings combinations kept warm
+DEFAULT_MAX_SIZE = int(os.getenv("CLAIMIFICATION_MCP_POOL_MAX_SIZE", "8"))
+
+
+@dataclass
+class _PoolEntry:
+    pipeline: Any
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    uses: int = 0
+
+
+class PipelinePool:
+    """Lazily created, reusable pipelines keyed by their settings.
+
+    Entries idle for longer than ``idle_timeout`` are evicted, and the least
+    recently used entry is evicted when more than ``max_size`` settings
+    combinations are in use.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[..., Any],
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        max_size: int = DEFAULT_MAX_SIZE
+    ):
+        """Initialize the pool.
+
+        Args:
+            factory: Called with the settings as keyword arguments to build
+                a pipeline
+            idle_timeout: Seconds after which an unused pipeline is dropped
+            max_size: Maximum number of pipelines kept
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.factory = factory
+        self.idle_timeout = idle_timeout
+        self.max_size = max_size
+        self._entries: Dict[Tuple, _PoolEntry] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(settings: Dict[str, Any]) -> Tuple:
+        return tuple(sorted(settings.items()))
+
+    def get(self, **settings: Any) -> Any:
+        """Return the warm pipeline for these settings, creating it if needed."""
+        key = self._key(settings)
+        with self._lock:
+            self._evict_idle_locked(time.monotonic())
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+                entry = self._entries[key] = _PoolEntry(self.factory(**settings))
+                self._evict_lru_locked()
+            entry.last_used = time.monotonic()
+            entry.uses += 1
+            return entry.pipeline
+
+    def prewarm(self, **settings: Any) -> bool:
+        """Create the pipeline for these settings ahead of the first call.
+
+        Returns:
+            False if the pipeline could not be built (e.g., missing API key);
+            it will then be built, and the error reported, on first use
+        """
+        key = self._key(settings)
+        try:
+            pipeline = self.factory(**settings)
+        except Exception:
+            return False
+        with self._lock:
+            self._entries.setdefault(key, _PoolEntry(pipeline))
+            self._evict_lru_locked()
+        return True
+
+    def evict_idle(self) -> int:
+        """Drop pipelines idle for longer than ``idle_timeout``.
+
+        Returns:
+            Number of evicted pipelines
+        """
+        with self._lock:
+            return self._evict_idle_locked(time.monotonic())
+
+    def _evict_idle_locked(self, now: float) -> int:
+        idle = [key for key, entry in self._entries.items()
+                if now - entry.last_used > self.idle_timeout]
+        for key in idle:
+            del self._entries[key]
+        self.evictions += len(idle)
+        return len(idle)
+
+    def _evict_lru_locked(self) -> None:
+        while len(self._entries) > self.max_size:
+            oldest = min(self._entries, key=lambda key: self._entries[key].last_used)
+            del self._entries[oldest]
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size, hit/miss/eviction counts and per-entry usage."""
+        now = time.monotonic()
+        with self._lock:
+            entries = [
+                {
+                    "settings": dict(key),
+                    "uses": entry.uses,
+                    "idle_seconds": round(now - entry.last_used, 1),
+                }
+                for key, entry in self._entries.items()
+            ]
+            return {
+                "size": len(entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": entries,
+            }
+
+
+def env_flag(name: str, default: bool = True) -> bool:
+    """Read a boolean environment variable ("true"/"false", "1"/"0")."""
+    value: Optional[str] = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
@@ -0,0 +1,92 @@
+"""MCP progress notifications for long-running tool calls.
+
+Pipelines report progress through plain synchronous callbacks. The
+ProgressReporter queues those reports and a background task sends them to
+the client in order as MCP progress notifications, so reporting never
+blocks or reorders the extraction itself.
+"""
+
+import asyncio
+from typing import Any, Optional
+
+
+class ProgressReporter:
+    """Sends progress notifications for one tool call.
+
+    Does nothing if the client did not ask for progress (no progress token
+    in the request). Use as an async context manager around the work.
+    """
+
+    def __init__(self, session: Any = None, progress_token: Any = None):
+        """Initialize the reporter.
+
+        Args:
+            session: MCP server session of the request
+            progress_token: Progress token sent by the client, if any
+        """
+        self.session = session
+        self.progress_token = progress_token
+        self.sent = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._sender: Optional[asyncio.Task] = None
+
+    @classmethod
+    def for_request(cls, server: Any) -> "ProgressReporter":
+        """Create a reporter for the tool call the server is handling."""
+        try:
+            context = server.request_context
+        except LookupError:
+            return cls()
+        meta = context.meta
+        token = getattr(meta, "progressToken", None) if meta is not None else None
+        return cls(context.session, token)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the client asked for progress notifications."""
+        return self.session is not None and self.progress_token is not None
+
+    def report(
+        self,
+        progress: float,
+        total: Optional[float] = None,
+        message: Optional[str] = None
+    ) -> None:
+        """Queue a progress notification (safe to call from sync callbacks)."""
+        if self.enabled and self._queue is not None:
+            self._queue.put_nowait((progress, total, message))
+
+    async def _send_all(self) -> None:
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            progress, total, message = item
+            try:
+                await self.session.send_progress_notification(
+                    self.progress_token, progress, total, message=message)
+            except TypeError:
+                # MCP SDKs before 1.10 have no message parameter
+                await self.session.send_progress_notification(
+                    self.progress_token, progress, total)
+            except Exception:
+                # A client that went away must not fail the extraction
+                continue
+            self.sent += 1
+
+    async def __aenter__(self) -> "ProgressReporter":
+        if self.enabled:
+            self._queue = asyncio.Queue()
+            self._sender = asyncio.create_task(self._send_all())
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback) -> None:
+        if self._sender is None:
+            return
+        if exc_type is None:
+            # Deliver everything reported before the result is returned
+            self._queue.put_nowait(None)
+            await self._sender
+        else:
+            self._sender.cancel()
+            await asyncio.gather(self._sender, return_exceptions=True)
@@ -0,0 +1,73 @@
+"""Shared utilities used by both pipelines."""
+
+from claimification.utils.cache import (
+    ResponseCache,
+    configure_response_cache,
+    get_response_cache
+)
+from claimification.utils.hooks import (
+    HookEvent,
+    JsonlEventLog,
+    OpenTelemetryHooks,
+    PipelineHooks,
+    configure_hooks
+)
+from claimification.utils.llm_clients import (
+    client_pool_stats,
+    get_chat_model,
+    provider_for_model
+)
+from claimification.utils.rate_limiter import (
+    RateLimiter,
+    configure_rate_limit,
+    get_rate_limiter,
+    rate_limiter_stats
+)
+from claimification.utils.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ErrorKind,
+    RetryPolicy,
+    classify_error,
+    get_circuit_breaker
+)
+from claimification.utils.timing import (
+    record_calls,
+    stage_statistics,
+    summarize_durations
+)
+from claimification.utils.usage import (
+    configure_prices,
+    estimate_cost,
+    usage_statistics
+)
+
+__all__ = [
+    "ResponseCache",
+    "configure_response_cache",
+    "get_response_cache",
+    "HookEvent",
+    "JsonlEventLog",
+    "OpenTelemetryHooks",
+    "PipelineHooks",
+    "configure_hooks",
+    "client_pool_stats",
+    "get_chat_model",
+    "provider_for_model",
+    "RateLimiter",
+    "configure_rate_limit",
+    "get_rate_limiter",
+    "rate_limiter_stats",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "ErrorKind",
+    "RetryPolicy",
+    "classify_error",
+    "get_circuit_breaker",
+    "record_calls",
+    "stage_statistics",
+    "summarize_durations",
+    "configure_prices",
+    "estimate_cost",
+    "usage_statistics"
+]
@@ -0,0 +1,334 @@
+"""Persistent, content-addressed cache of structured LLM responses.
+
+Entries are keyed by a hash of everything that determines a response:
+provider, model, temperature, the rendered prompt messages and the output
+schema. Re-running the same documents with the same settings therefore
+hits the cache instead of the LLM. Changing a prompt or schema changes
+the key, so stale answers are never returned for new prompts.
+
+The cache is a single SQLite file in WAL mode, which several processes can
+read and write at the same time. Lookups are local disk reads and are done
+inline, also on the async paths.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Writes between two eviction passes
+EVICTION_INTERVAL = 100
+
+
+# Typographic characters folded to their ASCII form by normalize_for_cache
+_TYPOGRAPHY = str.maketrans({
+    "\u2018": "'", "\u2019": "'", "\u201a": "'", "\u201b": "'",
+    "\u201c": '"', "\u201d": '"', "\u201e": '"', "\u201f": '"',
+    "\u2013": "-", "\u2014": "-", "\u2212": "-", "\u00a0": " ",
+})
+# Trailing citation markers such as "[1]", "[2, 3]", "[4-6]" or "^7"
+_TRAILING_CITATIONS = re.compile(r'(?:\s*(?:\[\d+(?:\s*[,\-]\s*\d+)*\]|\^\d+))+(?=[.!?]?\s*$)')
+
+
+def normalize_for_cache(text: str) -> str:
+    """Reduce text to a form that ignores cosmetic differences.
+
+    Applies Unicode NFKC, folds smart quotes and dashes to ASCII, removes
+    trailing citation markers, collapses whitespace and case-folds. Used
+    for cache tiers that accept near-identical inputs as the same request.
+    """
+    text = unicodedata.normalize("NFKC", text).translate(_TYPOGRAPHY)
+    text = _TRAILING_CITATIONS.sub("", text)
+    return " ".join(text.split()).casefold()
+
+
+def cache_key(
+    provider: str,
+    model: str,
+    temperature: float,
+    messages: List[Tuple[str, str]],
+    output_model: Type[BaseModel]
+) -> str:
+    """Hash the inputs that determine a structured LLM response.
+
+    Args:
+        provider: Provider name
+        model: Model name
+        temperature: Sampling temperature
+        messages: Rendered prompt as (role, content) pairs
+        output_model: Structured output model (its JSON schema is hashed)
+
+    Returns:
+        Hex digest identifying the request
+    """
+    payload = json.dumps(
+        {
+            "provider": provider,
+            "model": model,
+            "temperature": temperature,
+            "messages": messages,
+            "schema": output_model.model_json_schema(),
+        },
+        sort_keys=True,
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed store of structured responses keyed by ``cache_key``.
+
+    Entries older than ``ttl_seconds`` are treated as misses and removed.
+    When the stored payloads exceed ``max_bytes``, the least recently used
+    entries are evicted.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        compress: bool = False
+    ):
+        """Open (or create) the cache file.
+
+        Args:
+            path: SQLite file to use
+            max_bytes: Maximum total payload size (None = unbounded)
+            ttl_seconds: Maximum entry age (None = entries never expire)
+            compress: Store payloads zlib-compressed
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.compress = compress
+        self.hits = 0
+        self.misses = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.evictions = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection per cache object; other processes open their own
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=30.0, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " compressed INTEGER NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored response for key, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, compressed, created_at FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is not None and self._expired(row[2], now):
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.evictions += 1
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            self.bytes_read += len(row[0])
+
+        value = zlib.decompress(row[0]) if row[1] else row[0]
+        return json.loads(value)
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a response (a JSON-serializable dict) under key."""
+        data = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        if self.compress:
+            data = zlib.compress(data)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, data, int(self.compress), len(data), now, now)
+            )
+            self.bytes_written += len(data)
+            self._writes += 1
+            if self._writes % EVICTION_INTERVAL == 0:
+                self._evict_locked(now)
+
+    def get_model(self, key: str, output_model: Type[ModelT]) -> Optional[ModelT]:
+        """Return the stored response parsed as output_model, or None.
+
+        An entry that no longer fits the model counts as a miss.
+        """
+        value = self.get(key)
+        if value is None:
+            return None
+        try:
+            return output_model(**value)
+        except Exception:
+            with self._lock:
+                self.hits -= 1
+                self.misses += 1
+            return None
+
+    def set_model(self, key: str, result: Any) -> None:
+        """Store a structured response (a pydantic model or dict)."""
+        if isinstance(result, BaseModel):
+            result = result.model_dump()
+        if isinstance(result, dict):
+            self.set(key, result)
+
+    def evict(self) -> int:
+        """Remove expired entries, then LRU entries beyond ``max_bytes``.
+
+        Returns:
+            Number of removed entries
+        """
+        with self._lock:
+            return self._evict_locked(time.time())
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _evict_locked(self, now: float) -> int:
+        removed = 0
+        if self.ttl_seconds is not None:
+            removed += self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?",
+                (now - self.ttl_seconds,)
+            ).rowcount
+        if self.max_bytes is not None:
+            total = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                # Trim to 90% so the next writes do not evict again at once
+                excess = total - int(self.max_bytes * 0.9)
+                rows = self._conn.execute(
+                    "SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+                doomed = []
+                for key, size in rows:
+                    if excess <= 0:
+                        break
+                    doomed.append((key,))
+                    excess -= size
+                self._conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+                removed += len(doomed)
+        self.evictions += removed
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/byte counters of this process and the cache's current size."""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "bytes_read": self.bytes_read,
+                "bytes_written": self.bytes_written,
+                "evictions": self.evictions,
+                "entries": entries,
+                "size_bytes": size,
+            }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# Process-wide cache, configured explicitly or from the environment
+_cache: Optional[ResponseCache] = None
+_cache_configured = False
+_cache_lock = threading.Lock()
+
+
+def configure_response_cache(
+    path: Optional[Union[str, Path]],
+    max_bytes: Optional[int] = None,
+    ttl_seconds: Optional[float] = None,
+    compress: bool = False
+) -> Optional[ResponseCache]:
+    """Enable (or, with path None, disable) the process-wide response cache.
+
+    Args:
+        path: SQLite file to use, or None to disable caching
+        max_bytes: Maximum total payload size (None = unbounded)
+        ttl_seconds: Maximum entry age (None = entries never expire)
+        compress: Store payloads zlib-compressed
+
+    Returns:
+        The new cache, or None if caching is disabled
+    """
+    global _cache, _cache_configured
+    cache = ResponseCache(path, max_bytes, ttl_seconds, compress) if path else None
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+        _cache = cache
+        _cache_configured = True
+    return cache
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the process-wide cache, or None if caching is disabled.
+
+    Unless configured explicitly, the cache is enabled by the environment:
+    CLAIMIFICATION_CACHE_PATH (file), CLAIMIFICATION_CACHE_MAX_MB,
+    CLAIMIFICATION_CACHE_TTL_SECONDS and CLAIMIFICATION_CACHE_COMPRESS.
+    """
+    global _cache, _cache_configured
+    with _cache_lock:
+        if not _cache_configured:
+            path = os.getenv("CLAIMIFICATION_CACHE_PATH")
+            if path:
+                max_mb = os.getenv("CLAIMIFICATION_CACHE_MAX_MB")
+                ttl = os.getenv("CLAIMIFICATION_CACHE_TTL_SECONDS")
+                _cache = ResponseCache(
+                    path,
+                    max_bytes=int(float(max_mb) * 1024 * 1024) if max_mb else None,
+                    ttl_seconds=float(ttl) if ttl else None,
+                    compress=os.getenv("CLAIMIFICATION_CACHE_COMPRESS", "").lower()
+                    in ("1", "true", "yes", "on")
+                )
+            _cache_configured = True
+        return _cache
+
+
+def reset_response_cache() -> None:
+    """Close the cache and re-read the environment on next use (mainly for tests)."""
+    global _cache, _cache_configured
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+        _cache = None
+        _cache_configured = False
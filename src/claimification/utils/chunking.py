@@ -0,0 +1,161 @@
+"""Sentence-aligned chunking of long texts.
+
+Texts too long for a single LLM call are cut into chunks at sentence
+boundaries. Each chunk also knows the sentences just before it (the
+overlap), which callers pass along as context so that references across a
+chunk boundary can still be resolved. Chunks hold offsets only; their text
+is sliced from the source on demand, so planning a 200k-character text
+does not copy it.
+"""
+
+import codecs
+import mmap
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Tuple, Union
+
+
+# Sentence boundary used by the claim extraction SentenceSplitter
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+
+DEFAULT_CHUNK_CHARS = 12000
+DEFAULT_OVERLAP_CHARS = 1000
+
+# Bytes decoded per piece by iter_text_file
+DEFAULT_READ_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class TextChunk:
+    """One chunk of a source text, as character offsets.
+
+    Attributes:
+        index: Position of the chunk in the text
+        char_start: Start offset of the chunk in the source text
+        char_end: End offset of the chunk in the source text
+        overlap_start: Start offset of the preceding context (equal to
+            char_start if there is none)
+    """
+    index: int
+    char_start: int
+    char_end: int
+    overlap_start: int
+
+    def text(self, source: str) -> str:
+        """The chunk's text."""
+        return source[self.char_start:self.char_end]
+
+    def overlap(self, source: str) -> str:
+        """The sentences preceding the chunk, for context only."""
+        return source[self.overlap_start:self.char_start].strip()
+
+
+def sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """Character spans of the sentences in text (whitespace excluded)."""
+    spans = []
+    start = 0
+    for boundary in SENTENCE_BOUNDARY.finditer(text):
+        spans.append((start, boundary.start()))
+        start = boundary.end()
+    spans.append((start, len(text.rstrip())))
+    return [(start, end) for start, end in spans if end > start]
+
+
+def plan_chunks(
+    text: str,
+    max_chars: int = DEFAULT_CHUNK_CHARS,
+    overlap_chars: int = DEFAULT_OVERLAP_CHARS
+) -> List[TextChunk]:
+    """Cut text into sentence-aligned chunks.
+
+    Consecutive sentences are grouped until the next one would make the
+    chunk longer than ``max_chars``. A single sentence longer than that is
+    cut at whitespace.
+
+    Args:
+        text: The text to chunk
+        max_chars: Maximum chunk length in characters
+        overlap_chars: Maximum length of the preceding context of a chunk;
+            only whole sentences are included
+
+    Returns:
+        Chunks covering all sentences of the text, in order
+    """
+    if max_chars < 1:
+        raise ValueError("max_chars must be at least 1")
+
+    spans: List[Tuple[int, int]] = []
+    for start, end in sentence_spans(text):
+        spans.extend(_split_long_span(text, start, end, max_chars))
+
+    chunks: List[TextChunk] = []
+    first = 0
+    while first < len(spans):
+        last = first
+        while last + 1 < len(spans) and spans[last + 1][1] - spans[first][0] <= max_chars:
+            last += 1
+
+        # Whole sentences before the chunk, up to overlap_chars
+        overlap = first
+        while overlap > 0 and spans[first][0] - spans[overlap - 1][0] <= overlap_chars:
+            overlap -= 1
+
+        chunks.append(TextChunk(
+            index=len(chunks),
+            char_start=spans[first][0],
+            char_end=spans[last][1],
+            overlap_start=spans[overlap][0]
+        ))
+        first = last + 1
+
+    return chunks
+
+
+def _split_long_span(text: str, start: int, end: int, max_chars: int) -> List[Tuple[int, int]]:
+    """Cut a span longer than max_chars at the last whitespace before the limit."""
+    pieces = []
+    while end - start > max_chars:
+        cut = text.rfind(" ", start + 1, start + max_chars + 1)
+        if cut <= start:
+            cut = start + max_chars
+        pieces.append((start, cut))
+        start = cut
+        while start < end and text[start].isspace():
+            start += 1
+    pieces.append((start, end))
+    return pieces
+
+
+def iter_text_file(
+    path: Union[str, Path],
+    read_bytes: int = DEFAULT_READ_BYTES,
+    encoding: str = "utf-8"
+) -> Iterator[str]:
+    """Read a text file as a sequence of decoded pieces.
+
+    The file is memory-mapped, so the operating system pages it in as the
+    pieces are consumed and the whole file is never held as one string.
+    Multi-byte characters cut at a piece boundary are decoded correctly.
+
+    Args:
+        path: File to read
+        read_bytes: Bytes decoded per piece
+        encoding: Text encoding of the file
+
+    Yields:
+        Consecutive pieces of the file's text
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    with open(path, "rb") as f:
+        # Empty files cannot be memory-mapped
+        if Path(path).stat().st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for start in range(0, len(mapped), read_bytes):
+                piece = decoder.decode(mapped[start:start + read_bytes])
+                if piece:
+                    yield piece
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
@@ -0,0 +1,404 @@
+"""Tracing hooks around pipeline runs, stage calls and LLM requests.
+
+The pipelines and stages report what they do as events to the hooks
+configured with ``configure_hooks``. With no hooks configured (the default)
+every reporting call returns right away, so tracing costs nothing unless
+it is used.
+
+Spans are reported as a pair of events sharing a ``span_id``:
+
+- ``run_start`` / ``run_end``: one ``extract_claims`` or
+  ``extract_knowledge_graph`` call
+- ``stage_start`` / ``stage_end``: one stage call, for one sentence
+  (``sentence_id``) or a packed or batched group (``sentence_ids``)
+- ``llm_request`` / ``llm_response``: one request sent to the provider
+
+Point events belong to the span they happen in: ``retry`` (a failed
+attempt that will be retried), ``cache_hit``, ``cache_miss`` and
+``packed_fallback`` (a packed Selection call whose output did not match
+the schema, answered by single calls instead).
+
+Event attributes include ``stage`` and ``model`` and, on the events that
+end a span, ``duration_seconds``, ``success`` and the token counts of
+``claimification.utils.usage``. Spans and point events take the
+``pipeline``, ``sentence_id``, ``sentence_ids``, ``stage`` and ``model``
+attributes of the span they are started in.
+
+Two hooks are built in: ``JsonlEventLog`` writes every event as a JSON
+line, and ``OpenTelemetryHooks`` exports the spans through the
+OpenTelemetry API to whatever tracer provider the application configured.
+Setting the CLAIMIFICATION_EVENT_LOG environment variable to a file path
+enables the JSONL log without code changes.
+"""
+
+import itertools
+import json
+import os
+import threading
+import time
+import warnings
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Optional, Tuple, Union
+
+from langchain_core.callbacks import UsageMetadataCallbackHandler
+
+from .usage import USAGE_FIELDS, callback_usage
+
+
+# Span kind -> (start event, end event)
+SPAN_EVENTS = {
+    "run": ("run_start", "run_end"),
+    "stage": ("stage_start", "stage_end"),
+    "llm": ("llm_request", "llm_response"),
+}
+_START_EVENTS = {start: kind for kind, (start, _) in SPAN_EVENTS.items()}
+_END_EVENTS = {end: kind for kind, (_, end) in SPAN_EVENTS.items()}
+
+# Attributes spans and point events take over from the enclosing span
+INHERITED_ATTRIBUTES = ("pipeline", "sentence_id", "sentence_ids", "stage", "model")
+
+
+@dataclass
+class HookEvent:
+    """One event reported to the hooks.
+
+    Attributes:
+        name: Event name, e.g. "stage_start" or "retry"
+        attributes: Structured attributes of the event
+        timestamp: Wall-clock time of the event (seconds since the epoch)
+        span_id: Span started or ended by the event; for point events, the
+            span they happened in
+        parent_id: Enclosing span of a started or ended span
+    """
+    name: str
+    attributes: Dict[str, Any]
+    timestamp: float
+    span_id: Optional[int] = None
+    parent_id: Optional[int] = None
+
+
+class PipelineHooks:
+    """Receiver of pipeline events; the base class ignores them.
+
+    Subclasses override ``on_event``. It is called synchronously on the
+    thread or event loop that reported the event, so it should be fast and
+    must be thread-safe. Exceptions it raises are turned into warnings and
+    never interrupt a run.
+    """
+
+    def on_event(self, event: HookEvent) -> None:
+        """Handle one event."""
+
+
+# Process-wide hooks; None until configured or read from the environment
+_hooks: Optional[Tuple[PipelineHooks, ...]] = None
+_hooks_lock = threading.Lock()
+_span_ids = itertools.count(1)
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+def configure_hooks(*hooks: PipelineHooks) -> None:
+    """Set the hooks that receive pipeline events (none disables tracing)."""
+    global _hooks
+    with _hooks_lock:
+        _hooks = tuple(hooks)
+
+
+def reset_hooks() -> None:
+    """Forget the configured hooks and re-read the environment (mainly for tests)."""
+    global _hooks
+    with _hooks_lock:
+        _hooks = None
+
+
+def get_hooks() -> Tuple[PipelineHooks, ...]:
+    """The configured hooks (a JSONL log if only CLAIMIFICATION_EVENT_LOG is set)."""
+    global _hooks
+    hooks = _hooks
+    if hooks is None:
+        with _hooks_lock:
+            if _hooks is None:
+                path = os.getenv("CLAIMIFICATION_EVENT_LOG")
+                _hooks = (JsonlEventLog(path),) if path else ()
+            hooks = _hooks
+    return hooks
+
+
+def _dispatch(hooks: Tuple[PipelineHooks, ...], event: HookEvent) -> None:
+    for hook in hooks:
+        try:
+            hook.on_event(event)
+        except Exception as e:
+            warnings.warn(f"{type(hook).__name__} failed on {event.name}: {e}", RuntimeWarning)
+
+
+def _inherited(parent: Optional["Span"]) -> Dict[str, Any]:
+    if parent is None:
+        return {}
+    return {
+        name: parent.attributes[name]
+        for name in INHERITED_ATTRIBUTES if name in parent.attributes
+    }
+
+
+def emit(name: str, **attributes: Any) -> None:
+    """Report a point event (e.g. "retry") in the current span."""
+    hooks = get_hooks()
+    if not hooks:
+        return
+    parent = _current_span.get()
+    _dispatch(hooks, HookEvent(
+        name=name,
+        attributes={**_inherited(parent), **attributes},
+        timestamp=time.time(),
+        span_id=parent.span_id if parent is not None else None
+    ))
+
+
+class Span:
+    """A reported span; use it as a context manager.
+
+    The start event is reported when the span is created and the end event
+    when the ``with`` block exits. Within the block the span is the parent
+    of new spans and point events of the same thread or task.
+    """
+
+    recording = True
+
+    def __init__(self, hooks: Tuple[PipelineHooks, ...], kind: str, attributes: Dict[str, Any]):
+        parent = _current_span.get()
+        self.kind = kind
+        self.span_id = next(_span_ids)
+        self.parent_id = parent.span_id if parent is not None else None
+        self.attributes = {**_inherited(parent), **attributes}
+        self._hooks = hooks
+        self._end_attributes: Dict[str, Any] = {}
+        self._started = time.perf_counter()
+        self._token = None
+        self._emit(SPAN_EVENTS[kind][0], dict(self.attributes))
+
+    def set_attributes(self, **attributes: Any) -> None:
+        """Add attributes to the span's end event."""
+        self._end_attributes.update(attributes)
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        _current_span.reset(self._token)
+        attributes = {**self.attributes, **self._end_attributes}
+        if exc is not None:
+            attributes.update(success=False, error=f"{exc_type.__name__}: {exc}")
+        attributes.setdefault("success", True)
+        attributes["duration_seconds"] = round(time.perf_counter() - self._started, 4)
+        self._emit(SPAN_EVENTS[self.kind][1], self._finish(attributes))
+        return False
+
+    def _finish(self, attributes: Dict[str, Any]) -> Dict[str, Any]:
+        """Final attributes of the end event."""
+        return attributes
+
+    def _emit(self, name: str, attributes: Dict[str, Any]) -> None:
+        _dispatch(self._hooks, HookEvent(
+            name=name,
+            attributes=attributes,
+            timestamp=time.time(),
+            span_id=self.span_id,
+            parent_id=self.parent_id
+        ))
+
+
+class _LlmSpan(Span):
+    """Span of one LLM request; its end event carries the request's tokens."""
+
+    def __init__(
+        self,
+        hooks: Tuple[PipelineHooks, ...],
+        usages: Iterable[UsageMetadataCallbackHandler],
+        attributes: Dict[str, Any]
+    ):
+        self._usages = list(usages)
+        # The handlers may already hold the usage of earlier attempts
+        self._before = [callback_usage(usage) for usage in self._usages]
+        super().__init__(hooks, "llm", attributes)
+
+    def _finish(self, attributes: Dict[str, Any]) -> Dict[str, Any]:
+        for name in USAGE_FIELDS:
+            attributes[name] = sum(
+                callback_usage(usage)[name] - before[name]
+                for usage, before in zip(self._usages, self._before)
+            )
+        return attributes
+
+
+class _NullSpan:
+    """Stand-in returned while no hooks are configured."""
+
+    recording = False
+
+    def set_attributes(self, **attributes: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+def start_span(kind: str, **attributes: Any) -> Union[Span, _NullSpan]:
+    """Start a span of a kind in ``SPAN_EVENTS``.
+
+    Returns:
+        The span, to be used as a context manager (NULL_SPAN if no hooks
+        are configured)
+    """
+    hooks = get_hooks()
+    if not hooks:
+        return NULL_SPAN
+    return Span(hooks, kind, attributes)
+
+
+def llm_span(
+    usages: Iterable[UsageMetadataCallbackHandler],
+    **attributes: Any
+) -> Union[Span, _NullSpan]:
+    """Start the span of one LLM request.
+
+    Args:
+        usages: Usage handlers passed to the request; the tokens they
+            collect during the span are added to its end event
+        **attributes: Attributes of the request (stage, model, attempt)
+
+    Returns:
+        The span, to be used as a context manager (NULL_SPAN if no hooks
+        are configured)
+    """
+    hooks = get_hooks()
+    if not hooks:
+        return NULL_SPAN
+    return _LlmSpan(hooks, usages, attributes)
+
+
+class JsonlEventLog(PipelineHooks):
+    """Writes every event as one JSON line to a file or text stream."""
+
+    def __init__(self, target: Union[str, Path, IO[str]]):
+        """Open the log.
+
+        Args:
+            target: File to append to, or an open text stream
+        """
+        if isinstance(target, (str, Path)):
+            Path(target).parent.mkdir(parents=True, exist_ok=True)
+            target = open(target, "a", encoding="utf-8")
+        self._stream = target
+        self._lock = threading.Lock()
+
+    def on_event(self, event: HookEvent) -> None:
+        line = json.dumps({
+            "event": event.name,
+            "timestamp": round(event.timestamp, 6),
+            "span_id": event.span_id,
+            "parent_id": event.parent_id,
+            "attributes": event.attributes,
+        }, ensure_ascii=False, default=str)
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+
+# Attributes exported under the OpenTelemetry GenAI semantic conventions;
+# the others are exported with a "claimification." prefix
+_OTEL_NAMES = {
+    "model": "gen_ai.request.model",
+    "input_tokens": "gen_ai.usage.input_tokens",
+    "output_tokens": "gen_ai.usage.output_tokens",
+}
+
+
+def _otel_attributes(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert event attributes to OpenTelemetry attribute names and types."""
+    converted = {}
+    for name, value in attributes.items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            value = [item if isinstance(item, (str, bool, int, float)) else str(item)
+                     for item in value]
+        elif not isinstance(value, (str, bool, int, float)):
+            value = str(value)
+        converted[_OTEL_NAMES.get(name, f"claimification.{name}")] = value
+    return converted
+
+
+class OpenTelemetryHooks(PipelineHooks):
+    """Exports spans through the OpenTelemetry API.
+
+    Runs, stage calls and LLM requests become spans named e.g.
+    ``claimification.stage.selection``; point events are added to their
+    span as span events. Spans without a parent span of their own are
+    started in the caller's current OpenTelemetry context, so they nest
+    under the application's spans. Requires ``opentelemetry-api``; spans
+    are exported by the SDK tracer provider the application configures.
+    """
+
+    def __init__(self, tracer: Any = None):
+        """Initialize the hooks.
+
+        Args:
+            tracer: Tracer to use (default: ``trace.get_tracer("claimification")``)
+
+        Raises:
+            ImportError: If opentelemetry-api is not installed
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryHooks requires opentelemetry-api: "
+                "pip install 'claimification[otel]'") from e
+        self._trace = trace
+        self._tracer = tracer if tracer is not None else trace.get_tracer("claimification")
+        self._spans: Dict[int, Any] = {}
+        self._lock = threading.Lock()
+
+    def on_event(self, event: HookEvent) -> None:
+        timestamp = int(event.timestamp * 1e9)
+        if event.name in _START_EVENTS:
+            kind = _START_EVENTS[event.name]
+            with self._lock:
+                parent = self._spans.get(event.parent_id)
+            stage = event.attributes.get("stage")
+            name = f"claimification.{kind}" + (f".{stage}" if stage else "")
+            span = self._tracer.start_span(
+                name,
+                context=self._trace.set_span_in_context(parent) if parent is not None else None,
+                attributes=_otel_attributes(event.attributes),
+                start_time=timestamp
+            )
+            with self._lock:
+                self._spans[event.span_id] = span
+        elif event.name in _END_EVENTS:
+            with self._lock:
+                span = self._spans.pop(event.span_id, None)
+            if span is None:
+                return
+            span.set_attributes(_otel_attributes(event.attributes))
+            if event.attributes.get("success") is False:
+                span.set_status(self._trace.Status(
+                    self._trace.StatusCode.ERROR, event.attributes.get("error")))
+            span.end(end_time=timestamp)
+        else:
+            with self._lock:
+                span = self._spans.get(event.span_id)
+            if span is not None:
+                span.add_event(
+                    event.name, attributes=_otel_attributes(event.attributes),
+                    timestamp=timestamp)
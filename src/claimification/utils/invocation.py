@@ -0,0 +1,190 @@
+"""Rate-limited, retried chain invocation for stages without a base class.
+
+The entity-mapping stages build a new prompt chain per call; these helpers
+wrap one such call with the response cache and the shared rate limiter,
+retry policy and circuit breaker of the stage's provider. Calls made for a
+named stage are reported, with their token usage, to
+``claimification.utils.timing.record_calls`` and, as stage spans, to the
+tracing hooks.
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from langchain_core.callbacks import UsageMetadataCallbackHandler
+from pydantic import BaseModel
+
+from .cache import cache_key, get_response_cache
+from .hooks import Span, emit, llm_span, start_span
+from .llm_clients import provider_for_model
+from .rate_limiter import estimate_tokens, get_rate_limiter
+from .retry import (
+    RetryPolicy,
+    RetryState,
+    acall_with_retry,
+    call_with_retry,
+    get_circuit_breaker
+)
+from .timing import call_timing, record_call
+from .usage import callback_usage, usage_callback
+
+
+def request_cache_key(
+    model: str,
+    temperature: float,
+    messages: List[Tuple[str, str]],
+    output_model: Type[BaseModel]
+) -> Optional[str]:
+    """Response cache key of a request, or None if caching is disabled.
+
+    Args:
+        model: Model name
+        temperature: Sampling temperature
+        messages: Rendered prompt as (role, content) pairs
+        output_model: Structured output model
+
+    Returns:
+        The cache key, or None
+    """
+    if get_response_cache() is None:
+        return None
+    return cache_key(provider_for_model(model), model, temperature, messages, output_model)
+
+
+def invoke_chain(
+    chain: Any,
+    model: str,
+    retry_policy: RetryPolicy,
+    prompt_text: str,
+    inputs: Optional[Dict[str, Any]] = None,
+    state: Optional[RetryState] = None,
+    cache_key: Optional[str] = None,
+    output_model: Optional[Type[BaseModel]] = None,
+    stage: Optional[str] = None
+) -> Any:
+    """Invoke a chain within the provider's rate limit, with retries.
+
+    Args:
+        chain: Runnable to invoke
+        model: Model name, used to find the provider's limiter and breaker
+        retry_policy: Retry policy for the call
+        prompt_text: Full prompt text, used to estimate request tokens
+        inputs: Chain inputs (default: no variables)
+        state: Retry state to update
+        cache_key: Response cache key (see ``request_cache_key``); the
+            cached response is returned without calling the chain
+        output_model: Model to parse a cached response into
+        stage: Stage name under which the call's timing is recorded
+
+    Returns:
+        The chain's output
+    """
+    started = time.perf_counter()
+    with start_span("stage", stage=stage, model=model) as span:
+        cached = _cached_output(cache_key, output_model)
+        if cached is not None:
+            _record(stage, started, span=span)
+            return cached
+
+        provider = provider_for_model(model)
+        rate_limiter = get_rate_limiter(provider, model)
+        request_tokens = estimate_tokens(prompt_text)
+        state = state if state is not None else RetryState()
+        usage = usage_callback()
+
+        def attempt():
+            state.wait_seconds += rate_limiter.acquire(request_tokens)
+            with llm_span([usage], attempt=state.attempts):
+                return chain.invoke(inputs or {}, config={"callbacks": [usage]})
+
+        try:
+            result = call_with_retry(
+                attempt, retry_policy, get_circuit_breaker(provider), state)
+        finally:
+            _record(stage, started, state, usage, span)
+        _store_output(cache_key, result)
+        return result
+
+
+async def ainvoke_chain(
+    chain: Any,
+    model: str,
+    retry_policy: RetryPolicy,
+    prompt_text: str,
+    inputs: Optional[Dict[str, Any]] = None,
+    state: Optional[RetryState] = None,
+    cache_key: Optional[str] = None,
+    output_model: Optional[Type[BaseModel]] = None,
+    stage: Optional[str] = None
+) -> Any:
+    """Async counterpart of ``invoke_chain``."""
+    started = time.perf_counter()
+    with start_span("stage", stage=stage, model=model) as span:
+        cached = _cached_output(cache_key, output_model)
+        if cached is not None:
+            _record(stage, started, span=span)
+            return cached
+
+        provider = provider_for_model(model)
+        rate_limiter = get_rate_limiter(provider, model)
+        request_tokens = estimate_tokens(prompt_text)
+        state = state if state is not None else RetryState()
+        usage = usage_callback()
+
+        async def attempt():
+            state.wait_seconds += await rate_limiter.aacquire(request_tokens)
+            with llm_span([usage], attempt=state.attempts):
+                return await chain.ainvoke(inputs or {}, config={"callbacks": [usage]})
+
+        try:
+            result = await acall_with_retry(
+                attempt, retry_policy, get_circuit_breaker(provider), state)
+        finally:
+            _record(stage, started, state, usage, span)
+        _store_output(cache_key, result)
+        return result
+
+
+def _record(
+    stage: Optional[str],
+    started: float,
+    state: Optional[RetryState] = None,
+    usage: Optional[UsageMetadataCallbackHandler] = None,
+    span: Optional[Span] = None
+) -> None:
+    """Report a finished call of a stage; no state means a cache hit.
+
+    The call's attempts and tokens are also added to its tracing span.
+    """
+    if state is None:
+        call = {
+            **call_timing(time.perf_counter() - started, attempts=0, cache_hit=True),
+            "usage": {},
+        }
+    else:
+        call = {
+            **call_timing(time.perf_counter() - started, state.wait_seconds, state.attempts),
+            "usage": callback_usage(usage) if usage is not None else {},
+        }
+    if span is not None and span.recording:
+        span.set_attributes(
+            attempts=call["attempts"], cache_hit=call["cache_hit"], **call["usage"])
+    if stage is not None:
+        record_call(stage, call)
+
+
+def _cached_output(key: Optional[str], output_model: Optional[Type[BaseModel]]) -> Any:
+    """Look up a cached response; None on a miss or if caching is off."""
+    cache = get_response_cache()
+    if key is None or output_model is None or cache is None:
+        return None
+    output = cache.get_model(key, output_model)
+    emit("cache_hit" if output is not None else "cache_miss", tier="exact")
+    return output
+
+
+def _store_output(key: Optional[str], result: Any) -> None:
+    """Store a fresh response in the cache (if caching is on)."""
+    cache = get_response_cache()
+    if key is not None and cache is not None:
+        cache.set_model(key, result)
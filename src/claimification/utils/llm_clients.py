@@ -0,0 +1,224 @@
+"""Shared LLM client registry.
+
+All stages get their chat model from ``get_chat_model``, which returns one
+shared instance per (provider, model, temperature, max_tokens, kwargs).
+LangChain chat models hold no per-call state, so a single instance can be
+used from many threads and coroutines at once.
+
+OpenAI models are additionally backed by one keep-alive HTTP connection
+pool per provider, so pipelines reuse warm TLS connections instead of each
+agent opening its own. Anthropic models reuse langchain-anthropic's cached
+default HTTP client, which is already shared per base URL.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import httpx
+from langchain_anthropic import ChatAnthropic
+from langchain_core.language_models import BaseChatModel
+from langchain_openai import ChatOpenAI
+
+
+# Pool limits for the shared HTTP clients (per provider and event loop)
+POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0
+)
+# Matches the OpenAI SDK default; the SDK overrides it per request anyway
+POOL_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+
+def provider_for_model(model: str) -> str:
+    """Infer the provider name from a model string.
+
+    Returns "openai", "anthropic" or "unknown".
+    """
+    if "gpt" in model or "openai" in model or "o1" in model:
+        return "openai"
+    if "claude" in model or "anthropic" in model:
+        return "anthropic"
+    return "unknown"
+
+
+class _LoopLocalAsyncTransport(httpx.AsyncBaseTransport):
+    """Async transport keeping one connection pool per event loop.
+
+    Pooled asyncio connections cannot outlive the loop that opened them, so
+    a process-wide AsyncClient would break on the second ``asyncio.run``.
+    This transport hands each running loop its own pool and drops the pool
+    together with the loop.
+    """
+
+    def __init__(self, factory: Callable[[], httpx.AsyncBaseTransport]):
+        self._factory = factory
+        self._transports: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _current(self) -> httpx.AsyncBaseTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._transports.get(loop)
+            if transport is None:
+                transport = self._transports[loop] = self._factory()
+            return transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._current().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._current().aclose()
+
+    def transports(self) -> list:
+        """Transports of all live event loops."""
+        with self._lock:
+            return list(self._transports.values())
+
+
+class _ProviderPool:
+    """Sync and async HTTP clients shared by all models of one provider."""
+
+    def __init__(self):
+        self.sync_client = httpx.Client(limits=POOL_LIMITS, timeout=POOL_TIMEOUT)
+        self.async_transport = _LoopLocalAsyncTransport(
+            lambda: httpx.AsyncHTTPTransport(limits=POOL_LIMITS))
+        self.async_client = httpx.AsyncClient(
+            transport=self.async_transport, timeout=POOL_TIMEOUT)
+
+    def stats(self) -> Dict[str, Any]:
+        """Connection counts of the sync pool and all async pools."""
+        sync_connections = _pool_connections(self.sync_client._transport)
+        async_connections = [
+            connection
+            for transport in self.async_transport.transports()
+            for connection in _pool_connections(transport)
+        ]
+        return {
+            "sync": _connection_stats(sync_connections),
+            "async": _connection_stats(async_connections),
+            "event_loops": len(self.async_transport.transports()),
+        }
+
+
+def _pool_connections(transport: Any) -> list:
+    # httpx does not expose its httpcore pool publicly
+    pool = getattr(transport, "_pool", None)
+    return list(getattr(pool, "connections", []))
+
+
+def _connection_stats(connections: list) -> Dict[str, int]:
+    idle = sum(1 for connection in connections if connection.is_idle())
+    return {"connections": len(connections), "idle": idle, "active": len(connections) - idle}
+
+
+_models: Dict[Tuple, BaseChatModel] = {}
+_pools: Dict[str, _ProviderPool] = {}
+_registry_lock = threading.Lock()
+_cache_hits = 0
+_cache_misses = 0
+
+
+def _get_pool(provider: str) -> _ProviderPool:
+    pool = _pools.get(provider)
+    if pool is None:
+        pool = _pools[provider] = _ProviderPool()
+    return pool
+
+
+def _create_chat_model(
+    provider: str,
+    model: str,
+    temperature: float,
+    max_tokens: Optional[int],
+    kwargs: Dict[str, Any]
+) -> BaseChatModel:
+    if provider == "openai":
+        pool = _get_pool(provider)
+        options: Dict[str, Any] = {
+            "http_client": pool.sync_client,
+            "http_async_client": pool.async_client,
+        }
+        if max_tokens is not None:
+            # Newer models (gpt-5-nano, gpt-4o, ...) take max_completion_tokens;
+            # reasoning models use low reasoning_effort to minimize token usage
+            if "gpt-5" in model or "gpt-4o" in model:
+                model_kwargs = {"max_completion_tokens": max_tokens}
+                if "gpt-5" in model or "o1" in model:
+                    model_kwargs["reasoning_effort"] = "low"
+                options["model_kwargs"] = model_kwargs
+            else:
+                options["max_tokens"] = max_tokens
+        return ChatOpenAI(model=model, temperature=temperature, **options, **kwargs)
+
+    options = {"max_tokens": max_tokens} if max_tokens is not None else {}
+    return ChatAnthropic(model=model, temperature=temperature, **options, **kwargs)
+
+
+def get_chat_model(
+    model: str,
+    temperature: float = 0.0,
+    max_tokens: Optional[int] = None,
+    **kwargs: Any
+) -> BaseChatModel:
+    """Return the shared chat model for a configuration.
+
+    Args:
+        model: Model name (e.g., "gpt-5-nano-2025-08-07", "claude-3-5-sonnet-20241022")
+        temperature: Sampling temperature
+        max_tokens: Maximum response tokens (None = provider default)
+        **kwargs: Extra keyword arguments for the chat model class
+
+    Returns:
+        A ChatOpenAI or ChatAnthropic instance shared by all callers that
+        ask for the same configuration
+
+    Raises:
+        ValueError: If the model's provider is not supported
+    """
+    global _cache_hits, _cache_misses
+
+    provider = provider_for_model(model)
+    if provider == "unknown":
+        raise ValueError(f"Unsupported model: {model}")
+
+    key = (provider, model, temperature, max_tokens,
+           tuple(sorted((name, repr(value)) for name, value in kwargs.items())))
+    with _registry_lock:
+        chat_model = _models.get(key)
+        if chat_model is not None:
+            _cache_hits += 1
+            return chat_model
+        _cache_misses += 1
+        chat_model = _models[key] = _create_chat_model(
+            provider, model, temperature, max_tokens, kwargs)
+        return chat_model
+
+
+def client_pool_stats() -> Dict[str, Any]:
+    """Registry and connection pool statistics."""
+    with _registry_lock:
+        models = [f"{key[0]}/{key[1]}" for key in _models]
+        pools = dict(_pools)
+        hits, misses = _cache_hits, _cache_misses
+    return {
+        "chat_models": len(models),
+        "models": sorted(set(models)),
+        "cache_hits": hits,
+        "cache_misses": misses,
+        "pools": {provider: pool.stats() for provider, pool in pools.items()},
+    }
+
+
+def reset_clients() -> None:
+    """Drop all shared chat models and close the sync pools (mainly for tests)."""
+    global _cache_hits, _cache_misses
+    with _registry_lock:
+        for pool in _pools.values():
+            pool.sync_client.close()
+        _models.clear()
+        _pools.clear()
+        _cache_hits = 0
+        _cache_misses = 0
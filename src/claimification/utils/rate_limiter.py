@@ -0,0 +1,246 @@
+"""Process-wide rate limiting for LLM calls.
+
+Several pipelines in one process share the same API key, so they must also
+share its quota. This module keeps one RateLimiter per (provider, model)
+with a requests-per-minute and a tokens-per-minute token bucket. Every
+LLM-calling stage acquires from the matching limiter before each call.
+
+Limits are opt-in: until ``configure_rate_limit`` is called (or the
+CLAIMIFICATION_RATE_LIMIT_RPM / CLAIMIFICATION_RATE_LIMIT_TPM environment
+variables are set), limiters never wait.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from .llm_clients import provider_for_model
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate for rate limiting (about 4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``capacity`` per minute.
+
+    Reservations are taken immediately and may drive the bucket negative;
+    the caller then waits until the debt is refilled. This keeps callers in
+    arrival order without a separate queue.
+    """
+
+    def __init__(self, capacity_per_minute: float):
+        """Initialize a full bucket.
+
+        Args:
+            capacity_per_minute: Bucket size and refill amount per minute
+        """
+        if capacity_per_minute <= 0:
+            raise ValueError("Rate limit must be positive")
+        self.capacity = float(capacity_per_minute)
+        self.refill_per_second = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated
+        self.level = min(self.capacity, self.level + elapsed * self.refill_per_second)
+        self.updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take ``amount`` from the bucket and return the seconds to wait."""
+        self._refill(now)
+        # A single request larger than the bucket could never be served
+        self.level -= min(amount, self.capacity)
+        if self.level >= 0:
+            return 0.0
+        return -self.level / self.refill_per_second
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds a reservation of ``amount`` would wait, without taking it."""
+        self._refill(now)
+        deficit = min(amount, self.capacity) - self.level
+        return max(0.0, deficit / self.refill_per_second)
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute limiter for one provider/model.
+
+    Thread-safe, and usable from both sync (``acquire``) and async
+    (``aacquire``) code.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None
+    ):
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Maximum requests per minute (None = unlimited)
+            tokens_per_minute: Maximum tokens per minute (None = unlimited)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.tokens = 0
+        self.throttled = 0
+        self.total_wait_seconds = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any limit is configured."""
+        return self._request_bucket is not None or self._token_bucket is not None
+
+    def _reserve(self, tokens: int) -> float:
+        with self._lock:
+            self.requests += 1
+            self.tokens += tokens
+            if not self.enabled:
+                return 0.0
+            now = time.monotonic()
+            wait = 0.0
+            if self._request_bucket is not None:
+                wait = max(wait, self._request_bucket.reserve(1, now))
+            if self._token_bucket is not None:
+                wait = max(wait, self._token_bucket.reserve(tokens, now))
+            if wait > 0:
+                self.throttled += 1
+                self.total_wait_seconds += wait
+            return wait
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Block until a request of ``tokens`` tokens may be sent.
+
+        Args:
+            tokens: Estimated tokens the request will consume
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, tokens: int = 0) -> float:
+        """Asynchronously wait until a request of ``tokens`` tokens may be sent.
+
+        Args:
+            tokens: Estimated tokens the request will consume
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def current_wait_seconds(self, tokens: int = 0) -> float:
+        """Seconds a new request of ``tokens`` tokens would wait right now."""
+        with self._lock:
+            if not self.enabled:
+                return 0.0
+            now = time.monotonic()
+            wait = 0.0
+            if self._request_bucket is not None:
+                wait = max(wait, self._request_bucket.wait_time(1, now))
+            if self._token_bucket is not None:
+                wait = max(wait, self._token_bucket.wait_time(tokens, now))
+            return wait
+
+    def stats(self) -> Dict[str, float]:
+        """Current counters and configuration."""
+        return {
+            "requests_per_minute": self.requests_per_minute,
+            "tokens_per_minute": self.tokens_per_minute,
+            "requests": self.requests,
+            "estimated_tokens": self.tokens,
+            "throttled": self.throttled,
+            "total_wait_seconds": round(self.total_wait_seconds, 3),
+            "current_wait_seconds": round(self.current_wait_seconds(), 3),
+        }
+
+
+# Process-wide registry: (provider, model) -> RateLimiter. A model of None
+# is a provider-wide limit shared by all models of that provider.
+_limiters: Dict[Tuple[str, Optional[str]], RateLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def configure_rate_limit(
+    provider: str,
+    model: Optional[str] = None,
+    requests_per_minute: Optional[float] = None,
+    tokens_per_minute: Optional[float] = None
+) -> RateLimiter:
+    """Set the rate limit for a provider or a single model.
+
+    Args:
+        provider: Provider name ("openai" or "anthropic")
+        model: Model name, or None for a limit shared by all of the
+            provider's models that have no model-specific limit
+        requests_per_minute: Maximum requests per minute (None = unlimited)
+        tokens_per_minute: Maximum tokens per minute (None = unlimited)
+
+    Returns:
+        The newly registered RateLimiter
+    """
+    limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+    with _registry_lock:
+        _limiters[(provider, model)] = limiter
+        # Unconfigured models of this provider resolved earlier must pick up
+        # the new provider-wide limit
+        if model is None:
+            for key in [k for k, v in _limiters.items()
+                        if k[0] == provider and k[1] is not None and not v.enabled]:
+                del _limiters[key]
+    return limiter
+
+
+def get_rate_limiter(provider: str, model: str) -> RateLimiter:
+    """Return the limiter shared by all callers of a provider/model.
+
+    Falls back to the provider-wide limiter, then to the environment
+    defaults, then to an unlimited limiter that only counts requests.
+    """
+    with _registry_lock:
+        limiter = _limiters.get((provider, model)) or _limiters.get((provider, None))
+        if limiter is None:
+            rpm = os.getenv("CLAIMIFICATION_RATE_LIMIT_RPM")
+            tpm = os.getenv("CLAIMIFICATION_RATE_LIMIT_TPM")
+            if rpm or tpm:
+                limiter = RateLimiter(
+                    float(rpm) if rpm else None,
+                    float(tpm) if tpm else None
+                )
+                _limiters[(provider, None)] = limiter
+            else:
+                limiter = RateLimiter()
+                _limiters[(provider, model)] = limiter
+        return limiter
+
+
+def rate_limiter_stats() -> Dict[str, Dict[str, float]]:
+    """Counters of every registered limiter, keyed by "provider/model"."""
+    with _registry_lock:
+        limiters = list(_limiters.items())
+    return {
+        f"{provider}/{model or '*'}": limiter.stats()
+        for (provider, model), limiter in limiters
+    }
+
+
+def reset_rate_limiters() -> None:
+    """Forget all configured limiters (mainly for tests)."""
+    with _registry_lock:
+        _limiters.clear()
@@ -0,0 +1,419 @@
+"""Retry policy and circuit breaking for LLM calls.
+
+Errors are classified before deciding whether and when to retry:
+
+- rate limit (HTTP 429): retried after exponential backoff, or after the
+  provider's ``Retry-After`` header if that is longer
+- transient (timeouts, connection errors, HTTP 408/409/5xx): retried after
+  exponential backoff, and counted by the provider's circuit breaker
+- schema (the model answered, but the output did not match the schema):
+  retried immediately, on a separate budget, since the upstream is healthy
+- auth (HTTP 401/403, missing or invalid API key): never retried
+- unknown: retried immediately, as the agents always did
+
+The circuit breaker is shared per provider: after repeated transient
+failures it opens and calls fail fast with CircuitOpenError until a cool-down
+has passed, instead of every sentence spending its full retry budget on an
+upstream that is down.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from .hooks import emit
+
+
+T = TypeVar("T")
+
+
+class ErrorKind(str, Enum):
+    """Retry classification of an LLM call error."""
+    RATE_LIMIT = "rate_limit"
+    TRANSIENT = "transient"
+    SCHEMA = "schema"
+    AUTH = "auth"
+    UNKNOWN = "unknown"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a provider whose circuit breaker is open."""
+
+
+_RATE_LIMIT_NAMES = {"RateLimitError"}
+_AUTH_NAMES = {"AuthenticationError", "PermissionDeniedError"}
+_TRANSIENT_NAMES = {
+    "APIConnectionError", "APITimeoutError", "InternalServerError",
+    "ServiceUnavailableError", "OverloadedError", "TimeoutException",
+    "TransportError", "ConnectError", "ReadTimeout", "RemoteProtocolError",
+}
+_SCHEMA_NAMES = {"ValidationError", "OutputParserException", "JSONDecodeError"}
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    status = getattr(error, "status_code", None)
+    if status is None:
+        response = getattr(error, "response", None)
+        status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def classify_error(error: Exception) -> ErrorKind:
+    """Classify an exception raised by an LLM call.
+
+    Uses the HTTP status code where the provider SDK exposes one and falls
+    back to exception class names, so no SDK needs to be imported here.
+    """
+    status = _status_code(error)
+    if status == 429:
+        return ErrorKind.RATE_LIMIT
+    if status in (401, 403):
+        return ErrorKind.AUTH
+    if status in (408, 409) or (status is not None and status >= 500):
+        return ErrorKind.TRANSIENT
+
+    names = {cls.__name__ for cls in type(error).__mro__}
+    if names & _RATE_LIMIT_NAMES:
+        return ErrorKind.RATE_LIMIT
+    if names & _AUTH_NAMES:
+        return ErrorKind.AUTH
+    if names & _TRANSIENT_NAMES or isinstance(error, (TimeoutError, ConnectionError)):
+        return ErrorKind.TRANSIENT
+    if names & _SCHEMA_NAMES:
+        return ErrorKind.SCHEMA
+    return ErrorKind.UNKNOWN
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read the provider's Retry-After hint from an error, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after-ms")
+    if value is not None:
+        try:
+            return float(value) / 1000.0
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class RetryState:
+    """Retry bookkeeping for one logical call."""
+    attempts: int = 0
+    schema_failures: int = 0
+    failures: int = 0
+    backoff_seconds: float = 0.0
+    wait_seconds: float = 0.0
+    last_error_kind: Optional[ErrorKind] = None
+
+    @property
+    def retries(self) -> int:
+        """Number of attempts after the first one."""
+        return max(0, self.attempts - 1)
+
+    def as_metadata(self) -> Dict[str, Any]:
+        """Retry statistics for result metadata."""
+        return {
+            "retries": self.retries,
+            "backoff_seconds": round(self.backoff_seconds, 3),
+        }
+
+    def as_timing(self) -> Dict[str, Any]:
+        """Attempts and rate-limit wait time for call timing."""
+        return {
+            "attempts": self.attempts,
+            "wait_seconds": round(self.wait_seconds, 4),
+        }
+
+
+class RetryPolicy:
+    """Decides whether and when to retry a failed LLM call."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+        schema_retries: int = 1
+    ):
+        """Initialize the policy.
+
+        Args:
+            max_attempts: Maximum attempts for rate-limit, transient and
+                unknown errors (including the first call)
+            base_delay: Backoff before the first retry, in seconds; doubled
+                for every further retry
+            max_delay: Upper bound for the computed backoff
+            jitter: Randomize each backoff between half and the full value
+            schema_retries: Extra immediate attempts after schema failures
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.schema_retries = schema_retries
+
+    def backoff(self, failures: int) -> float:
+        """Exponential backoff after ``failures`` failed attempts."""
+        delay = min(self.max_delay, self.base_delay * 2 ** (failures - 1))
+        if self.jitter:
+            delay = delay / 2 + random.uniform(0, delay / 2)
+        return delay
+
+    def next_delay(self, error: Exception, state: RetryState) -> Optional[float]:
+        """Record a failed attempt and return the delay before retrying.
+
+        Args:
+            error: The exception raised by the attempt
+            state: Retry state of the call, updated in place
+
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        kind = classify_error(error)
+        state.last_error_kind = kind
+
+        if kind is ErrorKind.AUTH:
+            return None
+        if kind is ErrorKind.SCHEMA:
+            state.schema_failures += 1
+            return 0.0 if state.schema_failures <= self.schema_retries else None
+
+        state.failures += 1
+        if state.failures >= self.max_attempts:
+            return None
+        if kind is ErrorKind.UNKNOWN:
+            return 0.0
+
+        delay = self.backoff(state.failures)
+        if kind is ErrorKind.RATE_LIMIT:
+            retry_after = retry_after_seconds(error)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+        return delay
+
+
+class CircuitBreaker:
+    """Fails fast after repeated transient failures of one provider.
+
+    Closed: calls pass. After ``failure_threshold`` consecutive transient
+    failures the breaker opens and ``before_call`` raises CircuitOpenError.
+    Once ``reset_timeout`` seconds have passed it lets a single probe call
+    through (half-open); the probe's outcome closes or re-opens it. A probe
+    that ends without an outcome (e.g. cancelled) is released, so the next
+    call probes instead; one outstanding for longer than ``reset_timeout``
+    is given up on in the same way.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Initialize the breaker.
+
+        Args:
+            name: Provider name, used in error messages
+            failure_threshold: Consecutive transient failures that open it
+            reset_timeout: Seconds to stay open before probing again
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+        self.probe_started: Optional[float] = None
+        self.times_opened = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """"closed", "open" or "half_open"."""
+        if self.opened_at is None:
+            return "closed"
+        if self.probing or time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> bool:
+        """Raise CircuitOpenError if calls to this provider should fail fast.
+
+        Returns:
+            True if the call is the half-open probe
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return False
+            now = time.monotonic()
+            remaining = self.reset_timeout - (now - self.opened_at)
+            if self.probing and now - self.probe_started >= self.reset_timeout:
+                # The probe's outcome never arrived
+                self.probing = False
+            if remaining <= 0 and not self.probing:
+                self.probing = True
+                self.probe_started = now
+                return True
+            raise CircuitOpenError(
+                f"Circuit open for provider '{self.name}' after "
+                f"{self.consecutive_failures} consecutive failures; "
+                f"retrying in {max(0.0, remaining):.1f}s"
+            )
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        with self._lock:
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self.probing = False
+
+    def release_probe(self) -> None:
+        """Let another call probe after a probe ended without an outcome."""
+        with self._lock:
+            self.probing = False
+
+    def record_failure(self, kind: ErrorKind) -> None:
+        """Count a failed call; only transient failures can open the breaker."""
+        with self._lock:
+            if kind is not ErrorKind.TRANSIENT:
+                # The upstream answered, so a pending probe succeeded
+                if self.probing:
+                    self.opened_at = None
+                    self.probing = False
+                return
+            self.consecutive_failures += 1
+            if self.probing or self.consecutive_failures >= self.failure_threshold:
+                if self.opened_at is None or self.probing:
+                    self.times_opened += 1
+                self.opened_at = time.monotonic()
+                self.probing = False
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(provider: str) -> CircuitBreaker:
+    """Return the process-wide circuit breaker for a provider."""
+    with _breakers_lock:
+        breaker = _breakers.get(provider)
+        if breaker is None:
+            breaker = _breakers[provider] = CircuitBreaker(provider)
+        return breaker
+
+
+def reset_circuit_breakers() -> None:
+    """Forget all circuit breaker state (mainly for tests)."""
+    with _breakers_lock:
+        _breakers.clear()
+
+
+def _report_retry(error: Exception, state: RetryState, delay: float) -> None:
+    """Report a failed attempt that will be retried to the tracing hooks."""
+    emit(
+        "retry",
+        attempt=state.attempts,
+        error_kind=state.last_error_kind.value,
+        error=f"{type(error).__name__}: {error}",
+        delay_seconds=round(delay, 3)
+    )
+
+
+def call_with_retry(
+    func: Callable[[], T],
+    policy: RetryPolicy,
+    breaker: Optional[CircuitBreaker] = None,
+    state: Optional[RetryState] = None
+) -> T:
+    """Call ``func`` until it succeeds or the policy gives up.
+
+    Args:
+        func: Zero-argument callable performing one attempt
+        policy: Retry policy
+        breaker: Circuit breaker of the called provider
+        state: Retry state to update (pass one in to read it after a failure)
+
+    Returns:
+        The return value of the first successful attempt
+
+    Raises:
+        The last attempt's exception, or CircuitOpenError
+    """
+    state = state if state is not None else RetryState()
+    while True:
+        probe = breaker.before_call() if breaker is not None else False
+        state.attempts += 1
+        try:
+            result = func()
+        except Exception as error:
+            delay = policy.next_delay(error, state)
+            if breaker is not None:
+                breaker.record_failure(state.last_error_kind)
+            if delay is None:
+                raise
+            _report_retry(error, state, delay)
+            state.backoff_seconds += delay
+            if delay > 0:
+                time.sleep(delay)
+            continue
+        except BaseException:
+            # Cancelled or interrupted: no outcome to record
+            if probe:
+                breaker.release_probe()
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        return result
+
+
+async def acall_with_retry(
+    func: Callable[[], Awaitable[T]],
+    policy: RetryPolicy,
+    breaker: Optional[CircuitBreaker] = None,
+    state: Optional[RetryState] = None
+) -> T:
+    """Async counterpart of ``call_with_retry``; ``func`` returns an awaitable."""
+    state = state if state is not None else RetryState()
+    while True:
+        probe = breaker.before_call() if breaker is not None else False
+        state.attempts += 1
+        try:
+            result = await func()
+        except Exception as error:
+            delay = policy.next_delay(error, state)
+            if breaker is not None:
+                breaker.record_failure(state.last_error_kind)
+            if delay is None:
+                raise
+            _report_retry(error, state, delay)
+            state.backoff_seconds += delay
+            if delay > 0:
+                await asyncio.sleep(delay)
+            continue
+        except BaseException:
+            # Cancelled or interrupted: no outcome to record
+            if probe:
+                breaker.release_probe()
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        return result
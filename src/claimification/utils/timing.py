@@ -0,0 +1,115 @@
+"""Per-stage timing of LLM calls and its aggregation.
+
+Every LLM call made by a pipeline stage is described by a small dict:
+
+- ``seconds``: wall time of the call, including rate-limit waits and retries
+- ``wait_seconds``: time spent waiting for the provider's rate limiter
+- ``attempts``: requests sent (0 for a cache hit)
+- ``cache_hit``: whether the response came from the response cache
+
+The claim pipeline stores these per sentence; the entity-mapping stages
+report them through ``record_call`` to the ``record_calls`` blocks that are
+active in the current context. ``stage_statistics`` aggregates them into
+p50/p95/max per stage.
+"""
+
+import math
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# Lists collecting the calls of the enclosing record_calls blocks
+_recorders: ContextVar[Tuple[List[Dict[str, Any]], ...]] = ContextVar(
+    "call_recorders", default=())
+
+
+def call_timing(
+    seconds: float,
+    wait_seconds: float = 0.0,
+    attempts: int = 1,
+    cache_hit: bool = False
+) -> Dict[str, Any]:
+    """Describe one LLM call (see the module docstring for the fields)."""
+    return {
+        "seconds": round(seconds, 4),
+        "wait_seconds": round(wait_seconds, 4),
+        "attempts": attempts,
+        "cache_hit": cache_hit,
+    }
+
+
+@contextmanager
+def record_calls() -> Iterator[List[Dict[str, Any]]]:
+    """Collect the calls reported by ``record_call`` within the block.
+
+    Blocks can be nested; a call is added to every enclosing block of the
+    current thread or task. Tasks created inside a block report to it too.
+
+    Yields:
+        The list the call dicts are appended to
+    """
+    calls: List[Dict[str, Any]] = []
+    token = _recorders.set(_recorders.get() + (calls,))
+    try:
+        yield calls
+    finally:
+        _recorders.reset(token)
+
+
+def record_call(stage: str, timing: Dict[str, Any]) -> None:
+    """Report a call of a stage to the active ``record_calls`` blocks."""
+    for calls in _recorders.get():
+        calls.append({"stage": stage, **timing})
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize_durations(values: Iterable[float]) -> Dict[str, Optional[float]]:
+    """p50, p95, max and total of a set of durations in seconds.
+
+    Percentiles use the nearest-rank method, so they are always observed
+    values; all but the total are None for an empty set.
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return {"p50": None, "p95": None, "max": None, "total": 0.0}
+    return {
+        "p50": round(_percentile(ordered, 0.50), 4),
+        "p95": round(_percentile(ordered, 0.95), 4),
+        "max": round(ordered[-1], 4),
+        "total": round(sum(ordered), 4),
+    }
+
+
+def stage_statistics(
+    calls: Iterable[Tuple[str, Dict[str, Any]]]
+) -> Dict[str, Dict[str, Any]]:
+    """Aggregate call timings per stage.
+
+    Args:
+        calls: (stage, call timing) pairs
+
+    Returns:
+        Per stage: number of calls, attempts, retries and cache hits, and
+        duration summaries of the call time and rate-limit wait time
+    """
+    by_stage: Dict[str, List[Dict[str, Any]]] = {}
+    for stage, timing in calls:
+        by_stage.setdefault(stage, []).append(timing)
+
+    return {
+        stage: {
+            "calls": len(timings),
+            "attempts": sum(t["attempts"] for t in timings),
+            "retries": sum(max(0, t["attempts"] - 1) for t in timings),
+            "cache_hits": sum(1 for t in timings if t["cache_hit"]),
+            "seconds": summarize_durations(t["seconds"] for t in timings),
+            "wait_seconds": summarize_durations(t["wait_seconds"] for t in timings),
+        }
+        for stage, timings in by_stage.items()
+    }
@@ -0,0 +1,180 @@
+"""Token usage of LLM calls and its estimated cost.
+
+Each call is run with a LangChain ``UsageMetadataCallbackHandler``, which
+collects the ``usage_metadata`` of the provider's responses (including
+failed schema attempts that were retried). Usage is kept as a flat dict:
+
+- ``input_tokens`` / ``output_tokens`` / ``total_tokens``
+- ``reasoning_tokens``: output tokens spent on reasoning (included in
+  ``output_tokens``)
+- ``cached_input_tokens``: input tokens read from the provider's prompt
+  cache (included in ``input_tokens``)
+
+Responses served from the local response cache use no tokens.
+
+Costs are only estimated for models in the price table, configured with
+``configure_prices`` or a JSON file named by the CLAIMIFICATION_PRICES
+environment variable. Prices are in USD per million tokens and are looked
+up by the longest model-name prefix, e.g.::
+
+    {"gpt-5-nano": {"input": 0.05, "output": 0.40, "cached_input": 0.005}}
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from langchain_core.callbacks import UsageMetadataCallbackHandler
+
+
+USAGE_FIELDS = (
+    "input_tokens", "output_tokens", "reasoning_tokens", "cached_input_tokens", "total_tokens")
+
+
+def empty_usage() -> Dict[str, int]:
+    """Usage of no calls."""
+    return {name: 0 for name in USAGE_FIELDS}
+
+
+def usage_callback() -> UsageMetadataCallbackHandler:
+    """A callback handler collecting the usage of one logical call."""
+    return UsageMetadataCallbackHandler()
+
+
+def callback_usage(handler: UsageMetadataCallbackHandler) -> Dict[str, int]:
+    """Usage collected by a handler, summed over the models it saw."""
+    usage = empty_usage()
+    for metadata in handler.usage_metadata.values():
+        input_details = metadata.get("input_token_details") or {}
+        output_details = metadata.get("output_token_details") or {}
+        usage["input_tokens"] += metadata.get("input_tokens", 0)
+        usage["output_tokens"] += metadata.get("output_tokens", 0)
+        usage["reasoning_tokens"] += output_details.get("reasoning", 0) or 0
+        usage["cached_input_tokens"] += input_details.get("cache_read", 0) or 0
+        usage["total_tokens"] += metadata.get("total_tokens", 0)
+    return usage
+
+
+def add_usage(total: Dict[str, int], usage: Dict[str, int]) -> Dict[str, int]:
+    """Add usage to a running total in place and return the total."""
+    for name in USAGE_FIELDS:
+        total[name] = total.get(name, 0) + usage.get(name, 0)
+    return total
+
+
+# Process-wide price table: model-name prefix -> USD per million tokens
+_prices: Optional[Dict[str, Dict[str, float]]] = None
+_prices_lock = threading.Lock()
+
+
+def configure_prices(prices: Union[Dict[str, Dict[str, float]], str, Path, None]) -> None:
+    """Set the price table used for cost estimates.
+
+    Args:
+        prices: Mapping of model-name prefix to ``{"input": ..., "output":
+            ..., "cached_input": ...}`` in USD per million tokens, or the
+            path of a JSON file holding one (None disables estimates)
+    """
+    global _prices
+    if isinstance(prices, (str, Path)):
+        prices = json.loads(Path(prices).read_text(encoding="utf-8"))
+    with _prices_lock:
+        _prices = dict(prices) if prices is not None else {}
+
+
+def reset_prices() -> None:
+    """Forget the configured prices and re-read the environment (mainly for tests)."""
+    global _prices
+    with _prices_lock:
+        _prices = None
+
+
+def model_price(model: str) -> Optional[Dict[str, float]]:
+    """Prices of a model (longest matching prefix), or None if unknown."""
+    global _prices
+    with _prices_lock:
+        if _prices is None:
+            path = os.getenv("CLAIMIFICATION_PRICES")
+            _prices = json.loads(Path(path).read_text(encoding="utf-8")) if path else {}
+        matches = [prefix for prefix in _prices if model.startswith(prefix)]
+        return _prices[max(matches, key=len)] if matches else None
+
+
+def estimate_cost(model: str, usage: Dict[str, int]) -> Optional[float]:
+    """Estimated cost of usage in USD, or None if the model has no price.
+
+    Cached input tokens are charged at ``cached_input`` where it is given,
+    otherwise at the input price.
+    """
+    price = model_price(model)
+    if price is None:
+        return None
+    cached = usage.get("cached_input_tokens", 0)
+    cached_price = price.get("cached_input", price.get("input", 0.0))
+    cost = (
+        (usage.get("input_tokens", 0) - cached) * price.get("input", 0.0)
+        + cached * cached_price
+        + usage.get("output_tokens", 0) * price.get("output", 0.0)
+    )
+    return round(cost / 1_000_000, 6)
+
+
+def usage_statistics(
+    calls: Iterable[Tuple[str, Dict[str, int]]],
+    model: Optional[str] = None
+) -> Dict[str, Any]:
+    """Total and per-stage token usage, with the estimated cost.
+
+    Args:
+        calls: (stage, usage) pairs
+        model: Model the calls were made with, for the cost estimate
+
+    Returns:
+        The usage totals, ``stages`` with the totals per stage and, if the
+        model has a price, ``estimated_cost_usd``
+    """
+    total = empty_usage()
+    stages: Dict[str, Dict[str, int]] = {}
+    for stage, usage in calls:
+        add_usage(total, usage)
+        add_usage(stages.setdefault(stage, empty_usage()), usage)
+
+    statistics: Dict[str, Any] = {**total, "stages": stages}
+    cost = estimate_cost(model, total) if model is not None else None
+    if cost is not None:
+        statistics["estimated_cost_usd"] = cost
+    return statistics
+
+
+def usage_totals(statistics: Dict[str, Any]) -> Dict[str, Any]:
+    """The totals of usage statistics, without the per-stage breakdown."""
+    return {key: value for key, value in statistics.items() if key != "stages"}
+
+
+def sum_usage(totals: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Add up the usage totals of several runs (e.g. the documents of a batch).
+
+    The estimated cost is included if any run has one.
+    """
+    total: Dict[str, Any] = empty_usage()
+    cost = None
+    for usage in totals:
+        add_usage(total, usage)
+        if usage.get("estimated_cost_usd") is not None:
+            cost = (cost or 0.0) + usage["estimated_cost_usd"]
+    if cost is not None:
+        total["estimated_cost_usd"] = round(cost, 6)
+    return total
+
+
+def format_usage(usage: Dict[str, Any]) -> str:
+    """One-line description of usage totals, e.g. for a summary."""
+    text = (
+        f"{usage.get('input_tokens', 0):,} input / {usage.get('output_tokens', 0):,} output "
+        f"tokens ({usage.get('reasoning_tokens', 0):,} reasoning)"
+    )
+    if usage.get("estimated_cost_usd") is not None:
+        text += f", estimated cost ${usage['estimated_cost_usd']:.4f}"
+    return text
@@ -0,0 +1,143 @@
+"""Shared fixtures for pipeline tests that must not hit a real LLM."""
+
+import asyncio
+
+import pytest
+
+from claimification.claim_extraction.models import (
+    SelectionResult,
+    DisambiguationResult,
+    DecompositionResult,
+    StageResult,
+)
+
+
+class StubAgent:
+    """Stand-in for an LLM agent that answers from a callable.
+
+    ``respond(sentence, context)`` returns the stage's result model, or
+    raises to simulate a failed call.
+    """
+
+    def __init__(self, respond, model_name: str = "stub-model", delay: float = 0.0):
+        self.respond = respond
+        self.model_name = model_name
+        self.delay = delay
+        self.calls = []
+        self.batch_sizes = []
+        self.packed_windows = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def process(self, sentence: str, context: str) -> StageResult:
+        self.calls.append(sentence)
+        try:
+            return StageResult(success=True, data=self.respond(sentence, context))
+        except Exception as e:
+            return StageResult(success=False, error=str(e))
+
+    async def aprocess(self, sentence: str, context: str) -> StageResult:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            return self.process(sentence, context)
+        finally:
+            self.in_flight -= 1
+
+    async def aprocess_batch(self, sentences_with_context, max_concurrency=None):
+        self.batch_sizes.append(len(sentences_with_context))
+        return list(await asyncio.gather(
+            *(self.aprocess(sentence, context) for sentence, context in sentences_with_context)
+        ))
+
+    def process_packed(self, sentences, shared_context):
+        self.packed_windows.append([sentence_id for sentence_id, _, _ in sentences])
+        return [self.process(sentence, context) for _, sentence, context in sentences]
+
+    async def aprocess_packed(self, sentences, shared_context):
+        await asyncio.sleep(self.delay)
+        return self.process_packed(sentences, shared_context)
+
+
+def default_selection(sentence, context):
+    return SelectionResult(
+        has_verifiable_content="?" not in sentence,
+        reason="stub"
+    )
+
+
+def default_disambiguation(sentence, context):
+    return DisambiguationResult(
+        is_ambiguous=False,
+        can_be_disambiguated=True,
+        ambiguity_explanation="stub"
+    )
+
+
+def default_decomposition(sentence, context):
+    return DecompositionResult(claims=[sentence], extraction_reasoning="stub")
+
+
+@pytest.fixture
+def stub_pipeline(monkeypatch):
+    """A ClaimExtractionPipeline whose agents are replaced by stubs."""
+    from claimification.claim_extraction.pipeline import ClaimExtractionPipeline
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    pipeline = ClaimExtractionPipeline(verbose=False, max_concurrency=4)
+    pipeline.selection_agent = StubAgent(default_selection, delay=0.01)
+    pipeline.disambiguation_agent = StubAgent(default_disambiguation, delay=0.01)
+    pipeline.decomposition_agent = StubAgent(default_decomposition, delay=0.01)
+    return pipeline
+
+
+# Names the stub entity stage recognizes in a prompt
+STUB_ENTITY_NAMES = ["Paris", "France", "Berlin", "Germany", "Tokyo", "Japan"]
+
+
+@pytest.fixture
+def stub_entity_pipeline(monkeypatch):
+    """An EntityMappingPipeline whose LLM calls are answered locally.
+
+    Stage 1 returns the STUB_ENTITY_NAMES found in its prompt; stages 2 and
+    3 return no relationships. ``pipeline.calls`` records each LLM call.
+    """
+    from langchain_core.runnables import RunnableLambda
+    from claimification.entity_mapping import EntityMappingPipeline
+    from claimification.entity_mapping.stages.entity_extraction import EntityExtractionOutput
+    from claimification.entity_mapping.stages.relationship_extraction import (
+        RelationshipExtractionOutput
+    )
+    from claimification.entity_mapping.stages.relationship_inference import (
+        RelationshipInferenceOutput
+    )
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    pipeline = EntityMappingPipeline()
+    pipeline.calls = []
+
+    def stub_chain(output_model, answer):
+        def build_chain(prompts):
+            def respond(_):
+                pipeline.calls.append(output_model.__name__)
+                return output_model(**answer(prompts["user"]))
+
+            async def arespond(value):
+                await asyncio.sleep(0.01)
+                return respond(value)
+
+            return RunnableLambda(respond, afunc=arespond)
+        return build_chain
+
+    def entities(user_prompt):
+        return {"entities": [{"text": name, "type": "LOCATION"}
+                             for name in STUB_ENTITY_NAMES if name in user_prompt]}
+
+    monkeypatch.setattr(pipeline.stage1, "_build_chain",
+                        stub_chain(EntityExtractionOutput, entities))
+    monkeypatch.setattr(pipeline.stage2, "_build_chain",
+                        stub_chain(RelationshipExtractionOutput, lambda _: {"relationships": []}))
+    monkeypatch.setattr(pipeline.stage3, "_build_chain",
+                        stub_chain(RelationshipInferenceOutput, lambda _: {"relationships": []}))
+    return pipeline
@@ -0,0 +1,130 @@
+"""Test batched execution of the claim extraction agents."""
+
+import asyncio
+import json
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from claimification.claim_extraction.stages import SelectionAgent
+from claimification.utils.retry import (
+    CircuitOpenError,
+    ErrorKind,
+    RetryPolicy,
+    reset_circuit_breakers
+)
+
+
+@pytest.fixture
+def selection_agent(monkeypatch):
+    """A SelectionAgent whose LLM fails for sentences containing 'FAIL'."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    agent = SelectionAgent(max_retries=2)
+    agent.attempts = []
+
+    def respond(prompt_value):
+        user_prompt = prompt_value.messages[-1].content
+        agent.attempts.append(user_prompt)
+        if "FAIL" in user_prompt:
+            raise RuntimeError("upstream error")
+        return {"has_verifiable_content": True, "reason": user_prompt.split("\n")[3]}
+
+    agent.structured_llm = RunnableLambda(respond)
+    return agent
+
+
+def test_process_batch_isolates_failures(selection_agent):
+    """One failing item does not affect the others and order is preserved."""
+    items = [("First.", ""), ("FAIL here.", ""), ("Third.", "")]
+
+    results = selection_agent.process_batch(items, max_concurrency=2)
+
+    assert [r.success for r in results] == [True, False, True]
+    assert results[0].data.reason == "First."
+    assert results[2].data.reason == "Third."
+    assert results[1].error.startswith("Selection failed:")
+    # Only the failed item is retried
+    assert len(selection_agent.attempts) == 4
+
+
+def test_aprocess_batch_matches_process_batch(selection_agent):
+    """The async batch path returns the same results in input order."""
+    items = [("One.", ""), ("FAIL.", ""), ("Two.", "")]
+
+    sync_results = selection_agent.process_batch(items)
+    async_results = asyncio.run(selection_agent.aprocess_batch(items))
+
+    assert [r.success for r in async_results] == [r.success for r in sync_results]
+    assert [r.data.reason for r in async_results if r.success] == ["One.", "Two."]
+
+
+def test_process_packed_falls_back_for_dropped_sentences(selection_agent):
+    """Dropped, duplicated and unknown IDs fall back to single calls."""
+    packed_calls = []
+
+    def respond_packed(prompt_value):
+        packed_calls.append(prompt_value.messages[-1].content)
+        return {"results": [
+            {"sentence_id": "s0", "has_verifiable_content": False, "reason": "packed"},
+            {"sentence_id": "s2", "has_verifiable_content": True, "reason": "packed"},
+            {"sentence_id": "s2", "has_verifiable_content": False, "reason": "packed"},
+            {"sentence_id": "s9", "has_verifiable_content": True, "reason": "packed"},
+        ]}
+
+    selection_agent.packed_llm = RunnableLambda(respond_packed)
+    items = [("s0", "Zero.", "ctx"), ("s1", "One.", "ctx"), ("s2", "Two.", "ctx")]
+
+    results = selection_agent.process_packed(items, shared_context="shared")
+    async_results = asyncio.run(selection_agent.aprocess_packed(items, "shared"))
+
+    assert len(packed_calls) == 2
+    assert "[s1] One." in packed_calls[0]
+    for batch in (results, async_results):
+        assert [r.data.reason for r in batch] == ["packed", "One.", "Two."]
+        assert batch[0].data.has_verifiable_content is False
+
+
+class AuthError(Exception):
+    status_code = 401
+
+
+def test_process_packed_falls_back_only_for_schema_failures(selection_agent):
+    """Only unparseable packed output is retried as single calls."""
+    error = {}
+
+    def respond_packed(prompt_value):
+        raise error["value"]
+
+    reset_circuit_breakers()
+    selection_agent.packed_llm = RunnableLambda(respond_packed)
+    selection_agent.retry_policy = RetryPolicy(max_attempts=2, base_delay=0.0, schema_retries=1)
+    items = [("s0", "Zero.", "ctx"), ("s1", "One.", "ctx")]
+
+    error["value"] = json.JSONDecodeError("garbled", "{", 0)
+    for batch in (selection_agent.process_packed(items, "shared"),
+                  asyncio.run(selection_agent.aprocess_packed(items, "shared"))):
+        assert [r.data.reason for r in batch] == ["Zero.", "One."]
+        assert batch[1].metadata["packed_fallback"]["retries"] == 1
+        assert "garbled" in batch[1].metadata["packed_fallback"]["error"]
+
+    selection_agent.attempts.clear()
+    error["value"] = ConnectionError("down")
+    for batch in (selection_agent.process_packed(items, "shared"),
+                  asyncio.run(selection_agent.aprocess_packed(items, "shared"))):
+        assert [r.success for r in batch] == [False, False]
+        assert batch[0].error == "Selection failed: down"
+    assert selection_agent.attempts == []
+
+    error["value"] = AuthError("invalid key")
+    with pytest.raises(AuthError):
+        selection_agent.process_packed(items, "shared")
+
+    breaker = selection_agent.circuit_breaker
+    try:
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure(ErrorKind.TRANSIENT)
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(selection_agent.aprocess_packed(items, "shared"))
+    finally:
+        reset_circuit_breakers()
+    assert selection_agent.attempts == []
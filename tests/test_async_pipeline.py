@@ -0,0 +1,257 @@
+"""Test the async claim extraction path."""
+
+import asyncio
+
+import pytest
+
+from claimification.claim_extraction.models import SentenceStatus
+
+
+TEXT = (
+    "Paris is the capital of France. Is it sunny today? "
+    "Berlin has 3.7 million residents. Tokyo hosted the 2020 Olympics. "
+    "What time is it? Mount Everest is 8849 meters tall."
+)
+
+
+def untimed(metadata):
+    """Result metadata without the run-dependent timing."""
+    return {key: value for key, value in metadata.items() if key != "timing"}
+
+
+def test_aextract_claims_matches_sync_order(stub_pipeline):
+    """Async results come back in original sentence order."""
+    sync_result = stub_pipeline.extract_claims(TEXT)
+    async_result = asyncio.run(stub_pipeline.aextract_claims(TEXT))
+
+    assert [r.sentence_id for r in async_result.sentence_results] == \
+        [r.sentence_id for r in sync_result.sentence_results]
+    assert [r.status for r in async_result.sentence_results] == \
+        [r.status for r in sync_result.sentence_results]
+    assert async_result.sentence_results[1].status == SentenceStatus.NO_VERIFIABLE_CLAIMS
+
+
+def test_aextract_claims_respects_max_concurrency(stub_pipeline):
+    """No more than max_concurrency sentences are in flight at once."""
+    asyncio.run(stub_pipeline.aextract_claims(TEXT))
+
+    assert stub_pipeline.selection_agent.max_in_flight > 1
+    assert stub_pipeline.selection_agent.max_in_flight <= stub_pipeline.max_concurrency
+
+
+def test_wavefront_scheduler_matches_depth_first(stub_pipeline):
+    """The wavefront scheduler produces the same PipelineResult contents."""
+    depth_first = asyncio.run(stub_pipeline.aextract_claims(TEXT))
+
+    stub_pipeline.scheduler = "wavefront"
+    stub_pipeline.stage_concurrency = {"selection": 2, "decomposition": 1}
+    stub_pipeline.stage_batch_size = 3
+    wavefront = stub_pipeline.extract_claims(TEXT)
+
+    assert [(r.sentence_id, r.status, [c.text for c in r.claims], untimed(r.metadata))
+            for r in wavefront.sentence_results] == \
+        [(r.sentence_id, r.status, [c.text for c in r.claims], untimed(r.metadata))
+         for r in depth_first.sentence_results]
+    assert stub_pipeline.decomposition_agent.max_in_flight <= 3
+    assert max(stub_pipeline.selection_agent.batch_sizes) <= 3
+
+
+@pytest.mark.parametrize("scheduler", ["depth_first", "wavefront"])
+def test_failing_progress_callback_is_raised(stub_pipeline, scheduler):
+    """An error in a progress callback ends the run instead of hanging it."""
+    def progress_callback(result, completed, total):
+        raise OSError("disk full")
+
+    stub_pipeline.scheduler = scheduler
+    with pytest.raises(OSError, match="disk full"):
+        asyncio.run(asyncio.wait_for(
+            stub_pipeline.aextract_claims(TEXT, progress_callback=progress_callback), 3))
+
+
+def test_failed_wavefront_batch_gives_each_sentence_its_own_result(stub_pipeline, monkeypatch):
+    """Sentences of a failed batch do not share one StageResult."""
+    async def fail(inputs, max_concurrency=None):
+        raise ConnectionError("down")
+
+    timed = []
+    time_stage = stub_pipeline._time_stage
+
+    def record(stage, started, *results, **kwargs):
+        timed.extend(results)
+        return time_stage(stage, started, *results, **kwargs)
+
+    monkeypatch.setattr(stub_pipeline.selection_agent, "aprocess_batch", fail)
+    monkeypatch.setattr(stub_pipeline, "_time_stage", record)
+    stub_pipeline.scheduler = "wavefront"
+    stub_pipeline.stage_batch_size = 6
+    result = stub_pipeline.extract_claims(TEXT)
+
+    assert all(r.status == SentenceStatus.PROCESSING_ERROR for r in result.sentence_results)
+    assert len(timed) == 6 and len({id(r) for r in timed}) == 6
+
+
+def test_wavefront_rejects_unknown_stage(stub_pipeline):
+    """Misspelled stage names in stage_concurrency are reported."""
+    from claimification.claim_extraction.scheduler import WavefrontScheduler
+
+    with pytest.raises(ValueError, match="Unknown stages"):
+        WavefrontScheduler(stub_pipeline, stage_concurrency={"selecton": 2})
+
+
+@pytest.mark.parametrize("scheduler", ["depth_first", "wavefront"])
+def test_selection_packing_matches_unpacked(stub_pipeline, scheduler):
+    """Packed Selection windows give the same results as per-sentence calls."""
+    unpacked = stub_pipeline.extract_claims(TEXT)
+
+    stub_pipeline.scheduler = scheduler
+    stub_pipeline.selection_pack_size = 4
+    packed_sync = stub_pipeline.extract_claims(TEXT)
+    packed_async = asyncio.run(stub_pipeline.aextract_claims(TEXT))
+
+    expected = [(r.sentence_id, r.status) for r in unpacked.sentence_results]
+    assert [(r.sentence_id, r.status) for r in packed_sync.sentence_results] == expected
+    assert [(r.sentence_id, r.status) for r in packed_async.sentence_results] == expected
+    assert ["sent_000", "sent_001", "sent_002", "sent_003"] in \
+        stub_pipeline.selection_agent.packed_windows
+
+
+REPEATED = "Paris is in France. Berlin is in Germany. Paris is in France. Paris is in France."
+
+
+@pytest.mark.parametrize("scheduler", ["depth_first", "wavefront", "sync"])
+def test_identical_sentences_are_processed_once(stub_pipeline, scheduler):
+    """Repeated sentences with the same context share one result."""
+    stub_pipeline.sentence_splitter.context_sentences_before = 0
+    stub_pipeline.sentence_splitter.context_sentences_after = 0
+    if scheduler == "sync":
+        result = stub_pipeline.extract_claims(REPEATED)
+    else:
+        stub_pipeline.scheduler = scheduler
+        result = asyncio.run(stub_pipeline.aextract_claims(REPEATED))
+
+    assert stub_pipeline.selection_agent.calls.count("Paris is in France.") == 1
+    assert [r.sentence_id for r in result.sentence_results] == [f"sent_{i:03d}" for i in range(4)]
+    assert [[c.source_sentence_id for c in r.claims] for r in result.sentence_results] == \
+        [[f"sent_{i:03d}"] for i in range(4)]
+    assert [r.metadata.get("deduplicated", False) for r in result.sentence_results] == \
+        [False, False, True, True]
+    assert result.statistics["deduplication"] == {
+        "duplicate_sentences": 2, "llm_calls_saved": 6}
+
+
+def test_wavefront_packs_windows_by_document_position(stub_pipeline):
+    """Deduplicated sentences keep their place in the wavefront packing windows."""
+    stub_pipeline.sentence_splitter.context_sentences_before = 0
+    stub_pipeline.sentence_splitter.context_sentences_after = 0
+    stub_pipeline.scheduler = "wavefront"
+    stub_pipeline.selection_pack_size = 2
+    text = ("Paris is in France. Berlin is in Germany. Paris is in France. "
+            "Rome is in Italy. Madrid is in Spain.")
+
+    result = asyncio.run(stub_pipeline.aextract_claims(text))
+
+    # sent_002 repeats sent_000, so sent_003 and sent_004 sit in windows of
+    # their own instead of being packed together
+    assert stub_pipeline.selection_agent.packed_windows == [["sent_000", "sent_001"]]
+    assert stub_pipeline.selection_agent.calls.count("Paris is in France.") == 1
+    assert [r.sentence_id for r in result.sentence_results] == \
+        [f"sent_{i:03d}" for i in range(5)]
+    assert all(r.claims for r in result.sentence_results)
+
+
+def test_dedup_scope_is_shared_across_documents(stub_pipeline):
+    """Concurrent calls with one dedup_scope process each work item once."""
+    scope = {}
+
+    async def scenario():
+        return await asyncio.gather(*(
+            stub_pipeline.aextract_claims(TEXT, dedup_scope=scope) for _ in range(3)))
+
+    results = asyncio.run(scenario())
+
+    assert len(stub_pipeline.selection_agent.calls) == 6
+    assert [[c.text for c in r.claims] for r in results[2].sentence_results] == \
+        [[c.text for c in r.claims] for r in results[0].sentence_results]
+    assert sum(r.statistics["deduplication"]["duplicate_sentences"] for r in results) == 12
+
+
+LONG = " ".join(f"City {i} has {i + 2} parks." for i in range(10))
+
+
+@pytest.mark.parametrize("scheduler", ["depth_first", "wavefront", "sync"])
+def test_reextraction_reuses_unchanged_sentences(stub_pipeline, scheduler):
+    """Only the edited sentence and those whose context it is are processed again."""
+    previous = stub_pipeline.extract_claims(LONG)
+    stub_pipeline.selection_agent.calls.clear()
+    edited = LONG.replace("City 5 has 7 parks.", "City 5 has 8 parks.")
+
+    if scheduler == "sync":
+        result = stub_pipeline.extract_claims(edited, previous=previous)
+    else:
+        stub_pipeline.scheduler = scheduler
+        result = asyncio.run(stub_pipeline.aextract_claims(edited, previous=previous))
+
+    assert sorted(stub_pipeline.selection_agent.calls) == [
+        f"City {i} has {i + 2 + (i == 5)} parks." for i in range(3, 8)]
+    assert [bool(r.metadata.get("reused")) for r in result.sentence_results] == \
+        [i not in range(3, 8) for i in range(10)]
+    assert result.sentence_results[9].claims[0].source_sentence_id == "sent_009"
+    assert result.statistics["incremental"] == {
+        "reused": 5, "recomputed": 5, "llm_calls_saved": 15}
+
+
+def test_reextraction_rejects_mismatched_previous(stub_pipeline):
+    previous = stub_pipeline.extract_claims(LONG)
+    previous.sentence_results.pop()
+
+    with pytest.raises(ValueError, match="sentence splitting"):
+        stub_pipeline.extract_claims(LONG, previous=previous)
+
+
+def test_streamed_input_bounds_the_dedup_map(stub_pipeline, monkeypatch):
+    """Deduplication of streamed input only remembers recent work items."""
+    from claimification.claim_extraction import pipeline as pipeline_module
+
+    monkeypatch.setattr(pipeline_module, "STREAM_DEDUP_ITEMS", 4)
+    sizes = []
+    process_shared = stub_pipeline._aprocess_shared
+
+    async def record(sentence, shared, *args):
+        result = await process_shared(sentence, shared, *args)
+        sizes.append(len(shared))
+        return result
+
+    monkeypatch.setattr(stub_pipeline, "_aprocess_shared", record)
+    stub_pipeline.sentence_splitter.context_sentences_before = 0
+    stub_pipeline.sentence_splitter.context_sentences_after = 0
+    result = stub_pipeline.extract_claims_from(
+        [f"City {i} has {i + 2} parks. " for i in range(40)] + ["City 39 has 41 parks."])
+
+    assert len(result.sentence_results) == 41
+    assert max(sizes) <= 4 + stub_pipeline.max_concurrency
+    # A recent repeat is still deduplicated
+    assert result.sentence_results[-1].metadata["deduplicated"]
+
+
+def test_extract_claims_from_streamed_input(stub_pipeline):
+    """Streamed input starts LLM work before it is read completely."""
+    agent = stub_pipeline.selection_agent
+    calls_before_last_piece = []
+
+    def pieces():
+        sentences = [f"City {i} has {i + 2} parks. " for i in range(12)]
+        for i, sentence in enumerate(sentences):
+            if i == len(sentences) - 1:
+                calls_before_last_piece.append(len(agent.calls))
+            yield sentence
+
+    result = stub_pipeline.extract_claims_from(pieces())
+    expected = stub_pipeline.extract_claims("".join(pieces()))
+
+    assert calls_before_last_piece[0] > 0
+    # Streamed input is never held in full
+    assert result.text == ""
+    assert [(r.sentence_id, [c.text for c in r.claims], untimed(r.metadata))
+            for r in result.sentence_results] == \
+        [(r.sentence_id, [c.text for c in r.claims], untimed(r.metadata))
+         for r in expected.sentence_results]
@@ -0,0 +1,154 @@
+"""Test the persistent LLM response cache."""
+
+import asyncio
+import sqlite3
+import time
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from claimification.claim_extraction.models import DecompositionResult, SelectionResult
+from claimification.claim_extraction.stages import SelectionAgent
+from claimification.utils.cache import (
+    ResponseCache,
+    cache_key,
+    configure_response_cache,
+    reset_response_cache
+)
+
+
+@pytest.fixture
+def response_cache(tmp_path):
+    cache = configure_response_cache(tmp_path / "responses.sqlite")
+    yield cache
+    reset_response_cache()
+
+
+def test_cache_key_depends_on_every_input():
+    base = ("openai", "gpt-5-nano", 0.0, [("system", "S"), ("human", "U")], SelectionResult)
+    variants = [
+        ("anthropic",) + base[1:],
+        base[:2] + (0.5,) + base[3:],
+        base[:3] + ([("system", "S2"), ("human", "U")],) + base[4:],
+        base[:4] + (DecompositionResult,),
+    ]
+
+    assert cache_key(*base) == cache_key(*base)
+    assert len({cache_key(*base)} | {cache_key(*variant) for variant in variants}) == 5
+
+
+def test_round_trip_with_compression(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite", compress=True)
+    cache.set("k", {"claims": ["A."] * 50})
+
+    assert cache.get("k") == {"claims": ["A."] * 50}
+    assert cache.get("missing") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    assert 0 < stats["bytes_written"] < len('{"claims": ' + '"A.", ' * 50)
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite", ttl_seconds=60)
+    cache.set("k", {"v": 1})
+    cache._conn.execute("UPDATE responses SET created_at = ?", (time.time() - 61,))
+
+    assert cache.get("k") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_size_limit_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite", max_bytes=100)
+    for i in range(5):
+        cache.set(f"k{i}", {"v": "x" * 20})
+        cache._conn.execute(
+            "UPDATE responses SET accessed_at = ? WHERE key = ?", (i, f"k{i}"))
+
+    assert cache.evict() > 0
+    assert cache.stats()["size_bytes"] <= 90
+    assert cache.get("k4") is not None
+    assert cache.get("k0") is None
+
+
+def test_entries_are_shared_between_connections(tmp_path):
+    """A second process opening the same file sees the first one's entries."""
+    path = tmp_path / "cache.sqlite"
+    ResponseCache(path).set("k", {"v": 1})
+
+    assert ResponseCache(path).get("k") == {"v": 1}
+    assert sqlite3.connect(str(path)).execute(
+        "PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+@pytest.fixture
+def counting_agent(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    agent = SelectionAgent()
+    agent.calls = 0
+
+    def respond(prompt_value):
+        agent.calls += 1
+        return {"has_verifiable_content": True, "reason": "llm"}
+
+    agent.structured_llm = RunnableLambda(respond)
+    return agent
+
+
+def test_agent_reuses_cached_responses(response_cache, counting_agent):
+    first = counting_agent.process("Paris is in France.", "")
+    second = asyncio.run(counting_agent.aprocess("Paris is in France.", ""))
+    batch = counting_agent.process_batch([("Paris is in France.", ""), ("Other.", "")])
+
+    assert counting_agent.calls == 2
+    assert second.data == first.data
+    assert second.metadata == {"cache_hit": True}
+    assert [r.success for r in batch] == [True, True]
+    assert response_cache.stats()["hits"] == 2
+
+
+def test_entity_stage_reuses_cached_responses(response_cache, stub_entity_pipeline):
+    text = "Paris is the capital of France."
+    stub_entity_pipeline.extract_knowledge_graph(text)
+    calls = len(stub_entity_pipeline.calls)
+    graph = asyncio.run(stub_entity_pipeline.aextract_knowledge_graph(text))
+
+    assert len(stub_entity_pipeline.calls) == calls
+    assert [e.text for e in graph.entities] == ["Paris", "France"]
+
+
+def test_normalized_tier_matches_cosmetic_variants(response_cache, counting_agent):
+    counting_agent.normalized_cache = "sentence"
+
+    counting_agent.process("The “Eiffel” Tower is 330 m tall [1].", "Before: Paris.")
+    hit = counting_agent.process('The "Eiffel"  Tower is 330 m tall.', "Before: France.")
+    batch = counting_agent.process_batch([("the eiffel tower is 330 m tall.", "")])
+
+    assert counting_agent.calls == 2
+    assert hit.metadata == {"cache_hit": True, "cache_tier": "normalized"}
+    assert batch[0].metadata.get("cache_tier") is None
+    assert counting_agent.normalized_cache_stats()["hits"] == 1
+
+
+def test_normalized_tier_can_include_context(response_cache, counting_agent):
+    counting_agent.normalized_cache = "sentence_and_context"
+
+    counting_agent.process("Revenue grew 5%.", "Before: Apple.")
+    counting_agent.process("Revenue grew 5%.", "Before: Google.")
+    counting_agent.process("Revenue  grew 5%.", "Before:  apple.")
+
+    assert counting_agent.calls == 2
+    stats = counting_agent.normalized_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 2, 0.3333)
+
+
+def test_audited_hits_measure_agreement(response_cache, counting_agent):
+    counting_agent.normalized_cache = "sentence"
+    counting_agent.audit_rate = 1.0
+
+    counting_agent.process("Paris is in France.", "A")
+    audited = asyncio.run(counting_agent.aprocess("Paris is in France.", "B"))
+
+    assert counting_agent.calls == 2
+    assert audited.data.reason == "llm"
+    stats = counting_agent.normalized_cache_stats()
+    assert (stats["audits"], stats["agreement_rate"]) == (1, 1.0)
@@ -0,0 +1,82 @@
+"""Test checkpointing and resuming claim extraction runs."""
+
+import asyncio
+
+import pytest
+
+from claimification.claim_extraction import CheckpointJournal
+from claimification.claim_extraction.stages.prefilter import SentencePrefilter
+
+
+TEXT = " ".join(f"City {i} has {i + 2} parks." for i in range(6))
+
+
+class Interrupted(Exception):
+    pass
+
+
+def interrupt_after(count):
+    def callback(result, completed, total):
+        if completed == count:
+            raise Interrupted()
+    return callback
+
+
+def test_resume_skips_finished_sentences(tmp_path, stub_pipeline):
+    """A resumed run only processes sentences missing from the journal."""
+    path = tmp_path / "run.jsonl"
+    with pytest.raises(Interrupted):
+        stub_pipeline.extract_claims(
+            TEXT, checkpoint=CheckpointJournal(path), progress_callback=interrupt_after(4))
+    stub_pipeline.selection_agent.calls.clear()
+
+    journal = CheckpointJournal(path, resume=True)
+    result = asyncio.run(stub_pipeline.aextract_claims(TEXT, checkpoint=journal))
+
+    assert sorted(stub_pipeline.selection_agent.calls) == [
+        f"City {i} has {i + 2} parks." for i in (4, 5)]
+    assert [c.text for c in result.get_all_claims()] == [
+        f"City {i} has {i + 2} parks." for i in range(6)]
+    assert result.statistics["checkpoint"]["resumed"] == 4
+    assert result.statistics["checkpoint"]["recorded"] == 2
+    assert len(path.read_text().splitlines()) == 7
+
+
+def test_resume_ignores_partial_last_line(tmp_path, stub_pipeline):
+    path = tmp_path / "run.jsonl"
+    with pytest.raises(Interrupted):
+        stub_pipeline.extract_claims(
+            TEXT, checkpoint=CheckpointJournal(path), progress_callback=interrupt_after(2))
+    with path.open("a") as f:
+        f.write('{"type": "result", "result": {"source_')
+
+    result = stub_pipeline.extract_claims(TEXT, checkpoint=CheckpointJournal(path, resume=True))
+
+    assert result.statistics["checkpoint"]["resumed"] == 2
+    assert len(result.get_all_claims()) == 6
+    resumed = CheckpointJournal(path, resume=True)
+    resumed.start(TEXT, None, stub_pipeline._checkpoint_settings())
+    assert resumed.resumed == 6
+
+
+def test_resume_rejects_different_input(tmp_path, stub_pipeline):
+    path = tmp_path / "run.jsonl"
+    stub_pipeline.extract_claims(TEXT, checkpoint=CheckpointJournal(path))
+
+    with pytest.raises(ValueError, match="different input"):
+        stub_pipeline.extract_claims(
+            TEXT + " Paris is in France.", checkpoint=CheckpointJournal(path, resume=True))
+
+
+@pytest.mark.parametrize("change", [
+    lambda pipeline: setattr(pipeline, "prefilter", SentencePrefilter("lenient")),
+    lambda pipeline: setattr(pipeline.sentence_splitter, "include_headers", False),
+    lambda pipeline: setattr(pipeline.sentence_splitter, "include_question", True),
+])
+def test_resume_rejects_different_settings(tmp_path, stub_pipeline, change):
+    path = tmp_path / "run.jsonl"
+    stub_pipeline.extract_claims(TEXT, checkpoint=CheckpointJournal(path))
+
+    change(stub_pipeline)
+    with pytest.raises(ValueError, match="different settings"):
+        stub_pipeline.extract_claims(TEXT, checkpoint=CheckpointJournal(path, resume=True))
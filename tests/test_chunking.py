@@ -0,0 +1,102 @@
+"""Test sentence-aligned chunking and merging of chunk results."""
+
+from claimification.claim_extraction.stages.sentence_splitter import SentenceSplitter
+from claimification.entity_mapping.models import Entity, GraphMetadata, KnowledgeGraph, Relationship
+from claimification.entity_mapping.utils import merge_knowledge_graphs
+from claimification.utils.chunking import iter_text_file, plan_chunks, sentence_spans
+
+
+TEXT = " ".join(f"Sentence number {i} is here." for i in range(20))
+
+
+def test_chunks_are_sentence_aligned_and_cover_the_text():
+    chunks = plan_chunks(TEXT, max_chars=100, overlap_chars=60)
+
+    assert len(chunks) > 1
+    assert all(chunk.char_end - chunk.char_start <= 100 for chunk in chunks)
+    assert " ".join(chunk.text(TEXT) for chunk in chunks) == TEXT
+    assert all(chunk.text(TEXT).startswith("Sentence") for chunk in chunks)
+    assert chunks[0].overlap(TEXT) == ""
+    # Overlap is the whole sentences just before the chunk
+    assert chunks[1].overlap(TEXT) == TEXT[chunks[1].overlap_start:chunks[0].char_end]
+    assert chunks[1].overlap(TEXT).endswith("is here.")
+    assert len(chunks[1].overlap(TEXT)) <= 60
+
+
+def test_overlong_sentence_is_cut_at_whitespace():
+    text = "word " * 50 + "end."
+    chunks = plan_chunks(text, max_chars=40)
+
+    assert all(chunk.char_end - chunk.char_start <= 40 for chunk in chunks)
+    assert " ".join(chunk.text(text) for chunk in chunks) == text.strip()
+
+
+def test_sentence_spans_match_splitter_offsets():
+    text = "# Title\n\nParis is in France.  Berlin is in Germany!\n\nTokyo is in Japan."
+    sentences = SentenceSplitter().split_and_create_context(text)
+
+    for sentence in sentences:
+        start, end = sentence.metadata["char_start"], sentence.metadata["char_end"]
+        assert " ".join(text[start:end].split()) == " ".join(sentence.text.split())
+    assert [sentence.metadata["paragraph"] for sentence in sentences] == [0, 1, 2]
+    assert sentence_spans("A b. C d.") == [(0, 4), (5, 9)]
+
+
+def graph(entities, relationships):
+    return KnowledgeGraph(
+        entities=[Entity(id=id, text=text, type="LOCATION", mentions=[text])
+                  for id, text in entities],
+        relationships=relationships,
+        metadata=GraphMetadata(model_used="stub", total_entities=0, total_relationships=0,
+                               explicit_relationships=0, inferred_relationships=0)
+    )
+
+
+def test_iter_split_matches_whole_text_splitting():
+    """Streamed splitting gives the same sentences wherever the pieces are cut."""
+    text = (
+        "Intro line here. Second one!\n\nThird paragraph starts. "
+        "It has Dr. Smith. Is it? Yes.\n\n  Fourth   para.\nLast line here"
+    )
+    splitter = SentenceSplitter(context_sentences_before=2, context_sentences_after=1)
+    expected = [(s.sentence_id, s.text, s.context, s.metadata)
+                for s in splitter.split_and_create_context(text, "Why?")]
+
+    for size in (1, 3, 7, 1000):
+        pieces = [text[i:i + size] for i in range(0, len(text), size)]
+        assert [(s.sentence_id, s.text, s.context, s.metadata)
+                for s in splitter.iter_split(pieces, "Why?")] == expected
+
+
+def test_iter_text_file_decodes_across_piece_boundaries(tmp_path):
+    path = tmp_path / "text.md"
+    path.write_text("Zürich – café. " * 20, encoding="utf-8")
+    (tmp_path / "empty.md").write_text("")
+
+    assert "".join(iter_text_file(path, read_bytes=5)) == "Zürich – café. " * 20
+    assert list(iter_text_file(tmp_path / "empty.md")) == []
+
+
+def test_merge_renumbers_entities_and_remaps_relationships():
+    first = graph([("e1", "Paris"), ("e2", "France")], [
+        Relationship(source_entity_id="e1", target_entity_id="e2",
+                     relationship_type="located_in", evidence="Paris is in France."),
+    ])
+    second = graph([("e1", "Berlin"), ("e2", "paris"), ("e3", "France")], [
+        Relationship(source_entity_id="e2", target_entity_id="e3",
+                     relationship_type="located_in", evidence="again", is_inferred=True,
+                     confidence=0.8, reasoning="stub"),
+        Relationship(source_entity_id="e1", target_entity_id="e3",
+                     relationship_type="near", evidence="stub", is_inferred=True,
+                     confidence=0.9, reasoning="stub"),
+    ])
+
+    merged = merge_knowledge_graphs([first, second], "stub")
+
+    assert [(e.id, e.text) for e in merged.entities] == [
+        ("e1", "Paris"), ("e2", "France"), ("e3", "Berlin")]
+    assert merged.entities[0].mentions == ["Paris", "paris"]
+    assert [(r.source_entity_id, r.target_entity_id, r.is_inferred)
+            for r in merged.relationships] == [("e1", "e2", False), ("e3", "e2", True)]
+    assert (merged.metadata.total_entities, merged.metadata.explicit_relationships,
+            merged.metadata.inferred_relationships) == (3, 1, 1)
@@ -0,0 +1,80 @@
+"""Test corpus batch processing."""
+
+import asyncio
+import gzip
+import io
+import json
+
+from claimification.claim_extraction.corpus import (
+    completed_ids,
+    count_documents,
+    iter_documents,
+    run_corpus
+)
+
+
+def test_iter_documents_from_directory_glob_and_jsonl(tmp_path):
+    (tmp_path / "docs" / "sub").mkdir(parents=True)
+    (tmp_path / "docs" / "a.txt").write_text("Paris is in France.")
+    (tmp_path / "docs" / "sub" / "b.md").write_text("Berlin is in Germany.")
+    corpus = tmp_path / "corpus.jsonl.gz"
+    with gzip.open(corpus, "wt", encoding="utf-8") as f:
+        f.write(json.dumps({"doc": "x1", "body": "Tokyo is in Japan."}) + "\n\n")
+        f.write(json.dumps({"body": "Rome is in Italy.", "question": "Where?"}) + "\n")
+
+    assert [(d.id, d.text) for d in iter_documents(str(tmp_path / "docs"))] == [
+        ("a.txt", "Paris is in France."), ("sub/b.md", "Berlin is in Germany.")]
+    assert count_documents(str(tmp_path / "docs" / "**" / "*.md")) == 1
+    assert count_documents(str(corpus)) is None
+    assert [(d.id, d.text, d.question)
+            for d in iter_documents(str(corpus), text_field="body", id_field="doc")] == [
+        ("x1", "Tokyo is in Japan.", None), ("3", "Rome is in Italy.", "Where?")]
+
+
+def test_run_corpus_writes_records_and_skips_finished(tmp_path, stub_pipeline):
+    from claimification.claim_extraction.corpus import Document
+
+    documents = [
+        Document("a", "Paris is in France. Is it sunny?"),
+        Document("b", "Berlin is in Germany."),
+        Document("c", "   "),
+    ]
+    output = io.StringIO()
+    seen = []
+    summary = asyncio.run(run_corpus(
+        stub_pipeline, iter(documents), output, per_sentence=True, skip={"b"},
+        on_document=lambda record, completed: seen.append(completed)))
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+
+    assert [(r["id"], r["status"]) for r in records if r["id"] == "a"] == [
+        ("a", "extracted"), ("a", "no_verifiable_claims")]
+    # A document without sentences is still recorded, so a resume skips it
+    assert [r["claims"] for r in records if r["id"] == "c"] == [[]]
+    assert sorted(seen) == [1, 2, 3]
+    assert (summary["documents"], summary["succeeded"], summary["skipped"]) == (2, 2, 1)
+    assert summary["claims"] == 1
+
+    path = tmp_path / "out.jsonl"
+    path.write_text(
+        '{"id": "a", "claims": []}\n{"id": "c", "error": "boom"}\n'
+        '{"id": "e", "error": "boom"}\n{"id": "e", "claims": []}\n{"id": "d", "cla')
+    assert completed_ids(path) == {"a", "e"}
+
+
+def test_unreadable_documents_get_error_records(tmp_path, stub_pipeline):
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "a.txt").write_bytes(b"caf\xe9 is open.")
+    (tmp_path / "docs" / "b.txt").write_text("Berlin is in Germany.")
+    corpus = tmp_path / "corpus.jsonl"
+    corpus.write_bytes(
+        b'{"text": "Paris is in France."}\n{"text": \n["list"]\n'
+        b'{"text": "caf\xe9"}\n{"text": "Rome is in Italy."}\n')
+
+    for source, failed in ((tmp_path / "docs", ["a.txt"]), (corpus, ["2", "3", "4"])):
+        output = io.StringIO()
+        summary = asyncio.run(run_corpus(stub_pipeline, iter_documents(str(source)), output))
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+
+        assert sorted(r["id"] for r in records if "error" in r) == failed
+        assert (summary["failed"], summary["succeeded"]) == \
+            (len(failed), len(records) - len(failed))
@@ -0,0 +1,46 @@
+"""Test the entity mapping pipeline without a real LLM."""
+
+import asyncio
+
+
+TEXT = "Paris is the capital of France. Berlin is the capital of Germany."
+
+
+def test_async_path_matches_sync_path(stub_entity_pipeline):
+    sync_graph = stub_entity_pipeline.extract_knowledge_graph(TEXT)
+    async_graph = asyncio.run(stub_entity_pipeline.aextract_knowledge_graph(TEXT))
+
+    assert [e.text for e in async_graph.entities] == [e.text for e in sync_graph.entities]
+    assert [e.text for e in sync_graph.entities] == ["Paris", "France", "Berlin", "Germany"]
+    assert async_graph.metadata.total_entities == 4
+    assert stub_entity_pipeline.calls.count("EntityExtractionOutput") == 2
+
+
+def test_progress_callback_reports_each_stage(stub_entity_pipeline):
+    reports = []
+
+    asyncio.run(stub_entity_pipeline.aextract_knowledge_graph(
+        TEXT, progress_callback=lambda *report: reports.append(report)))
+
+    assert reports == [
+        ("entity_extraction", 1, 3),
+        ("relationship_extraction", 2, 3),
+        ("relationship_inference", 3, 3),
+    ]
+
+
+def test_long_text_is_chunked_and_merged(stub_entity_pipeline):
+    """Each chunk is extracted separately and entities are merged across chunks."""
+    stub_entity_pipeline.max_chunk_chars = 40
+    text = ("Paris is in France. Berlin is in Germany. "
+            "Tokyo is in Japan. Paris is lovely in spring.")
+    reports = []
+
+    graph = asyncio.run(stub_entity_pipeline.aextract_knowledge_graph(
+        text, progress_callback=lambda *report: reports.append(report)))
+
+    assert [(e.id, e.text) for e in graph.entities] == [
+        ("e1", "Paris"), ("e2", "France"), ("e3", "Berlin"),
+        ("e4", "Germany"), ("e5", "Tokyo"), ("e6", "Japan")]
+    assert reports[-1] == ("chunk", 3, 3)
+    assert stub_entity_pipeline.calls.count("EntityExtractionOutput") == 3
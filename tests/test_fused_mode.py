@@ -0,0 +1,69 @@
+"""Test the fused single-call extraction mode."""
+
+import asyncio
+
+import pytest
+
+from claimification.claim_extraction.models import (
+    FusedExtractionResult,
+    SentenceStatus,
+)
+from tests.conftest import (
+    StubAgent,
+    default_selection,
+    default_disambiguation,
+    default_decomposition,
+)
+
+
+TEXT = "Paris is the capital of France. Is it sunny today? Berlin is large."
+
+
+def fused_response(sentence, context):
+    selection = default_selection(sentence, context)
+    if not selection.has_verifiable_content:
+        return FusedExtractionResult(selection=selection)
+    if "Berlin" in sentence:
+        # Model forgot the decomposition step
+        return FusedExtractionResult(
+            selection=selection,
+            disambiguation=default_disambiguation(sentence, context)
+        )
+    return FusedExtractionResult(
+        selection=selection,
+        disambiguation=default_disambiguation(sentence, context),
+        decomposition=default_decomposition(sentence, context)
+    )
+
+
+def test_fused_mode_matches_staged_statuses(stub_pipeline):
+    """Fused results map onto the same statuses and metadata as staged ones."""
+    staged = stub_pipeline.extract_claims(TEXT)
+
+    stub_pipeline.mode = "fused"
+    stub_pipeline.fused_agent = StubAgent(fused_response)
+    fused = stub_pipeline.extract_claims(TEXT)
+    fused_async = asyncio.run(stub_pipeline.aextract_claims(TEXT))
+
+    for result in (fused, fused_async):
+        first, second, third = result.sentence_results
+        for fused_result, staged_result in zip((first, second), staged.sentence_results):
+            assert fused_result.status == staged_result.status
+            # Timing and usage differ by design: one fused call instead of three stages
+            assert {k: v for k, v in fused_result.metadata.items()
+                    if k not in ("timing", "usage")} == \
+                {k: v for k, v in staged_result.metadata.items()
+                 if k not in ("timing", "usage")}
+        assert third.status == SentenceStatus.PROCESSING_ERROR
+        assert "missing decomposition" in third.metadata["error"]
+    assert stub_pipeline.fused_agent.calls == [s.source_sentence for s in fused.sentence_results] * 2
+    assert fused.statistics["mode"] == "fused"
+
+
+def test_fused_mode_rejects_wavefront(monkeypatch):
+    """Fused mode cannot be combined with the wavefront scheduler."""
+    from claimification.claim_extraction.pipeline import ClaimExtractionPipeline
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    with pytest.raises(ValueError, match="Fused mode"):
+        ClaimExtractionPipeline(verbose=False, mode="fused", scheduler="wavefront")
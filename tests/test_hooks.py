@@ -0,0 +1,209 @@
+"""Test the tracing hooks and their built-in sinks."""
+
+import asyncio
+import io
+import json
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from claimification.claim_extraction.models import SelectionResult
+from claimification.claim_extraction.stages import SelectionAgent
+from claimification.utils.cache import configure_response_cache, reset_response_cache
+from claimification.utils.hooks import (
+    NULL_SPAN,
+    HookEvent,
+    JsonlEventLog,
+    OpenTelemetryHooks,
+    PipelineHooks,
+    configure_hooks,
+    emit,
+    get_hooks,
+    reset_hooks,
+    start_span
+)
+from claimification.utils.retry import RetryPolicy
+
+
+class Recorder(PipelineHooks):
+    def __init__(self):
+        self.events = []
+
+    def on_event(self, event: HookEvent) -> None:
+        self.events.append(event)
+
+    def named(self, name):
+        return [event for event in self.events if event.name == name]
+
+
+@pytest.fixture
+def recorder():
+    recorder = Recorder()
+    configure_hooks(recorder)
+    yield recorder
+    reset_hooks()
+
+
+def fake_selection_llm(*contents):
+    """A structured LLM stand-in answering with the given message contents in turn."""
+    messages = [
+        AIMessage(
+            content=content,
+            usage_metadata={"input_tokens": 50, "output_tokens": 10, "total_tokens": 60},
+            response_metadata={"model_name": "gpt-5-nano"}
+        )
+        for content in contents
+    ]
+    model = FakeMessagesListChatModel(responses=messages)
+    return model | RunnableLambda(
+        lambda response: SelectionResult(**json.loads(response.content)))
+
+
+def test_no_hooks_means_null_spans(monkeypatch):
+    monkeypatch.delenv("CLAIMIFICATION_EVENT_LOG", raising=False)
+    reset_hooks()
+
+    assert get_hooks() == ()
+    assert start_span("stage", stage="selection") is NULL_SPAN
+
+
+def test_pipeline_reports_run_and_stage_spans(stub_pipeline, recorder):
+    for run in (lambda text: stub_pipeline.extract_claims(text),
+                lambda text: asyncio.run(stub_pipeline.aextract_claims(text))):
+        recorder.events.clear()
+        run("Paris is in France. Is it sunny today?")
+
+        run_start, run_end = recorder.events[0], recorder.events[-1]
+        assert (run_start.name, run_end.name) == ("run_start", "run_end")
+        assert run_end.attributes["sentences"] == 2
+        assert run_end.attributes["claims"] == 1
+
+        ends = recorder.named("stage_end")
+        # The question stops after Selection
+        assert [e.attributes["stage"] for e in ends
+                if e.attributes["sentence_id"] == "sent_001"] == ["selection"]
+        assert {e.parent_id for e in ends} == {run_start.span_id}
+        assert all(e.attributes["pipeline"] == "claim_extraction" for e in ends)
+        assert all(e.attributes["success"] and e.attributes["duration_seconds"] >= 0
+                   for e in ends)
+        assert len(recorder.named("stage_start")) == len(ends) == 4
+
+
+def test_agent_reports_requests_retries_and_cache_lookups(monkeypatch, recorder, tmp_path):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    configure_response_cache(tmp_path / "responses.sqlite")
+    agent = SelectionAgent()
+    agent.retry_policy = RetryPolicy(max_attempts=2, schema_retries=1)
+    agent.structured_llm = fake_selection_llm(
+        "not json", '{"has_verifiable_content": true, "reason": "ok"}')
+
+    try:
+        with start_span("stage", stage="selection", sentence_id="sent_0"):
+            agent.process("Paris is in France.", "")
+            agent.process("Paris is in France.", "")
+    finally:
+        reset_response_cache()
+
+    names = [e.name for e in recorder.events if e.name != "stage_start"]
+    assert names == [
+        "cache_miss", "llm_request", "llm_response", "retry",
+        "llm_request", "llm_response", "cache_hit", "stage_end",
+    ]
+    requests = recorder.named("llm_request")
+    assert [e.attributes["attempt"] for e in requests] == [1, 2]
+    assert requests[0].attributes["sentence_id"] == "sent_0"
+    failed, succeeded = recorder.named("llm_response")
+    assert failed.attributes["success"] is False
+    assert succeeded.attributes["input_tokens"] == 50
+    assert recorder.named("retry")[0].attributes["error_kind"] == "schema"
+
+
+def test_entity_pipeline_reports_stage_spans(stub_entity_pipeline, recorder):
+    stub_entity_pipeline.extract_knowledge_graph("Paris is the capital of France.")
+
+    ends = recorder.named("stage_end")
+    assert [e.attributes["stage"] for e in ends] == [
+        "entity_extraction", "relationship_extraction", "relationship_inference"]
+    run_end = recorder.events[-1]
+    assert run_end.name == "run_end"
+    assert run_end.attributes["pipeline"] == "entity_mapping"
+    assert run_end.attributes["entities"] == 2
+
+
+def test_jsonl_event_log(monkeypatch, tmp_path):
+    stream = io.StringIO()
+    configure_hooks(JsonlEventLog(stream))
+    try:
+        with start_span("run", pipeline="claim_extraction"):
+            with start_span("stage", stage="selection", sentence_id="sent_0"):
+                pass
+    finally:
+        reset_hooks()
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [r["event"] for r in records] == ["run_start", "stage_start", "stage_end", "run_end"]
+    assert records[2]["parent_id"] == records[0]["span_id"]
+    assert records[2]["attributes"]["pipeline"] == "claim_extraction"
+
+    # The environment variable enables a log without configuration
+    path = tmp_path / "events.jsonl"
+    monkeypatch.setenv("CLAIMIFICATION_EVENT_LOG", str(path))
+    try:
+        with start_span("run"):
+            pass
+    finally:
+        reset_hooks()
+    assert len(path.read_text().splitlines()) == 2
+
+
+def test_opentelemetry_hooks_nest_spans():
+    trace = pytest.importorskip("opentelemetry.trace")
+
+    class FakeSpan(trace.NonRecordingSpan):
+        def __init__(self, name, parent, attributes):
+            super().__init__(trace.INVALID_SPAN_CONTEXT)
+            self.name, self.parent, self.attributes = name, parent, dict(attributes)
+            self.events, self.status, self.ended = [], None, False
+
+        def set_attributes(self, attributes):
+            self.attributes.update(attributes)
+
+        def set_status(self, status):
+            self.status = status
+
+        def add_event(self, name, attributes=None, timestamp=None):
+            self.events.append(name)
+
+        def end(self, end_time=None):
+            self.ended = True
+
+    class FakeTracer:
+        def __init__(self):
+            self.spans = []
+
+        def start_span(self, name, context=None, attributes=None, start_time=None):
+            parent = trace.get_current_span(context) if context is not None else None
+            span = FakeSpan(name, parent, attributes or {})
+            self.spans.append(span)
+            return span
+
+    tracer = FakeTracer()
+    configure_hooks(OpenTelemetryHooks(tracer))
+    try:
+        with start_span("run", pipeline="claim_extraction"):
+            with start_span("stage", stage="selection", model="gpt-5-nano") as span:
+                span.set_attributes(success=False, error="Selection failed", input_tokens=7)
+                emit("cache_miss", tier="exact")
+    finally:
+        reset_hooks()
+
+    run, stage = tracer.spans
+    assert (run.name, stage.name) == ("claimification.run", "claimification.stage.selection")
+    assert stage.parent is run and run.parent is None
+    assert stage.attributes["gen_ai.request.model"] == "gpt-5-nano"
+    assert stage.attributes["gen_ai.usage.input_tokens"] == 7
+    assert stage.events == ["cache_miss"]
+    assert stage.status.status_code == trace.StatusCode.ERROR
+    assert run.ended and stage.ended
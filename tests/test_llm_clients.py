@@ -0,0 +1,62 @@
+"""Test the shared LLM client registry."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from claimification.claim_extraction import ClaimExtractionPipeline
+from claimification.utils.llm_clients import (
+    _LoopLocalAsyncTransport,
+    client_pool_stats,
+    get_chat_model,
+    reset_clients
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_registry(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    reset_clients()
+    yield
+    reset_clients()
+
+
+def test_same_configuration_shares_one_client():
+    first = get_chat_model("gpt-4o-mini", 0.0, 1000)
+
+    assert get_chat_model("gpt-4o-mini", 0.0, 1000) is first
+    assert get_chat_model("gpt-4o-mini", 0.5, 1000) is not first
+    assert get_chat_model("claude-3-5-sonnet-20241022", 0.0, 1000) is not first
+
+
+def test_unsupported_model_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported model"):
+        get_chat_model("llama-3")
+
+
+def test_pipelines_share_clients_and_pool():
+    """A second pipeline reuses the first one's clients."""
+    first = ClaimExtractionPipeline(model="gpt-4o-mini", verbose=False)
+    second = ClaimExtractionPipeline(model="gpt-4o-mini", verbose=False)
+
+    assert first.selection_agent.llm is second.selection_agent.llm
+    assert first.selection_agent.llm.http_client is first.decomposition_agent.llm.http_client
+
+    stats = client_pool_stats()
+    assert stats["cache_hits"] >= 3
+    assert stats["pools"]["openai"]["sync"]["connections"] == 0
+
+
+def test_async_pool_is_per_event_loop():
+    """Each event loop gets its own pool, so asyncio.run can be called repeatedly."""
+    transport = _LoopLocalAsyncTransport(
+        lambda: httpx.MockTransport(lambda request: httpx.Response(200, text="ok")))
+    client = httpx.AsyncClient(transport=transport)
+
+    async def fetch():
+        return (await client.get("https://example.test/")).text
+
+    assert asyncio.run(fetch()) == "ok"
+    assert asyncio.run(fetch()) == "ok"
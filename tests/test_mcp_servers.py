@@ -0,0 +1,173 @@
+"""Test the MCP tool handlers without a real LLM."""
+
+import asyncio
+import json
+
+import pytest
+
+from claimification.mcp_servers import claim_extraction_server, entity_mapping_server
+from claimification.mcp_servers.job_limiter import JobLimiter
+from claimification.mcp_servers.pipeline_pool import PipelinePool
+from claimification.mcp_servers.progress import ProgressReporter
+
+
+@pytest.fixture
+def built_pipelines(monkeypatch, stub_pipeline):
+    """Make the claim server's pool build stub pipelines; returns their settings."""
+    built = []
+
+    def factory(**settings):
+        built.append(settings)
+        return stub_pipeline
+
+    monkeypatch.setattr(claim_extraction_server, "pipeline_pool", PipelinePool(factory))
+    return built
+
+
+def test_extract_claims_reuses_warm_pipeline(built_pipelines):
+    """Repeated tool calls with the same settings build one pipeline."""
+    for _ in range(3):
+        output = asyncio.run(claim_extraction_server.call_tool(
+            "extract_claims", {"text": "Paris is the capital of France."}))
+        assert "Paris is the capital of France." in output[0].text
+
+    assert len(built_pipelines) == 1
+    assert claim_extraction_server.pipeline_pool.hits == 2
+
+
+LONG_TEXT = " ".join(f"City number {i} has {i} parks." for i in range(40))
+
+
+def test_tool_calls_do_not_block_the_event_loop(built_pipelines, stub_pipeline):
+    """list_tools answers while an extraction is still running."""
+    async def scenario():
+        extraction = asyncio.create_task(claim_extraction_server.call_tool(
+            "extract_claims", {"text": LONG_TEXT}))
+        await asyncio.sleep(0)
+        tools = await claim_extraction_server.list_tools()
+        assert not extraction.done()
+        await extraction
+        return tools
+
+    assert asyncio.run(scenario())[0].name == "extract_claims"
+
+
+def test_excess_tool_calls_are_rejected(monkeypatch, built_pipelines):
+    """Calls beyond the in-flight and queue limits fail fast."""
+    monkeypatch.setattr(claim_extraction_server, "job_limiter",
+                        JobLimiter(max_in_flight=1, max_queued=1))
+
+    async def scenario():
+        return await asyncio.gather(*(
+            claim_extraction_server.call_tool("extract_claims", {"text": LONG_TEXT})
+            for _ in range(3)
+        ))
+
+    outputs = [output[0].text for output in asyncio.run(scenario())]
+
+    assert sum("Server busy" in text for text in outputs) == 1
+    assert sum("# Claim Extraction Results" in text for text in outputs) == 2
+
+
+def test_cancelled_tool_call_cancels_llm_calls(built_pipelines, stub_pipeline):
+    """Cancelling the request stops the outstanding agent calls."""
+    agent = stub_pipeline.selection_agent
+
+    async def scenario():
+        extraction = asyncio.create_task(claim_extraction_server.call_tool(
+            "extract_claims", {"text": LONG_TEXT}))
+        await asyncio.sleep(0.015)
+        extraction.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await extraction
+        calls = len(agent.calls)
+        await asyncio.sleep(0.05)
+        return calls
+
+    calls_at_cancel = asyncio.run(scenario())
+
+    assert agent.in_flight == 0
+    assert len(agent.calls) == calls_at_cancel < 40
+    assert claim_extraction_server.job_limiter.in_flight == 0
+
+
+class FakeSession:
+    """Records progress notifications instead of sending them."""
+
+    def __init__(self):
+        self.notifications = []
+
+    async def send_progress_notification(self, token, progress, total=None, message=None):
+        self.notifications.append((token, progress, total, message))
+
+
+def test_progress_notifications_per_sentence(monkeypatch, built_pipelines):
+    """Each finished sentence is reported, with its claims when streaming."""
+    session = FakeSession()
+    monkeypatch.setattr(ProgressReporter, "for_request",
+                        classmethod(lambda cls, server: cls(session, "token-1")))
+
+    asyncio.run(claim_extraction_server.call_tool("extract_claims", {
+        "text": "Paris is in France. Is it sunny? Berlin is in Germany.",
+        "stream_claims": True,
+    }))
+
+    assert [n[1] for n in session.notifications] == [1, 2, 3]
+    assert {n[0] for n in session.notifications} == {"token-1"}
+    assert all(n[2] == 3 for n in session.notifications)
+    messages = "\n".join(n[3] for n in session.notifications)
+    assert "- Paris is in France." in messages
+    assert "no_verifiable_claims" in messages
+
+
+def test_no_notifications_without_progress_token():
+    reporter = ProgressReporter(FakeSession(), None)
+
+    async def scenario():
+        async with reporter:
+            reporter.report(1, 2, "ignored")
+
+    asyncio.run(scenario())
+    assert reporter.session.notifications == []
+
+
+def test_claims_batch_returns_per_item_results(built_pipelines, stub_pipeline):
+    """Every text gets a compact result or its own error, in input order."""
+    output = asyncio.run(claim_extraction_server.call_tool("extract_claims_batch", {
+        "texts": ["Paris is in France.", "  ", "Is it sunny? Berlin is in Germany."],
+    }))
+    batch = json.loads(output[0].text)
+
+    assert (batch["documents"], batch["succeeded"], batch["failed"]) == (3, 2, 1)
+    assert [item["index"] for item in batch["results"]] == [0, 1, 2]
+    first = dict(batch["results"][0])
+    assert first.pop("usage")["total_tokens"] == 0
+    assert first == {"index": 0, "claims": ["Paris is in France."], "sentences": 1}
+    assert batch["usage"]["input_tokens"] == 0
+    assert batch["results"][1] == {"index": 1, "error": "Text cannot be empty"}
+    assert batch["results"][2]["claims"] == ["Berlin is in Germany."]
+    assert len(built_pipelines) == 1
+    assert claim_extraction_server.job_limiter.in_flight == 0
+
+
+def test_claims_batch_rejects_invalid_texts(built_pipelines):
+    for texts in (None, [], ["ok", 3]):
+        output = asyncio.run(claim_extraction_server.call_tool(
+            "extract_claims_batch", {"texts": texts}))
+        assert "error" in json.loads(output[0].text)
+
+
+def test_entities_batch_returns_compact_graphs(monkeypatch, stub_entity_pipeline):
+    monkeypatch.setattr(entity_mapping_server, "pipeline_pool",
+                        PipelinePool(lambda **settings: stub_entity_pipeline))
+
+    output = asyncio.run(entity_mapping_server.call_tool(
+        "extract_entities_and_relationships_batch",
+        {"texts": ["Paris is in France.", "Tokyo is in Japan."]}))
+    batch = json.loads(output[0].text)
+
+    assert batch["failed"] == 0
+    assert [[entity["text"] for entity in item["entities"]] for item in batch["results"]] == [
+        ["Paris", "France"], ["Tokyo", "Japan"]]
+    assert batch["results"][0]["entities"][0] == {"id": "e1", "text": "Paris", "type": "LOCATION"}
+    assert batch["results"][0]["relationships"] == []
@@ -0,0 +1,51 @@
+"""Test the MCP servers' warm pipeline pool."""
+
+import pytest
+
+from claimification.mcp_servers.pipeline_pool import PipelinePool
+
+
+class FakePipeline:
+    def __init__(self, **settings):
+        self.settings = settings
+
+
+def test_same_settings_reuse_one_pipeline():
+    pool = PipelinePool(FakePipeline)
+
+    first = pool.get(model="gpt-4o-mini", temperature=0.0)
+
+    assert pool.get(temperature=0.0, model="gpt-4o-mini") is first
+    assert pool.get(model="gpt-4o", temperature=0.0) is not first
+    assert (pool.hits, pool.misses) == (1, 2)
+
+
+def test_idle_pipelines_are_evicted():
+    pool = PipelinePool(FakePipeline, idle_timeout=0.0)
+    first = pool.get(model="gpt-4o-mini")
+
+    assert pool.evict_idle() == 1
+    assert pool.get(model="gpt-4o-mini") is not first
+
+
+def test_least_recently_used_is_evicted_beyond_max_size():
+    pool = PipelinePool(FakePipeline, max_size=2)
+    a = pool.get(model="a")
+    pool.get(model="b")
+    pool.get(model="a")
+    pool.get(model="c")
+
+    assert pool.stats()["size"] == 2
+    assert pool.get(model="a") is a
+    assert {entry["settings"]["model"] for entry in pool.stats()["entries"]} == {"a", "c"}
+
+
+def test_prewarm_failure_is_deferred_to_first_use():
+    def failing_factory(**settings):
+        raise ValueError("missing API key")
+
+    pool = PipelinePool(failing_factory)
+
+    assert pool.prewarm(model="gpt-4o-mini") is False
+    with pytest.raises(ValueError, match="missing API key"):
+        pool.get(model="gpt-4o-mini")
@@ -0,0 +1,98 @@
+"""Test the local prefilter stage."""
+
+import asyncio
+
+import pytest
+
+from claimification.claim_extraction.models import SentenceStatus
+from claimification.claim_extraction.stages.prefilter import (
+    PrefilterRule,
+    SentencePrefilter,
+)
+
+
+@pytest.mark.parametrize("sentence,rule", [
+    ("What is the capital of France?", "question"),
+    ("## Economic Overview", "markdown_header"),
+    ("- **Overview:**", "short_fragment"),
+    ("Let me know if you need anything else.", "boilerplate"),
+    ("---", "no_letters"),
+])
+def test_strict_prefilter_skips_obvious_non_claims(sentence, rule):
+    """Near-certain rules fire under the strict threshold."""
+    decision = SentencePrefilter("strict").check(sentence)
+
+    assert decision.skip
+    assert decision.rule == rule
+    assert decision.reason
+
+
+def test_header_glued_to_sentence_is_kept():
+    """A header merged with the following sentence is not skipped."""
+    assert not SentencePrefilter().check("# Report\nParis is in France.").skip
+
+
+@pytest.mark.parametrize("sentence", [
+    "Paris is the capital of France.",
+    "Inflation rose.",
+    "Consider that Argentina's inflation reached 25.5% monthly.",
+    "I think the GDP grew by 3% in 2023.",
+])
+def test_strict_prefilter_keeps_possible_claims(sentence):
+    """Factual or borderline sentences still go to the LLM under strict."""
+    assert not SentencePrefilter("strict").check(sentence).skip
+
+
+def test_lenient_prefilter_skips_imperatives_and_opinions():
+    """Lenient threshold also uses the lower-confidence rules."""
+    prefilter = SentencePrefilter("lenient")
+
+    assert prefilter.check("Consider diversifying your portfolio.").rule == "imperative"
+    assert prefilter.check("I think this is the best option.").rule == "opinion"
+
+
+@pytest.mark.parametrize("sentence", [
+    "Use of coal rose 20% in 2023.",
+    "Note sales rose 4% in Q3 per the filing.",
+    "Note that Paris is the capital of France.",
+    "Use of renewable energy expanded across Europe.",
+    "I think GDP grew 3% in 2022.",
+])
+def test_lenient_prefilter_keeps_claims_behind_imperative_or_opinion_openers(sentence):
+    """Verifiable statements that merely start like a command or opinion are kept."""
+    assert not SentencePrefilter("lenient").check(sentence).skip
+
+
+def test_custom_rules_and_invalid_threshold():
+    """Rules are pluggable and unknown thresholds are rejected."""
+    rule = PrefilterRule(
+        name="todo",
+        check=lambda s: s.startswith("TODO"),
+        reason="Sentence is a TODO note.",
+        confidence=1.0
+    )
+    assert SentencePrefilter(extra_rules=[rule]).check("TODO: fill in").rule == "todo"
+
+    with pytest.raises(ValueError, match="Unknown threshold"):
+        SentencePrefilter("loose")
+
+
+@pytest.mark.parametrize("scheduler,pack_size", [
+    ("depth_first", 1), ("depth_first", 3), ("wavefront", 1), ("wavefront", 3),
+])
+def test_pipeline_prefilter_skips_llm_calls(stub_pipeline, scheduler, pack_size):
+    """Prefiltered sentences never reach Selection and are counted."""
+    text = "# Report.\nParis is in France. Is it sunny? Berlin is in Germany. Thanks for asking."
+    stub_pipeline.prefilter = SentencePrefilter()
+    stub_pipeline.scheduler = scheduler
+    stub_pipeline.selection_pack_size = pack_size
+
+    result = asyncio.run(stub_pipeline.aextract_claims(text))
+
+    statuses = [r.status for r in result.sentence_results]
+    assert statuses.count(SentenceStatus.EXTRACTED) == 2
+    assert stub_pipeline.selection_agent.calls == ["Paris is in France.", "Berlin is in Germany."]
+    prefilter_stats = result.statistics["prefilter"]
+    assert prefilter_stats["sentences_skipped"] == 3
+    assert prefilter_stats["llm_calls_saved"] == 3
+    assert prefilter_stats["by_rule"] == {"markdown_header": 1, "question": 1, "boilerplate": 1}
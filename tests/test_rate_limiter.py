@@ -0,0 +1,81 @@
+"""Test the process-wide LLM rate limiter."""
+
+import asyncio
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from claimification.claim_extraction.stages import SelectionAgent
+from claimification.utils.rate_limiter import (
+    RateLimiter,
+    configure_rate_limit,
+    get_rate_limiter,
+    reset_rate_limiters
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_registry(monkeypatch):
+    """Start each test without configured limits."""
+    monkeypatch.delenv("CLAIMIFICATION_RATE_LIMIT_RPM", raising=False)
+    monkeypatch.delenv("CLAIMIFICATION_RATE_LIMIT_TPM", raising=False)
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
+
+
+def test_unconfigured_limiter_never_waits():
+    """Without a configured limit, acquire only counts requests."""
+    limiter = get_rate_limiter("openai", "gpt-4o")
+
+    assert [limiter.acquire(10_000) for _ in range(50)] == [0.0] * 50
+    assert limiter.stats()["requests"] == 50
+    assert limiter.throttled == 0
+
+
+def test_requests_per_minute_throttles_after_burst():
+    """The bucket allows a full burst, then makes callers wait."""
+    limiter = RateLimiter(requests_per_minute=600)
+
+    waits = [limiter._reserve(0) for _ in range(601)]
+
+    assert waits[:600] == [0.0] * 600
+    assert waits[600] == pytest.approx(0.1, abs=0.01)
+    assert limiter.throttled == 1
+    assert limiter.current_wait_seconds() > 0
+
+
+def test_tokens_per_minute_counts_request_size():
+    """Large requests exhaust the token bucket before the request bucket."""
+    limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=6000)
+
+    assert limiter._reserve(6000) == 0.0
+    assert limiter._reserve(600) == pytest.approx(6.0, abs=0.01)
+
+
+def test_limits_are_shared_per_provider_and_model():
+    """Callers of one model share a limiter; a provider-wide limit applies to all models."""
+    assert get_rate_limiter("openai", "gpt-4o") is get_rate_limiter("openai", "gpt-4o")
+
+    shared = configure_rate_limit("openai", requests_per_minute=60)
+    specific = configure_rate_limit("openai", "gpt-4o-mini", requests_per_minute=10)
+
+    assert get_rate_limiter("openai", "gpt-4o") is shared
+    assert get_rate_limiter("openai", "gpt-5-nano") is shared
+    assert get_rate_limiter("openai", "gpt-4o-mini") is specific
+    assert get_rate_limiter("anthropic", "claude-3-5-sonnet") is not shared
+
+
+def test_agents_acquire_before_each_call(monkeypatch):
+    """Sync, async and batch agent calls all go through the limiter."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    agent = SelectionAgent()
+    agent.structured_llm = RunnableLambda(
+        lambda _: {"has_verifiable_content": True, "reason": "ok"})
+    limiter = configure_rate_limit("openai", requests_per_minute=1000)
+
+    agent.process("One.", "")
+    asyncio.run(agent.aprocess("Two.", ""))
+    agent.process_batch([("Three.", ""), ("Four.", "")])
+
+    assert limiter.requests == 4
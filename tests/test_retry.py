@@ -0,0 +1,185 @@
+"""Test the retry policy, error classification and circuit breaker."""
+
+import asyncio
+import json
+from dataclasses import replace
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from claimification.claim_extraction.stages import SelectionAgent
+from claimification.utils.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ErrorKind,
+    RetryPolicy,
+    RetryState,
+    acall_with_retry,
+    call_with_retry,
+    classify_error,
+    reset_circuit_breakers,
+    retry_after_seconds
+)
+
+
+class _Response:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class APIStatusError(Exception):
+    """Mimics the provider SDKs' HTTP errors."""
+
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = _Response(status_code, headers)
+
+
+@pytest.fixture(autouse=True)
+def clean_breakers():
+    reset_circuit_breakers()
+    yield
+    reset_circuit_breakers()
+
+
+@pytest.mark.parametrize("error, kind", [
+    (APIStatusError(429), ErrorKind.RATE_LIMIT),
+    (APIStatusError(401), ErrorKind.AUTH),
+    (APIStatusError(503), ErrorKind.TRANSIENT),
+    (TimeoutError(), ErrorKind.TRANSIENT),
+    (json.JSONDecodeError("bad", "", 0), ErrorKind.SCHEMA),
+    (RuntimeError("boom"), ErrorKind.UNKNOWN),
+])
+def test_classify_error(error, kind):
+    assert classify_error(error) is kind
+
+
+def test_retry_after_header_is_honoured():
+    """A Retry-After longer than the backoff sets the delay."""
+    error = APIStatusError(429, {"retry-after": "7"})
+    policy = RetryPolicy(base_delay=0.1, jitter=False)
+
+    assert retry_after_seconds(error) == 7.0
+    assert policy.next_delay(error, RetryState()) == 7.0
+
+
+def test_backoff_grows_exponentially_with_bounded_jitter():
+    policy = RetryPolicy(max_attempts=10, base_delay=1.0, max_delay=4.0)
+    state = RetryState()
+
+    delays = [policy.next_delay(APIStatusError(503), state) for _ in range(4)]
+
+    for delay, full in zip(delays, [1.0, 2.0, 4.0, 4.0]):
+        assert full / 2 <= delay <= full
+
+
+def test_auth_errors_are_not_retried_and_schema_errors_retry_immediately():
+    policy = RetryPolicy(max_attempts=5, schema_retries=1)
+    state = RetryState()
+
+    assert policy.next_delay(APIStatusError(403), state) is None
+    assert policy.next_delay(json.JSONDecodeError("bad", "", 0), state) == 0.0
+    assert policy.next_delay(json.JSONDecodeError("bad", "", 0), state) is None
+
+
+def test_circuit_breaker_fails_fast_then_probes():
+    breaker = CircuitBreaker("openai", failure_threshold=2, reset_timeout=0.05)
+    calls = []
+
+    def failing():
+        calls.append(1)
+        raise APIStatusError(503)
+
+    policy = RetryPolicy(max_attempts=5, base_delay=0.0, jitter=False)
+    with pytest.raises(CircuitOpenError):
+        call_with_retry(failing, policy, breaker)
+    # The breaker opened after two failures instead of using all five attempts
+    assert len(calls) == 2
+    assert breaker.state == "open"
+
+    asyncio.run(asyncio.sleep(0.06))
+    assert call_with_retry(lambda: "ok", policy, breaker) == "ok"
+    assert breaker.state == "closed"
+
+
+def test_cancelled_probe_does_not_block_the_provider():
+    breaker = CircuitBreaker("openai", failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure(ErrorKind.TRANSIENT)
+    policy = RetryPolicy(max_attempts=1)
+
+    async def hanging():
+        await asyncio.sleep(10)
+
+    async def cancel_probe():
+        await asyncio.sleep(0.06)
+        probe = asyncio.ensure_future(acall_with_retry(hanging, policy, breaker))
+        await asyncio.sleep(0.01)
+        assert breaker.state == "half_open"
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+    asyncio.run(cancel_probe())
+    # The next call probes and closes the breaker
+    assert call_with_retry(lambda: "ok", policy, breaker) == "ok"
+    assert breaker.state == "closed"
+
+
+def test_stale_probe_expires():
+    breaker = CircuitBreaker("openai", failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure(ErrorKind.TRANSIENT)
+    asyncio.run(asyncio.sleep(0.06))
+    assert breaker.before_call() is True
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    # The probe's outcome never arrived
+    asyncio.run(asyncio.sleep(0.06))
+    assert breaker.before_call() is True
+
+
+def test_agent_records_retries_and_backoff(monkeypatch):
+    """Retry counts and backoff time are reported in StageResult metadata."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    agent = SelectionAgent()
+    agent.retry_policy = RetryPolicy(base_delay=0.01, jitter=False)
+    failures = [APIStatusError(429), APIStatusError(500)]
+
+    def respond(_):
+        if failures:
+            raise failures.pop(0)
+        return {"has_verifiable_content": True, "reason": "ok"}
+
+    agent.structured_llm = RunnableLambda(respond)
+    result = agent.process("Paris is in France.", "")
+
+    assert result.success
+    assert result.metadata == {"retries": 2, "backoff_seconds": 0.03}
+
+    def unauthorized(_):
+        raise APIStatusError(401)
+
+    agent.structured_llm = RunnableLambda(unauthorized)
+    failed = asyncio.run(agent.aprocess("Paris is in France.", ""))
+    assert not failed.success
+    assert failed.metadata["retries"] == 0
+
+
+def test_pipeline_sums_retry_metadata_per_sentence(stub_pipeline):
+    """Each sentence result reports the retries of all its stage calls."""
+    for agent in (stub_pipeline.selection_agent,
+                  stub_pipeline.disambiguation_agent,
+                  stub_pipeline.decomposition_agent):
+        def process(sentence, context, original=agent.process):
+            return replace(original(sentence, context),
+                           metadata={"retries": 1, "backoff_seconds": 0.5})
+        agent.process = process
+
+    result = stub_pipeline.extract_claims("Paris is in France. Is it sunny?")
+
+    extracted, question = result.sentence_results
+    assert extracted.metadata["retries"] == 3
+    assert extracted.metadata["backoff_seconds"] == 1.5
+    assert question.metadata["retries"] == 1
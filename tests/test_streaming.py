@@ -0,0 +1,101 @@
+"""Test the streaming claim extraction API."""
+
+import asyncio
+import io
+
+import pytest
+
+from claimification.claim_extraction.models import SentenceStatus
+
+
+TEXT = (
+    "Paris is the capital of France. Is it sunny today? "
+    "Berlin has 3.7 million residents. Tokyo hosted the 2020 Olympics. "
+    "What time is it? Mount Everest is 8849 meters tall."
+)
+
+
+def slow_first_sentence(agent):
+    """Make the agent answer the first sentence last."""
+    original = agent.aprocess
+
+    async def aprocess(sentence, context):
+        if sentence.startswith("Paris"):
+            await asyncio.sleep(0.05)
+        return await original(sentence, context)
+
+    agent.aprocess = aprocess
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_aiter_claims_yields_every_sentence(stub_pipeline, ordered):
+    slow_first_sentence(stub_pipeline.selection_agent)
+
+    async def scenario():
+        stream = stub_pipeline.aiter_claims(TEXT, ordered=ordered, keep_result=True)
+        seen = []
+        async for result in stream:
+            seen.append(result.sentence_id)
+            assert stream.statistics["completed"] >= len(seen)
+        return stream, seen
+
+    stream, seen = asyncio.run(scenario())
+
+    expected = [f"sent_{i:03d}" for i in range(6)]
+    if ordered:
+        assert seen == expected
+    else:
+        assert sorted(seen) == expected
+        assert seen[-1] == "sent_000"
+    assert stream.statistics["completed"] == stream.statistics["total_sentences"] == 6
+    assert stream.statistics["total_claims"] == 4
+    assert stream.statistics[SentenceStatus.NO_VERIFIABLE_CLAIMS.value] == 2
+    assert len(stream.result.sentence_results) == 6
+
+
+def test_iter_claims_from_sync_code(stub_pipeline):
+    stream = stub_pipeline.iter_claims(TEXT, keep_result=True)
+    claims = [claim.text for result in stream for claim in result.claims]
+
+    assert claims == [claim.text for claim in stream.result.get_all_claims()]
+    with pytest.raises(RuntimeError):
+        list(stream)
+
+
+def test_leaving_iter_claims_early_cancels_the_run(stub_pipeline):
+    text = " ".join(f"City {i} has {i + 2} parks." for i in range(40))
+
+    for result in stub_pipeline.iter_claims(text):
+        break
+
+    assert stub_pipeline.selection_agent.in_flight == 0
+    assert len(stub_pipeline.selection_agent.calls) < 40
+
+
+def test_streamed_source_keeps_no_results_by_default(stub_pipeline):
+    """Results of a file or iterable source are yielded while it is read."""
+    agent = stub_pipeline.selection_agent
+    calls_before_last_piece = []
+
+    def pieces():
+        for i in range(12):
+            if i == 11:
+                calls_before_last_piece.append(len(agent.calls))
+            yield f"City {i} has {i + 2} parks. "
+
+    stream = stub_pipeline.iter_claims(pieces())
+    seen = [result.sentence_id for result in stream]
+
+    assert calls_before_last_piece[0] > 0
+    assert seen == [f"sent_{i:03d}" for i in range(12)]
+    assert stream.result is None
+    assert stream.statistics["total_sentences"] == stream.statistics["total_claims"] == 12
+
+
+@pytest.mark.parametrize("scheduler", ["depth_first", "wavefront"])
+def test_streams_from_file_objects(stub_pipeline, scheduler):
+    stub_pipeline.scheduler = scheduler
+    stream = stub_pipeline.iter_claims(io.StringIO(TEXT), keep_result=True)
+
+    assert [r.sentence_id for r in stream] == [f"sent_{i:03d}" for i in range(6)]
+    assert len(stream.result.get_all_claims()) == 4
@@ -0,0 +1,92 @@
+"""Test per-stage timing and its aggregation."""
+
+import asyncio
+
+from claimification.utils.timing import (
+    call_timing,
+    record_call,
+    record_calls,
+    stage_statistics,
+    summarize_durations
+)
+
+
+TEXT = (
+    "Paris is the capital of France. Is it sunny today? "
+    "Berlin has 3.7 million residents."
+)
+
+
+def test_summarize_durations_uses_nearest_rank():
+    summary = summarize_durations(float(i) for i in range(1, 21))
+
+    assert summary == {"p50": 10.0, "p95": 19.0, "max": 20.0, "total": 210.0}
+    assert summarize_durations([]) == {"p50": None, "p95": None, "max": None, "total": 0.0}
+
+
+def test_stage_statistics_counts_retries_and_cache_hits():
+    stats = stage_statistics([
+        ("selection", call_timing(0.2, attempts=3, wait_seconds=0.5)),
+        ("selection", call_timing(0.0, attempts=0, cache_hit=True)),
+        ("decomposition", call_timing(0.4)),
+    ])
+
+    assert stats["selection"]["calls"] == 2
+    assert stats["selection"]["retries"] == 2
+    assert stats["selection"]["cache_hits"] == 1
+    assert stats["selection"]["wait_seconds"]["max"] == 0.5
+    assert stats["decomposition"]["seconds"]["p95"] == 0.4
+
+
+def test_record_calls_reports_to_every_enclosing_block():
+    with record_calls() as outer:
+        with record_calls() as inner:
+            record_call("entity_extraction", call_timing(0.1))
+        record_call("relationship_extraction", call_timing(0.2))
+    record_call("relationship_inference", call_timing(0.3))
+
+    assert [call["stage"] for call in inner] == ["entity_extraction"]
+    assert [call["stage"] for call in outer] == ["entity_extraction", "relationship_extraction"]
+
+
+def test_sentence_results_record_stage_timing(stub_pipeline):
+    for result in (stub_pipeline.extract_claims(TEXT),
+                   asyncio.run(stub_pipeline.aextract_claims(TEXT))):
+        extracted, question, _ = result.sentence_results
+        timing = extracted.metadata["timing"]
+
+        assert set(timing["stages"]) == {"selection", "disambiguation", "decomposition"}
+        assert timing["seconds"] >= round(
+            sum(call["seconds"] for call in timing["stages"].values()), 4)
+        assert timing["stages"]["selection"]["attempts"] == 1
+        assert set(question.metadata["timing"]["stages"]) == {"selection"}
+
+        stats = result.statistics["timing"]
+        assert stats["stages"]["selection"]["calls"] == 3
+        assert stats["stages"]["decomposition"]["calls"] == 2
+        assert stats["sentences"]["max"] >= stats["sentences"]["p50"]
+
+    # The async stubs take 10 ms per call
+    assert result.statistics["timing"]["stages"]["selection"]["seconds"]["p50"] >= 0.01
+
+
+def test_wavefront_records_queue_time(stub_pipeline):
+    stub_pipeline.scheduler = "wavefront"
+    stub_pipeline.stage_concurrency = {"selection": 1, "disambiguation": 1, "decomposition": 1}
+    result = stub_pipeline.extract_claims(TEXT)
+
+    # With one worker per stage, later sentences wait for earlier ones
+    assert result.statistics["timing"]["queue_seconds"]["max"] > 0
+    assert result.statistics["timing"]["stages"]["disambiguation"]["calls"] == 2
+
+
+def test_entity_graph_metadata_has_stage_timing(stub_entity_pipeline):
+    stub_entity_pipeline.max_chunk_chars = 40
+    text = "Paris is the capital of France. Berlin is the capital of Germany."
+    graph = asyncio.run(stub_entity_pipeline.aextract_knowledge_graph(text))
+
+    timing = graph.metadata.stage_timing
+    assert timing["entity_extraction"]["calls"] == 2
+    assert timing["entity_extraction"]["attempts"] == 2
+    assert timing["entity_extraction"]["seconds"]["p50"] >= 0.01
+    assert graph.metadata.total_time_seconds is not None
@@ -0,0 +1,120 @@
+"""Test token usage accounting and cost estimates."""
+
+import asyncio
+import json
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from claimification.claim_extraction.models import StageResult
+from claimification.claim_extraction.stages import SelectionAgent
+from claimification.utils.usage import (
+    configure_prices,
+    estimate_cost,
+    reset_prices,
+    sum_usage,
+    usage_statistics
+)
+from tests.conftest import StubAgent, default_selection
+
+
+USAGE = {
+    "input_tokens": 100,
+    "output_tokens": 40,
+    "total_tokens": 140,
+    "input_token_details": {"cache_read": 20},
+    "output_token_details": {"reasoning": 30},
+}
+
+
+@pytest.fixture
+def prices():
+    configure_prices({"gpt-5": {"input": 1.0, "output": 10.0, "cached_input": 0.1},
+                      "gpt-5-nano": {"input": 0.05, "output": 0.4}})
+    yield
+    reset_prices()
+
+
+def fake_llm(content: dict, output_model=dict):
+    """A structured LLM stand-in whose responses report USAGE."""
+    message = AIMessage(
+        content=json.dumps(content),
+        usage_metadata=USAGE,
+        response_metadata={"model_name": "gpt-5-nano"}
+    )
+    model = FakeMessagesListChatModel(responses=[message])
+    return model | RunnableLambda(lambda response: output_model(**json.loads(response.content)))
+
+
+def test_estimate_cost_uses_longest_prefix(prices):
+    usage = {"input_tokens": 1_000_000, "cached_input_tokens": 200_000, "output_tokens": 100_000}
+
+    assert estimate_cost("gpt-5-2025-08-07", usage) == pytest.approx(0.8 + 0.02 + 1.0)
+    assert estimate_cost("gpt-5-nano-2025-08-07", usage) == pytest.approx(0.05 + 0.04)
+    assert estimate_cost("claude-sonnet-4", usage) is None
+
+
+def test_agent_results_carry_token_usage(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    agent = SelectionAgent()
+    agent.structured_llm = fake_llm({"has_verifiable_content": True, "reason": "ok"})
+
+    single = agent.process("Paris is in France.", "")
+    batch = asyncio.run(agent.aprocess_batch([("A.", ""), ("B.", "")]))
+
+    assert single.usage == {
+        "input_tokens": 100,
+        "output_tokens": 40,
+        "reasoning_tokens": 30,
+        "cached_input_tokens": 20,
+        "total_tokens": 140,
+    }
+    assert [r.usage["total_tokens"] for r in batch] == [140, 140]
+
+
+def test_pipeline_aggregates_usage_per_sentence_and_stage(stub_pipeline, prices):
+    class UsageAgent(StubAgent):
+        def process(self, sentence, context):
+            result = super().process(sentence, context)
+            return StageResult(success=result.success, data=result.data, error=result.error,
+                               usage={"input_tokens": 10, "output_tokens": 5, "total_tokens": 15})
+
+    stub_pipeline.model = "gpt-5-nano"
+    stub_pipeline.selection_agent = UsageAgent(default_selection)
+    result = stub_pipeline.extract_claims("Paris is in France. Is it sunny today?")
+
+    first, second = result.sentence_results
+    assert first.metadata["usage"]["stages"]["selection"]["input_tokens"] == 10
+    assert second.metadata["usage"]["input_tokens"] == 10
+    usage = result.statistics["usage"]
+    assert usage["input_tokens"] == 20
+    assert usage["stages"]["selection"]["output_tokens"] == 10
+    assert usage["stages"]["decomposition"]["output_tokens"] == 0
+    assert usage["estimated_cost_usd"] == pytest.approx((20 * 0.05 + 10 * 0.4) / 1_000_000)
+
+
+def test_entity_graph_metadata_has_token_usage(stub_entity_pipeline):
+    from claimification.entity_mapping.stages.entity_extraction import EntityExtractionOutput
+
+    entities = {"entities": [{"text": "Paris", "type": "LOCATION"}]}
+    stub_entity_pipeline.stage1._build_chain = lambda prompts: (
+        RunnableLambda(lambda _: prompts["user"]) | fake_llm(entities, EntityExtractionOutput))
+
+    graph = stub_entity_pipeline.extract_knowledge_graph("Paris is lovely.")
+
+    usage = graph.metadata.token_usage
+    assert usage["stages"]["entity_extraction"]["reasoning_tokens"] == 30
+    assert usage["input_tokens"] == 100
+    assert "estimated_cost_usd" not in usage
+
+
+def test_sum_usage_adds_costs_when_present():
+    total = sum_usage([
+        usage_statistics([("selection", {"input_tokens": 5})]),
+        {"input_tokens": 7, "estimated_cost_usd": 0.25},
+    ])
+
+    assert total["input_tokens"] == 12
+    assert total["estimated_cost_usd"] == 0.25